@@ -40,3 +40,41 @@ def build_params(**kwargs: Any) -> dict[str, Any]:
                 params[key] = value
     return params
 
+
+
+class SSEDecoder:
+    """Incremental decoder of a server-sent event stream, fed one line at a time.
+
+    Comment lines (keep-alives) are skipped, multi-line data is joined with newlines.
+
+    Example:
+        >>> decoder = SSEDecoder()
+        >>> [decoder.feed(line) for line in ["event: done", "data: {}", ""]]
+        [None, None, ('done', '{}')]
+    """
+
+    def __init__(self) -> None:
+        self._event = "message"
+        self._data: list[str] = []
+
+    def feed(self, line: str) -> tuple[str, str] | None:
+        """Consume a line, return (event, data) when it completes an event."""
+        line = line.rstrip("\r\n")
+        if not line:
+            if not self._data:
+                self._event = "message"
+                return None
+            event = (self._event, "\n".join(self._data))
+            self._event = "message"
+            self._data = []
+            return event
+        if line.startswith(":"):
+            return None
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            self._event = value
+        elif field == "data":
+            self._data.append(value)
+        return None
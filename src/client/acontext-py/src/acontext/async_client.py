@@ -3,12 +3,13 @@ High-level asynchronous client for the Acontext API.
 """
 
 import os
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
 from typing import Any, BinaryIO
 
 import httpx
 
 from ._constants import DEFAULT_BASE_URL, DEFAULT_USER_AGENT
+from ._utils import SSEDecoder
 from .errors import APIError, TransportError
 from .messages import MessagePart as MessagePart
 from .uploads import FileUpload as FileUpload
@@ -170,6 +171,33 @@ class AcontextAsyncClient:
 
         return self._handle_response(response, unwrap=unwrap)
 
+    async def stream_events(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Yield the (event, data) pairs of a server-sent event response."""
+        try:
+            async with self._client.stream(
+                method,
+                path,
+                params=params,
+                headers={"Accept": "text/event-stream"},
+                timeout=self._timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._handle_response(response, unwrap=True)
+                decoder = SSEDecoder()
+                async for line in response.aiter_lines():
+                    event = decoder.feed(line)
+                    if event is not None:
+                        yield event
+        except httpx.HTTPError as exc:  # pragma: no cover - passthrough to caller
+            raise TransportError(str(exc)) from exc
+
     @staticmethod
     def _handle_response(response: httpx.Response, *, unwrap: bool) -> Any:
         content_type = response.headers.get("content-type", "")
@@ -3,12 +3,13 @@ High-level synchronous client for the Acontext API.
 """
 
 import os
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any, BinaryIO
 
 import httpx
 
 from ._constants import DEFAULT_BASE_URL, DEFAULT_USER_AGENT
+from ._utils import SSEDecoder
 from .errors import APIError, TransportError
 from .messages import MessagePart as MessagePart
 from .uploads import FileUpload as FileUpload
@@ -169,6 +170,33 @@ class AcontextClient:
 
         return self._handle_response(response, unwrap=unwrap)
 
+    def stream_events(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+    ) -> Iterator[tuple[str, str]]:
+        """Yield the (event, data) pairs of a server-sent event response."""
+        try:
+            with self._client.stream(
+                method,
+                path,
+                params=params,
+                headers={"Accept": "text/event-stream"},
+                timeout=self._timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    self._handle_response(response, unwrap=True)
+                decoder = SSEDecoder()
+                for line in response.iter_lines():
+                    event = decoder.feed(line)
+                    if event is not None:
+                        yield event
+        except httpx.HTTPError as exc:  # pragma: no cover - passthrough to caller
+            raise TransportError(str(exc)) from exc
+
     @staticmethod
     def _handle_response(response: httpx.Response, *, unwrap: bool) -> Any:
         content_type = response.headers.get("content-type", "")
@@ -2,7 +2,7 @@
 Common typing helpers used by resource modules to avoid circular imports.
 """
 
-from collections.abc import Awaitable, Mapping
+from collections.abc import AsyncIterator, Awaitable, Iterator, Mapping
 from typing import Any, BinaryIO, Protocol
 
 
@@ -20,6 +20,15 @@ class RequesterProtocol(Protocol):
     ) -> Any:
         ...
 
+    def stream_events(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+    ) -> Iterator[tuple[str, str]]:
+        ...
+
 
 class AsyncRequesterProtocol(Protocol):
     def request(
@@ -34,3 +43,12 @@ class AsyncRequesterProtocol(Protocol):
         unwrap: bool = True,
     ) -> Awaitable[Any]:
         ...
+
+    def stream_events(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+    ) -> AsyncIterator[tuple[str, str]]:
+        ...
@@ -2,17 +2,20 @@
 Spaces endpoints (async).
 """
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
 from typing import Any, List
 
 from .._utils import build_params
+from ..errors import APIError
 from ..client_types import AsyncRequesterProtocol
 from ..types.space import (
+    BatchSearchResult,
     ExperienceConfirmation,
     ListExperienceConfirmationsOutput,
     ListSpacesOutput,
     SearchResultBlockItem,
     Space,
+    SpaceSearchEvent,
     SpaceSearchResult,
 )
 
@@ -103,20 +106,28 @@ class AsyncSpacesAPI:
         mode: str | None = None,
         semantic_threshold: float | None = None,
         max_iterations: int | None = None,
+        max_latency_ms: int | None = None,
+        max_tokens: int | None = None,
+        fast_path_threshold: float | None = None,
     ) -> SpaceSearchResult:
         """Perform experience search within a space.
 
-        This is the most advanced search option that can operate in two modes:
+        This is the most advanced search option that can operate in three modes:
         - fast: Quick semantic search (default)
+        - hybrid: Semantic search fused with full-text search, better for exact names
         - agentic: Iterative search with AI-powered refinement
 
         Args:
             space_id: The UUID of the space.
             query: The search query string.
             limit: Maximum number of results to return (1-50, default 10).
-            mode: Search mode, either "fast" or "agentic" (default "fast").
+            mode: Search mode, "fast", "hybrid" or "agentic" (default "fast").
             semantic_threshold: Cosine distance threshold (0=identical, 2=opposite).
             max_iterations: Maximum iterations for agentic search (1-100, default 16).
+            max_latency_ms: Latency budget of agentic search in milliseconds.
+            max_tokens: LLM token budget of agentic search.
+            fast_path_threshold: Run a hybrid search first and skip the agent if it
+                finds blocks within this cosine distance (0-2).
 
         Returns:
             SpaceSearchResult containing cited blocks and optional final answer.
@@ -127,12 +138,64 @@ class AsyncSpacesAPI:
             mode=mode,
             semantic_threshold=semantic_threshold,
             max_iterations=max_iterations,
+            max_latency_ms=max_latency_ms,
+            max_tokens=max_tokens,
+            fast_path_threshold=fast_path_threshold,
         )
         data = await self._requester.request(
             "GET", f"/space/{space_id}/experience_search", params=params or None
         )
         return SpaceSearchResult.model_validate(data)
 
+    async def experience_search_stream(
+        self,
+        space_id: str,
+        *,
+        query: str,
+        limit: int | None = None,
+        max_iterations: int | None = None,
+        max_latency_ms: int | None = None,
+        max_tokens: int | None = None,
+        fast_path_threshold: float | None = None,
+    ) -> AsyncIterator[SpaceSearchEvent]:
+        """Perform agentic experience search, yielding its progress as it happens.
+
+        Events of type "block" carry each attached block as soon as the agent finds
+        it, "thinking" events carry its reasoning. The last event has type "done"
+        and carries the whole SpaceSearchResult.
+
+        Args:
+            space_id: The UUID of the space.
+            query: The search query string.
+            limit: Maximum number of results to return (1-50, default 10).
+            max_iterations: Maximum iterations for agentic search (1-100, default 16).
+            max_latency_ms: Latency budget of agentic search in milliseconds.
+            max_tokens: LLM token budget of agentic search.
+            fast_path_threshold: Run a hybrid search first and skip the agent if it
+                finds blocks within this cosine distance (0-2).
+
+        Yields:
+            SpaceSearchEvent objects, in the order the server sends them.
+
+        Raises:
+            APIError: If the search fails, including after the stream has started.
+        """
+        params = build_params(
+            query=query,
+            limit=limit,
+            max_iterations=max_iterations,
+            max_latency_ms=max_latency_ms,
+            max_tokens=max_tokens,
+            fast_path_threshold=fast_path_threshold,
+        )
+        async for _, data in self._requester.stream_events(
+            "GET", f"/space/{space_id}/experience_search/stream", params=params or None
+        ):
+            event = SpaceSearchEvent.model_validate_json(data)
+            if event.type == "error":
+                raise APIError(status_code=500, message=event.error)
+            yield event
+
     async def semantic_glob(
         self,
         space_id: str,
@@ -168,6 +231,7 @@ class AsyncSpacesAPI:
         query: str,
         limit: int | None = None,
         threshold: float | None = None,
+        mode: str | None = None,
     ) -> List[SearchResultBlockItem]:
         """Perform semantic grep search for content blocks.
 
@@ -179,16 +243,62 @@ class AsyncSpacesAPI:
             query: Search query for content blocks.
             limit: Maximum number of results to return (1-50, default 10).
             threshold: Cosine distance threshold (0=identical, 2=opposite).
+            mode: "fast" for semantic search, or "hybrid" to fuse it with
+                full-text search (default "fast").
 
         Returns:
             List of SearchResultBlockItem objects matching the query.
         """
-        params = build_params(query=query, limit=limit, threshold=threshold)
+        params = build_params(
+            query=query, limit=limit, threshold=threshold, mode=mode
+        )
         data = await self._requester.request(
             "GET", f"/space/{space_id}/semantic_grep", params=params or None
         )
         return [SearchResultBlockItem.model_validate(item) for item in data]
 
+    async def batch_search(
+        self,
+        space_id: str,
+        *,
+        queries: List[str],
+        target: str | None = None,
+        limit: int | None = None,
+        threshold: float | None = None,
+        dedupe: bool | None = None,
+    ) -> BatchSearchResult:
+        """Perform several semantic searches in one request.
+
+        All queries are embedded together and searched in a single round trip,
+        which is cheaper than calling semantic_grep or semantic_glob per query.
+
+        Args:
+            space_id: The UUID of the space.
+            queries: Search queries (1-32).
+            target: "content" to search content blocks or "path" to search
+                pages and folders (default "content").
+            limit: Maximum number of results per query (1-50, default 10).
+            threshold: Cosine distance threshold (0=identical, 2=opposite).
+            dedupe: If True, each block is only returned for the query it
+                matches best (default False).
+
+        Returns:
+            BatchSearchResult with one list of blocks per query, in query order.
+        """
+        payload: dict[str, Any] = {"queries": queries}
+        if target is not None:
+            payload["target"] = target
+        if limit is not None:
+            payload["limit"] = limit
+        if threshold is not None:
+            payload["threshold"] = threshold
+        if dedupe is not None:
+            payload["dedupe"] = dedupe
+        data = await self._requester.request(
+            "POST", f"/space/{space_id}/batch_search", json_data=payload
+        )
+        return BatchSearchResult.model_validate(data)
+
     async def get_unconfirmed_experiences(
         self,
         space_id: str,
@@ -134,7 +134,7 @@ class BlocksAPI:
             space_id: The UUID of the space.
             block_id: The UUID of the block to move.
             parent_id: Optional new parent block ID. Defaults to None.
-            sort: Optional new sort order. Defaults to None.
+            sort: Optional 0-based position among the siblings. Defaults to None.
             
         Raises:
             ValueError: If both parent_id and sort are None.
@@ -154,7 +154,7 @@ class BlocksAPI:
         Args:
             space_id: The UUID of the space.
             block_id: The UUID of the block.
-            sort: The new sort order.
+            sort: The new 0-based position among the siblings.
         """
         self._requester.request(
             "PUT",
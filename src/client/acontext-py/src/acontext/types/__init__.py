@@ -24,12 +24,15 @@ from .session import (
 )
 from .block import Block
 from .space import (
+    BatchSearchResult,
     ExperienceConfirmation,
     ListExperienceConfirmationsOutput,
     ListSpacesOutput,
     SearchResultBlockItem,
     Space,
+    SpaceSearchEvent,
     SpaceSearchResult,
+    SpaceSearchUsage,
 )
 from .tool import (
     FlagResponse,
@@ -60,12 +63,15 @@ __all__ = [
     "Task",
     "TokenCounts",
     # Space types
+    "BatchSearchResult",
     "ExperienceConfirmation",
     "ListExperienceConfirmationsOutput",
     "ListSpacesOutput",
     "SearchResultBlockItem",
     "Space",
+    "SpaceSearchEvent",
     "SpaceSearchResult",
+    "SpaceSearchUsage",
     # Block types
     "Block",
     # Tool types
@@ -1,6 +1,6 @@
 """Type definitions for space resources."""
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -37,6 +37,18 @@ class SearchResultBlockItem(BaseModel):
     )
 
 
+class SpaceSearchUsage(BaseModel):
+    """Budget spent by an agentic experience search."""
+
+    iterations: int = Field(0, description="LLM iterations run by the agent")
+    tokens: int = Field(0, description="LLM tokens spent")
+    elapsed_ms: int = Field(0, description="Wall-clock time of the search")
+    fast_path: bool = Field(
+        False, description="Answered by the vector search, the agent did not run"
+    )
+    stop_reason: str | None = Field(None, description="Why the search stopped")
+
+
 class SpaceSearchResult(BaseModel):
     """Experience search result model."""
 
@@ -44,6 +56,35 @@ class SpaceSearchResult(BaseModel):
         ..., description="List of cited blocks"
     )
     final_answer: str | None = Field(None, description="AI-generated final answer")
+    usage: SpaceSearchUsage | None = Field(
+        None, description="Budget spent, set for agentic search"
+    )
+
+
+class SpaceSearchEvent(BaseModel):
+    """Event of a streamed agentic experience search."""
+
+    type: Literal["block", "thinking", "done", "error"] = Field(
+        ..., description="Event type, 'done' and 'error' end the stream"
+    )
+    block: SearchResultBlockItem | None = Field(
+        None, description="Attached block, set for 'block' events"
+    )
+    thinking: str | None = Field(
+        None, description="Reported thought, set for 'thinking' events"
+    )
+    result: SpaceSearchResult | None = Field(
+        None, description="Whole search result, set for the 'done' event"
+    )
+    error: str | None = Field(None, description="Set for the 'error' event")
+
+
+class BatchSearchResult(BaseModel):
+    """Batch search result model."""
+
+    results: list[list[SearchResultBlockItem]] = Field(
+        ..., description="Matching blocks of each query, in the order of the queries"
+    )
 
 
 class ExperienceConfirmation(BaseModel):
@@ -886,3 +886,36 @@ async def test_async_spaces_confirm_experience_without_save(
     assert path == "/space/space-id/experience_confirmations/exp-1"
     assert kwargs["json_data"] == {"save": False}
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_async_spaces_experience_search_stream() -> None:
+    body = (
+        ": keep-alive\n\n"
+        "event: block\n"
+        'data: {"type": "block", "block": {"block_id": "block-1", "title": "JWT", '
+        '"type": "sop", "props": {}, "distance": null}}\n\n'
+        "event: done\n"
+        'data: {"type": "done", "result": {"cited_blocks": [], "final_answer": null}}\n\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/space/space-id/experience_search/stream"
+        return httpx.Response(
+            200, text=body, headers={"content-type": "text/event-stream"}
+        )
+
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.acontext.test/api/v1",
+    )
+    async with AcontextAsyncClient(api_key="token", client=http_client) as client:
+        events = [
+            event
+            async for event in client.spaces.experience_search_stream(
+                "space-id", query="auth", max_iterations=4
+            )
+        ]
+
+    assert [event.type for event in events] == ["block", "done"]
+    assert events[0].block.block_id == "block-1"
@@ -823,6 +823,44 @@ def test_spaces_experience_search_with_agentic_mode(
     assert result.final_answer is None
 
 
+@patch("acontext.client.AcontextClient.request")
+def test_spaces_experience_search_with_budget(
+    mock_request, client: AcontextClient
+) -> None:
+    mock_request.return_value = {
+        "cited_blocks": [],
+        "final_answer": None,
+        "usage": {
+            "iterations": 3,
+            "tokens": 2400,
+            "elapsed_ms": 1800,
+            "fast_path": False,
+            "stop_reason": "token_budget",
+        },
+    }
+
+    result = client.spaces.experience_search(
+        "space-id",
+        query="API security best practices",
+        mode="agentic",
+        max_latency_ms=2000,
+        max_tokens=2000,
+        fast_path_threshold=0.2,
+    )
+
+    args, kwargs = mock_request.call_args
+    assert kwargs["params"] == {
+        "query": "API security best practices",
+        "mode": "agentic",
+        "max_latency_ms": 2000,
+        "max_tokens": 2000,
+        "fast_path_threshold": 0.2,
+    }
+    assert result.usage is not None
+    assert result.usage.iterations == 3
+    assert result.usage.stop_reason == "token_budget"
+
+
 @patch("acontext.client.AcontextClient.request")
 def test_spaces_semantic_glob(mock_request, client: AcontextClient) -> None:
     mock_request.return_value = [
@@ -904,6 +942,46 @@ def test_spaces_semantic_grep(mock_request, client: AcontextClient) -> None:
     assert result[0].distance == 0.18
 
 
+@patch("acontext.client.AcontextClient.request")
+def test_spaces_batch_search(mock_request, client: AcontextClient) -> None:
+    mock_request.return_value = {
+        "results": [
+            [
+                {
+                    "block_id": "block-1",
+                    "title": "Token Validation Function",
+                    "type": "code_block",
+                    "props": {"language": "javascript"},
+                    "distance": 0.18,
+                },
+            ],
+            [],
+        ]
+    }
+
+    result = client.spaces.batch_search(
+        "space-id",
+        queries=["JWT token validation code", "refresh token rotation"],
+        limit=5,
+        dedupe=True,
+    )
+
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    method, path = args
+    assert method == "POST"
+    assert path == "/space/space-id/batch_search"
+    assert kwargs["json_data"] == {
+        "queries": ["JWT token validation code", "refresh token rotation"],
+        "limit": 5,
+        "dedupe": True,
+    }
+    # Verify response structure
+    assert len(result.results) == 2
+    assert result.results[0][0].title == "Token Validation Function"
+    assert result.results[1] == []
+
+
 @patch("acontext.client.AcontextClient.request")
 def test_spaces_get_unconfirmed_experiences(
     mock_request, client: AcontextClient
@@ -1023,3 +1101,55 @@ def test_spaces_confirm_experience_without_save(
     assert path == "/space/space-id/experience_confirmations/exp-1"
     assert kwargs["json_data"] == {"save": False}
     assert result is None
+
+
+SSE_BODY = (
+    ": keep-alive\n\n"
+    "event: thinking\n"
+    'data: {"type": "thinking", "thinking": "[navigation] check /auth"}\n\n'
+    "event: block\n"
+    'data: {"type": "block", "block": {"block_id": "block-1", "title": "JWT", '
+    '"type": "sop", "props": {}, "distance": null}}\n\n'
+    "event: done\n"
+    'data: {"type": "done", "result": {"cited_blocks": [], "final_answer": null}}\n\n'
+)
+
+
+def test_spaces_experience_search_stream() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/space/space-id/experience_search/stream"
+        assert request.url.params["query"] == "auth"
+        return httpx.Response(
+            200, text=SSE_BODY, headers={"content-type": "text/event-stream"}
+        )
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.acontext.test/api/v1",
+    )
+    client = AcontextClient(api_key="token", client=http_client)
+
+    events = list(client.spaces.experience_search_stream("space-id", query="auth"))
+
+    assert [event.type for event in events] == ["thinking", "block", "done"]
+    assert events[0].thinking == "[navigation] check /auth"
+    assert events[1].block.title == "JWT"
+    assert events[2].result.cited_blocks == []
+
+
+def test_spaces_experience_search_stream_raises_on_error_event() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            text='event: error\ndata: {"type": "error", "error": "llm failed"}\n\n',
+            headers={"content-type": "text/event-stream"},
+        )
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        base_url="https://api.acontext.test/api/v1",
+    )
+    client = AcontextClient(api_key="token", client=http_client)
+
+    with pytest.raises(APIError):
+        list(client.spaces.experience_search_stream("space-id", query="auth"))
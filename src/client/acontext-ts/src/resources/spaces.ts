@@ -5,6 +5,8 @@
 import { RequesterProtocol } from '../client-types';
 import { buildParams } from '../utils';
 import {
+  BatchSearchResult,
+  BatchSearchResultSchema,
   ExperienceConfirmation,
   ExperienceConfirmationSchema,
   ListExperienceConfirmationsOutput,
@@ -75,8 +77,9 @@ export class SpacesAPI {
   /**
    * Perform experience search within a space.
    * 
-   * This is the most advanced search option that can operate in two modes:
+   * This is the most advanced search option that can operate in three modes:
    * - fast: Quick semantic search (default)
+   * - hybrid: Semantic search fused with full-text search, better for exact names
    * - agentic: Iterative search with AI-powered refinement
    * 
    * @param spaceId - The UUID of the space
@@ -88,9 +91,12 @@ export class SpacesAPI {
     options: {
       query: string;
       limit?: number | null;
-      mode?: 'fast' | 'agentic' | null;
+      mode?: 'fast' | 'hybrid' | 'agentic' | null;
       semanticThreshold?: number | null;
       maxIterations?: number | null;
+      maxLatencyMs?: number | null;
+      maxTokens?: number | null;
+      fastPathThreshold?: number | null;
     }
   ): Promise<SpaceSearchResult> {
     const params = buildParams({
@@ -99,6 +105,9 @@ export class SpacesAPI {
       mode: options.mode ?? null,
       semantic_threshold: options.semanticThreshold ?? null,
       max_iterations: options.maxIterations ?? null,
+      max_latency_ms: options.maxLatencyMs ?? null,
+      max_tokens: options.maxTokens ?? null,
+      fast_path_threshold: options.fastPathThreshold ?? null,
     });
     const data = await this.requester.request(
       'GET',
@@ -157,12 +166,14 @@ export class SpacesAPI {
       query: string;
       limit?: number | null;
       threshold?: number | null;
+      mode?: 'fast' | 'hybrid' | null;
     }
   ): Promise<SearchResultBlockItem[]> {
     const params = buildParams({
       query: options.query,
       limit: options.limit ?? null,
       threshold: options.threshold ?? null,
+      mode: options.mode ?? null,
     });
     const data = await this.requester.request(
       'GET',
@@ -174,6 +185,48 @@ export class SpacesAPI {
     );
   }
 
+  /**
+   * Perform several semantic searches in one request.
+   * 
+   * All queries are embedded together and searched in a single round trip,
+   * which is cheaper than calling semanticGrep or semanticGlob per query.
+   * 
+   * @param spaceId - The UUID of the space
+   * @param options - Search options, `queries` takes 1-32 queries and `dedupe`
+   *   returns each block only for the query it matches best
+   * @returns BatchSearchResult with one list of blocks per query, in query order
+   */
+  async batchSearch(
+    spaceId: string,
+    options: {
+      queries: string[];
+      target?: 'content' | 'path' | null;
+      limit?: number | null;
+      threshold?: number | null;
+      dedupe?: boolean | null;
+    }
+  ): Promise<BatchSearchResult> {
+    const payload: Record<string, unknown> = { queries: options.queries };
+    if (options.target !== undefined && options.target !== null) {
+      payload.target = options.target;
+    }
+    if (options.limit !== undefined && options.limit !== null) {
+      payload.limit = options.limit;
+    }
+    if (options.threshold !== undefined && options.threshold !== null) {
+      payload.threshold = options.threshold;
+    }
+    if (options.dedupe !== undefined && options.dedupe !== null) {
+      payload.dedupe = options.dedupe;
+    }
+    const data = await this.requester.request(
+      'POST',
+      `/space/${spaceId}/batch_search`,
+      { jsonData: payload }
+    );
+    return BatchSearchResultSchema.parse(data);
+  }
+
   /**
    * Get all unconfirmed experiences in a space with cursor-based pagination.
    * 
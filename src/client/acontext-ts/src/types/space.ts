@@ -32,13 +32,30 @@ export const SearchResultBlockItemSchema = z.object({
 
 export type SearchResultBlockItem = z.infer<typeof SearchResultBlockItemSchema>;
 
+export const SpaceSearchUsageSchema = z.object({
+  iterations: z.number(),
+  tokens: z.number(),
+  elapsed_ms: z.number(),
+  fast_path: z.boolean(),
+  stop_reason: z.string().nullable().optional(),
+});
+
+export type SpaceSearchUsage = z.infer<typeof SpaceSearchUsageSchema>;
+
 export const SpaceSearchResultSchema = z.object({
   cited_blocks: z.array(SearchResultBlockItemSchema),
   final_answer: z.string().nullable().optional(),
+  usage: SpaceSearchUsageSchema.nullable().optional(),
 });
 
 export type SpaceSearchResult = z.infer<typeof SpaceSearchResultSchema>;
 
+export const BatchSearchResultSchema = z.object({
+  results: z.array(z.array(SearchResultBlockItemSchema)),
+});
+
+export type BatchSearchResult = z.infer<typeof BatchSearchResultSchema>;
+
 export const ExperienceConfirmationSchema = z.object({
   id: z.string(),
   space_id: z.string(),
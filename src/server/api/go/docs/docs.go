@@ -1977,7 +1977,7 @@ const docTemplate = `{
                         "BearerAuth": []
                     }
                 ],
-                "description": "Update block sort value (works for all block types: page, folder, text, sop, etc.)",
+                "description": "Move the block to position sort (0-based) among its siblings. Stored sort keys are spaced apart, so sort in responses is not a position (works for all block types: page, folder, text, sop, etc.)",
                 "consumes": [
                     "application/json"
                 ],
@@ -2037,6 +2037,78 @@ const docTemplate = `{
                 ]
             }
         },
+        "/space/{space_id}/batch_search": {
+            "post": {
+                "security": [
+                    {
+                        "BearerAuth": []
+                    }
+                ],
+                "description": "Run several semantic searches over the content or path blocks of a space in one request. Results are returned in the order of the queries",
+                "consumes": [
+                    "application/json"
+                ],
+                "produces": [
+                    "application/json"
+                ],
+                "tags": [
+                    "space"
+                ],
+                "summary": "Batch search",
+                "parameters": [
+                    {
+                        "type": "string",
+                        "format": "uuid",
+                        "example": "123e4567-e89b-12d3-a456-426614174000",
+                        "description": "Space ID",
+                        "name": "space_id",
+                        "in": "path",
+                        "required": true
+                    },
+                    {
+                        "description": "Queries (1-32), target (content or path, default content), limit per query (1-50, default 10), threshold and dedupe across queries",
+                        "name": "request",
+                        "in": "body",
+                        "required": true,
+                        "schema": {
+                            "$ref": "#/definitions/handler.BatchSearchReq"
+                        }
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "schema": {
+                            "allOf": [
+                                {
+                                    "$ref": "#/definitions/serializer.Response"
+                                },
+                                {
+                                    "type": "object",
+                                    "properties": {
+                                        "data": {
+                                            "$ref": "#/definitions/httpclient.BatchSearchResult"
+                                        }
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                },
+                "x-code-samples": [
+                    {
+                        "label": "Python",
+                        "lang": "python",
+                        "source": "from acontext import AcontextClient\n\nclient = AcontextClient(api_key='sk_project_token')\n\n# Batch search\nresult = client.spaces.batch_search(\n    space_id='space-uuid',\n    queries=['JWT token validation', 'refresh token rotation'],\n    limit=5,\n    dedupe=True\n)\nfor query_blocks in result.results:\n    print([block.title for block in query_blocks])\n"
+                    },
+                    {
+                        "label": "JavaScript",
+                        "lang": "javascript",
+                        "source": "import { AcontextClient } from '@acontext/acontext';\n\nconst client = new AcontextClient({ apiKey: 'sk_project_token' });\n\n// Batch search\nconst result = await client.spaces.batchSearch('space-uuid', {\n  queries: ['JWT token validation', 'refresh token rotation'],\n  limit: 5,\n  dedupe: true\n});\nfor (const queryBlocks of result.results) {\n  console.log(queryBlocks.map((block) => block.title));\n}\n"
+                    }
+                ]
+            }
+        },
         "/space/{space_id}/configs": {
             "get": {
                 "security": [
@@ -2364,7 +2436,7 @@ const docTemplate = `{
                     },
                     {
                         "type": "string",
-                        "description": "Search mode: fast or agentic (default fast)",
+                        "description": "Search mode: fast, hybrid or agentic (default fast)",
                         "name": "mode",
                         "in": "query"
                     },
@@ -2380,6 +2452,25 @@ const docTemplate = `{
                         "description": "Maximum number of iterations for agentic search (1-100, default 16)",
                         "name": "max_iterations",
                         "in": "query"
+                    },
+                    {
+                        "type": "integer",
+                        "description": "Latency budget of agentic search in milliseconds (1-600000, unlimited by default)",
+                        "name": "max_latency_ms",
+                        "in": "query"
+                    },
+                    {
+                        "type": "integer",
+                        "description": "LLM token budget of agentic search (unlimited by default)",
+                        "name": "max_tokens",
+                        "in": "query"
+                    },
+                    {
+                        "type": "number",
+                        "format": "float64",
+                        "description": "Run a hybrid search first and skip the agent if it finds blocks within this cosine distance (0-2)",
+                        "name": "fast_path_threshold",
+                        "in": "query"
                     }
                 ],
                 "responses": {
@@ -2416,6 +2507,90 @@ const docTemplate = `{
                 ]
             }
         },
+        "/space/{space_id}/experience_search/stream": {
+            "get": {
+                "security": [
+                    {
+                        "BearerAuth": []
+                    }
+                ],
+                "description": "Run an agentic experience search and stream its progress as server-sent events. 'block' events carry each attached block as soon as it is found, 'thinking' events the reasoning of the agent, and the stream ends with a 'done' event carrying the whole result or an 'error' event",
+                "consumes": [
+                    "application/json"
+                ],
+                "produces": [
+                    "text/event-stream"
+                ],
+                "tags": [
+                    "space"
+                ],
+                "summary": "Stream agentic experience search",
+                "parameters": [
+                    {
+                        "type": "string",
+                        "format": "uuid",
+                        "example": "123e4567-e89b-12d3-a456-426614174000",
+                        "description": "Space ID",
+                        "name": "space_id",
+                        "in": "path",
+                        "required": true
+                    },
+                    {
+                        "type": "string",
+                        "description": "Search query for page/folder titles",
+                        "name": "query",
+                        "in": "query",
+                        "required": true
+                    },
+                    {
+                        "type": "integer",
+                        "description": "Maximum number of results to return (1-50, default 10)",
+                        "name": "limit",
+                        "in": "query"
+                    },
+                    {
+                        "type": "integer",
+                        "description": "Maximum number of iterations for agentic search (1-100, default 16)",
+                        "name": "max_iterations",
+                        "in": "query"
+                    },
+                    {
+                        "type": "integer",
+                        "description": "Latency budget of agentic search in milliseconds (1-600000, unlimited by default)",
+                        "name": "max_latency_ms",
+                        "in": "query"
+                    },
+                    {
+                        "type": "integer",
+                        "description": "LLM token budget of agentic search (unlimited by default)",
+                        "name": "max_tokens",
+                        "in": "query"
+                    },
+                    {
+                        "type": "number",
+                        "format": "float64",
+                        "description": "Run a hybrid search first and skip the agent if it finds blocks within this cosine distance (0-2)",
+                        "name": "fast_path_threshold",
+                        "in": "query"
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Server-sent events",
+                        "schema": {
+                            "type": "string"
+                        }
+                    }
+                },
+                "x-code-samples": [
+                    {
+                        "label": "Python",
+                        "lang": "python",
+                        "source": "from acontext import AcontextAsyncClient\n\nclient = AcontextAsyncClient(api_key='sk_project_token')\n\n# Stream an agentic experience search\nasync for event in client.spaces.experience_search_stream(\n    space_id='space-uuid',\n    query='How to implement authentication?',\n    max_iterations=20\n):\n    if event.type == 'block':\n        print(f\"Found: {event.block.title}\")\n    elif event.type == 'done':\n        print(f\"{len(event.result.cited_blocks)} blocks cited\")\n"
+                    }
+                ]
+            }
+        },
         "/space/{space_id}/semantic_glob": {
             "get": {
                 "security": [
@@ -2549,6 +2724,12 @@ const docTemplate = `{
                         "description": "Cosine distance threshold (0=identical, 2=opposite)",
                         "name": "threshold",
                         "in": "query"
+                    },
+                    {
+                        "type": "string",
+                        "description": "Search mode: fast or hybrid (default fast)",
+                        "name": "mode",
+                        "in": "query"
                     }
                 ],
                 "responses": {
@@ -2719,6 +2900,42 @@ const docTemplate = `{
                 }
             }
         },
+        "handler.BatchSearchReq": {
+            "type": "object",
+            "required": [
+                "queries"
+            ],
+            "properties": {
+                "dedupe": {
+                    "type": "boolean"
+                },
+                "limit": {
+                    "type": "integer",
+                    "maximum": 50,
+                    "minimum": 1
+                },
+                "queries": {
+                    "type": "array",
+                    "maxItems": 32,
+                    "minItems": 1,
+                    "items": {
+                        "type": "string"
+                    }
+                },
+                "target": {
+                    "type": "string",
+                    "enum": [
+                        "content",
+                        "path"
+                    ]
+                },
+                "threshold": {
+                    "type": "number",
+                    "maximum": 2,
+                    "minimum": 0
+                }
+            }
+        },
         "handler.ConfirmExperienceReq": {
             "type": "object",
             "required": [
@@ -2826,6 +3043,7 @@ const docTemplate = `{
                     "type": "string"
                 },
                 "sort": {
+                    "description": "0-based position among the new siblings, appended when omitted",
                     "type": "integer"
                 }
             }
@@ -2927,6 +3145,7 @@ const docTemplate = `{
             "type": "object",
             "properties": {
                 "sort": {
+                    "description": "0-based position among the siblings, not the stored sort key",
                     "type": "integer"
                 }
             }
@@ -2952,6 +3171,20 @@ const docTemplate = `{
                 }
             }
         },
+        "httpclient.BatchSearchResult": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "$ref": "#/definitions/httpclient.SearchResultBlockItem"
+                        }
+                    }
+                }
+            }
+        },
         "httpclient.FlagResponse": {
             "type": "object",
             "properties": {
@@ -3011,6 +3244,29 @@ const docTemplate = `{
                     "items": {
                         "$ref": "#/definitions/httpclient.SearchResultBlockItem"
                     }
+                },
+                "usage": {
+                    "$ref": "#/definitions/httpclient.SpaceSearchUsage"
+                }
+            }
+        },
+        "httpclient.SpaceSearchUsage": {
+            "type": "object",
+            "properties": {
+                "elapsed_ms": {
+                    "type": "integer"
+                },
+                "fast_path": {
+                    "type": "boolean"
+                },
+                "iterations": {
+                    "type": "integer"
+                },
+                "stop_reason": {
+                    "type": "string"
+                },
+                "tokens": {
+                    "type": "integer"
                 }
             }
         },
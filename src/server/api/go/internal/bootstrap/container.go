@@ -171,7 +171,10 @@ func BuildContainer() *do.Injector {
 		), nil
 	})
 	do.Provide(inj, func(i *do.Injector) (service.BlockService, error) {
-		return service.NewBlockService(do.MustInvoke[repo.BlockRepo](i)), nil
+		return service.NewBlockService(
+			do.MustInvoke[repo.BlockRepo](i),
+			do.MustInvoke[*redis.Client](i),
+		), nil
 	})
 	do.Provide(inj, func(i *do.Injector) (service.DiskService, error) {
 		return service.NewDiskService(do.MustInvoke[repo.DiskRepo](i)), nil
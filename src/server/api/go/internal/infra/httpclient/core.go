@@ -46,9 +46,19 @@ type SearchResultBlockItem struct {
 	Distance *float64               `json:"distance"`
 }
 
+// SpaceSearchUsage represents the budget spent by an agentic search
+type SpaceSearchUsage struct {
+	Iterations int     `json:"iterations"`
+	Tokens     int     `json:"tokens"`
+	ElapsedMs  int     `json:"elapsed_ms"`
+	FastPath   bool    `json:"fast_path"`
+	StopReason *string `json:"stop_reason"`
+}
+
 // SpaceSearchResult represents the result of a space search
 type SpaceSearchResult struct {
 	CitedBlocks []SearchResultBlockItem `json:"cited_blocks"`
+	Usage       *SpaceSearchUsage       `json:"usage,omitempty"`
 }
 
 // SemanticGrepRequest represents the request for semantic grep
@@ -56,6 +66,7 @@ type SemanticGrepRequest struct {
 	Query     string   `json:"query"`
 	Limit     int      `json:"limit"`
 	Threshold *float64 `json:"threshold"`
+	Mode      string   `json:"mode"`
 }
 
 // SemanticGlobalRequest represents the request for semantic glob (glob)
@@ -72,6 +83,9 @@ type ExperienceSearchRequest struct {
 	Mode              string   `json:"mode"`
 	SemanticThreshold *float64 `json:"semantic_threshold"`
 	MaxIterations     int      `json:"max_iterations"`
+	MaxLatencyMs      *int     `json:"max_latency_ms"`
+	MaxTokens         *int     `json:"max_tokens"`
+	FastPathThreshold *float64 `json:"fast_path_threshold"`
 }
 
 // SemanticGrep calls the semantic_grep endpoint
@@ -85,6 +99,9 @@ func (c *CoreClient) SemanticGrep(ctx context.Context, projectID, spaceID uuid.U
 	if req.Threshold != nil {
 		params.Set("threshold", fmt.Sprintf("%f", *req.Threshold))
 	}
+	if req.Mode != "" {
+		params.Set("mode", req.Mode)
+	}
 
 	fullURL := fmt.Sprintf("%s?%s", endpoint, params.Encode())
 
@@ -183,6 +200,15 @@ func (c *CoreClient) ExperienceSearch(ctx context.Context, projectID, spaceID uu
 		params.Set("semantic_threshold", fmt.Sprintf("%f", *req.SemanticThreshold))
 	}
 	params.Set("max_iterations", fmt.Sprintf("%d", req.MaxIterations))
+	if req.MaxLatencyMs != nil {
+		params.Set("max_latency_ms", fmt.Sprintf("%d", *req.MaxLatencyMs))
+	}
+	if req.MaxTokens != nil {
+		params.Set("max_tokens", fmt.Sprintf("%d", *req.MaxTokens))
+	}
+	if req.FastPathThreshold != nil {
+		params.Set("fast_path_threshold", fmt.Sprintf("%f", *req.FastPathThreshold))
+	}
 
 	fullURL := fmt.Sprintf("%s?%s", endpoint, params.Encode())
 
@@ -220,6 +246,125 @@ func (c *CoreClient) ExperienceSearch(ctx context.Context, projectID, spaceID uu
 	return &result, nil
 }
 
+// ExperienceSearchStreamRequest represents the request for a streamed agentic experience search
+type ExperienceSearchStreamRequest struct {
+	Query             string   `json:"query"`
+	Limit             int      `json:"limit"`
+	MaxIterations     int      `json:"max_iterations"`
+	MaxLatencyMs      *int     `json:"max_latency_ms"`
+	MaxTokens         *int     `json:"max_tokens"`
+	FastPathThreshold *float64 `json:"fast_path_threshold"`
+}
+
+// ExperienceSearchStream calls the experience_search/stream endpoint and returns the
+// server-sent event stream. The caller must close it.
+func (c *CoreClient) ExperienceSearchStream(ctx context.Context, projectID, spaceID uuid.UUID, req ExperienceSearchStreamRequest) (io.ReadCloser, error) {
+	endpoint := fmt.Sprintf("%s/api/v1/project/%s/space/%s/experience_search/stream", c.BaseURL, projectID.String(), spaceID.String())
+
+	// Build query parameters
+	params := url.Values{}
+	params.Set("query", req.Query)
+	params.Set("limit", fmt.Sprintf("%d", req.Limit))
+	params.Set("max_iterations", fmt.Sprintf("%d", req.MaxIterations))
+	if req.MaxLatencyMs != nil {
+		params.Set("max_latency_ms", fmt.Sprintf("%d", *req.MaxLatencyMs))
+	}
+	if req.MaxTokens != nil {
+		params.Set("max_tokens", fmt.Sprintf("%d", *req.MaxTokens))
+	}
+	if req.FastPathThreshold != nil {
+		params.Set("fast_path_threshold", fmt.Sprintf("%f", *req.FastPathThreshold))
+	}
+
+	fullURL := fmt.Sprintf("%s?%s", endpoint, params.Encode())
+
+	httpReq, err := http.NewRequestWithContext(ctx, http.MethodGet, fullURL, nil)
+	if err != nil {
+		return nil, fmt.Errorf("create request: %w", err)
+	}
+	httpReq.Header.Set("Accept", "text/event-stream")
+
+	// Important: propagate trace context to downstream service
+	c.Propagator.Inject(ctx, propagation.HeaderCarrier(httpReq.Header))
+
+	// The stream outlives the client timeout, it ends with the request context
+	streamClient := &http.Client{Transport: c.HTTPClient.Transport}
+	resp, err := streamClient.Do(httpReq)
+	if err != nil {
+		return nil, fmt.Errorf("do request: %w", err)
+	}
+
+	if resp.StatusCode != http.StatusOK {
+		defer resp.Body.Close()
+		body, _ := io.ReadAll(resp.Body)
+		c.Logger.Error("experience_search stream request failed",
+			zap.Int("status_code", resp.StatusCode),
+			zap.String("body", string(body)))
+		return nil, fmt.Errorf("request failed with status %d: %s", resp.StatusCode, string(body))
+	}
+
+	return resp.Body, nil
+}
+
+// BatchSearchRequest represents the request for batch search
+type BatchSearchRequest struct {
+	Queries   []string `json:"queries"`
+	Target    string   `json:"target"`
+	Limit     int      `json:"limit"`
+	Threshold *float64 `json:"threshold"`
+	Dedupe    bool     `json:"dedupe"`
+}
+
+// BatchSearchResult represents the result of a batch search, one list of blocks per query
+type BatchSearchResult struct {
+	Results [][]SearchResultBlockItem `json:"results"`
+}
+
+// BatchSearch calls the batch_search endpoint
+func (c *CoreClient) BatchSearch(ctx context.Context, projectID, spaceID uuid.UUID, req BatchSearchRequest) (*BatchSearchResult, error) {
+	endpoint := fmt.Sprintf("%s/api/v1/project/%s/space/%s/batch_search", c.BaseURL, projectID.String(), spaceID.String())
+
+	// Marshal request body
+	body, err := sonic.Marshal(req)
+	if err != nil {
+		return nil, fmt.Errorf("marshal request: %w", err)
+	}
+
+	httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, endpoint, bytes.NewReader(body))
+	if err != nil {
+		return nil, fmt.Errorf("create request: %w", err)
+	}
+	httpReq.Header.Set("Content-Type", "application/json")
+
+	// Important: propagate trace context to downstream service
+	c.Propagator.Inject(ctx, propagation.HeaderCarrier(httpReq.Header))
+
+	resp, err := c.HTTPClient.Do(httpReq)
+	if err != nil {
+		return nil, fmt.Errorf("do request: %w", err)
+	}
+	defer resp.Body.Close()
+
+	respBody, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return nil, fmt.Errorf("read response body: %w", err)
+	}
+
+	if resp.StatusCode != http.StatusOK {
+		c.Logger.Error("batch_search request failed",
+			zap.Int("status_code", resp.StatusCode),
+			zap.String("body", string(respBody)))
+		return nil, fmt.Errorf("request failed with status %d: %s", resp.StatusCode, string(respBody))
+	}
+
+	var result BatchSearchResult
+	if err := sonic.Unmarshal(respBody, &result); err != nil {
+		return nil, fmt.Errorf("unmarshal response: %w", err)
+	}
+
+	return &result, nil
+}
+
 // InsertBlockRequest represents the request for inserting a block
 type InsertBlockRequest struct {
 	ParentID *uuid.UUID     `json:"parent_id,omitempty"`
@@ -298,7 +298,8 @@ func (h *BlockHandler) ListBlocks(c *gin.Context) {
 
 type MoveBlockReq struct {
 	ParentID *uuid.UUID `form:"parent_id" json:"parent_id"`
-	Sort     *int64     `form:"sort" json:"sort"`
+	// 0-based position among the new siblings, appended when omitted
+	Sort *int64 `form:"sort" json:"sort"`
 }
 
 // MoveBlock godoc
@@ -344,13 +345,14 @@ func (h *BlockHandler) MoveBlock(c *gin.Context) {
 }
 
 type UpdateBlockSortReq struct {
+	// 0-based position among the siblings, not the stored sort key
 	Sort int64 `form:"sort" json:"sort"`
 }
 
 // UpdateBlockSort godoc
 //
 //	@Summary		Update block sort
-//	@Description	Update block sort value (works for all block types: page, folder, text, sop, etc.)
+//	@Description	Move the block to position sort (0-based) among its siblings. Stored sort keys are spaced apart, so sort in responses is not a position (works for all block types: page, folder, text, sop, etc.)
 //	@Tags			block
 //	@Accept			json
 //	@Produce		json
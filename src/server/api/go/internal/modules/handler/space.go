@@ -1,6 +1,7 @@
 package handler
 
 import (
+	"bufio"
 	"errors"
 	"net/http"
 
@@ -216,9 +217,12 @@ func (h *SpaceHandler) GetConfigs(c *gin.Context) {
 type GetExperienceSearchReq struct {
 	Query             string   `form:"query" json:"query" binding:"required"`
 	Limit             int      `form:"limit,default=10" json:"limit" binding:"omitempty,min=1,max=50"`
-	Mode              string   `form:"mode,default=fast" json:"mode" binding:"omitempty,oneof=fast agentic"`
+	Mode              string   `form:"mode,default=fast" json:"mode" binding:"omitempty,oneof=fast hybrid agentic"`
 	SemanticThreshold *float64 `form:"semantic_threshold" json:"semantic_threshold" binding:"omitempty,min=0,max=2"`
 	MaxIterations     int      `form:"max_iterations,default=16" json:"max_iterations" binding:"omitempty,min=1,max=100"`
+	MaxLatencyMs      *int     `form:"max_latency_ms" json:"max_latency_ms" binding:"omitempty,min=1,max=600000"`
+	MaxTokens         *int     `form:"max_tokens" json:"max_tokens" binding:"omitempty,min=1"`
+	FastPathThreshold *float64 `form:"fast_path_threshold" json:"fast_path_threshold" binding:"omitempty,min=0,max=2"`
 }
 
 // GetExperienceSearch godoc
@@ -231,9 +235,12 @@ type GetExperienceSearchReq struct {
 //	@Param			space_id			path	string	true	"Space ID"	Format(uuid)	Example(123e4567-e89b-12d3-a456-426614174000)
 //	@Param			query				query	string	true	"Search query for page/folder titles"
 //	@Param			limit				query	int		false	"Maximum number of results to return (1-50, default 10)"
-//	@Param			mode				query	string	false	"Search mode: fast or agentic (default fast)"
+//	@Param			mode				query	string	false	"Search mode: fast, hybrid or agentic (default fast)"
 //	@Param			semantic_threshold	query	float64	false	"Cosine distance threshold (0=identical, 2=opposite)"
 //	@Param			max_iterations		query	int		false	"Maximum number of iterations for agentic search (1-100, default 16)"
+//	@Param			max_latency_ms		query	int		false	"Latency budget of agentic search in milliseconds (1-600000, unlimited by default)"
+//	@Param			max_tokens			query	int		false	"LLM token budget of agentic search (unlimited by default)"
+//	@Param			fast_path_threshold	query	float64	false	"Run a hybrid search first and skip the agent if it finds blocks within this cosine distance (0-2)"
 //	@Security		BearerAuth
 //	@Success		200	{object}	serializer.Response{data=httpclient.SpaceSearchResult}
 //	@Router			/space/{space_id}/experience_search [get]
@@ -268,6 +275,9 @@ func (h *SpaceHandler) GetExperienceSearch(c *gin.Context) {
 		Mode:              req.Mode,
 		SemanticThreshold: req.SemanticThreshold,
 		MaxIterations:     req.MaxIterations,
+		MaxLatencyMs:      req.MaxLatencyMs,
+		MaxTokens:         req.MaxTokens,
+		FastPathThreshold: req.FastPathThreshold,
 	})
 	if err != nil {
 		c.JSON(http.StatusInternalServerError, serializer.Err(http.StatusInternalServerError, "Failed to call core service", err))
@@ -277,6 +287,92 @@ func (h *SpaceHandler) GetExperienceSearch(c *gin.Context) {
 	c.JSON(http.StatusOK, serializer.Response{Data: result})
 }
 
+type GetExperienceSearchStreamReq struct {
+	Query             string   `form:"query" json:"query" binding:"required"`
+	Limit             int      `form:"limit,default=10" json:"limit" binding:"omitempty,min=1,max=50"`
+	MaxIterations     int      `form:"max_iterations,default=16" json:"max_iterations" binding:"omitempty,min=1,max=100"`
+	MaxLatencyMs      *int     `form:"max_latency_ms" json:"max_latency_ms" binding:"omitempty,min=1,max=600000"`
+	MaxTokens         *int     `form:"max_tokens" json:"max_tokens" binding:"omitempty,min=1"`
+	FastPathThreshold *float64 `form:"fast_path_threshold" json:"fast_path_threshold" binding:"omitempty,min=0,max=2"`
+}
+
+// GetExperienceSearchStream godoc
+//
+//	@Summary		Stream agentic experience search
+//	@Description	Run an agentic experience search and stream its progress as server-sent events. 'block' events carry each attached block as soon as it is found, 'thinking' events the reasoning of the agent, and the stream ends with a 'done' event carrying the whole result or an 'error' event
+//	@Tags			space
+//	@Accept			json
+//	@Produce		text/event-stream
+//	@Param			space_id			path	string	true	"Space ID"	Format(uuid)	Example(123e4567-e89b-12d3-a456-426614174000)
+//	@Param			query				query	string	true	"Search query for page/folder titles"
+//	@Param			limit				query	int		false	"Maximum number of results to return (1-50, default 10)"
+//	@Param			max_iterations		query	int		false	"Maximum number of iterations for agentic search (1-100, default 16)"
+//	@Param			max_latency_ms		query	int		false	"Latency budget of agentic search in milliseconds (1-600000, unlimited by default)"
+//	@Param			max_tokens			query	int		false	"LLM token budget of agentic search (unlimited by default)"
+//	@Param			fast_path_threshold	query	float64	false	"Run a hybrid search first and skip the agent if it finds blocks within this cosine distance (0-2)"
+//	@Security		BearerAuth
+//	@Success		200	{string}	string	"Server-sent events"
+//	@Router			/space/{space_id}/experience_search/stream [get]
+//	@x-code-samples	[{"lang":"python","source":"from acontext import AcontextAsyncClient\n\nclient = AcontextAsyncClient(api_key='sk_project_token')\n\n# Stream an agentic experience search\nasync for event in client.spaces.experience_search_stream(\n    space_id='space-uuid',\n    query='How to implement authentication?',\n    max_iterations=20\n):\n    if event.type == 'block':\n        print(f\"Found: {event.block.title}\")\n    elif event.type == 'done':\n        print(f\"{len(event.result.cited_blocks)} blocks cited\")\n","label":"Python"}]
+func (h *SpaceHandler) GetExperienceSearchStream(c *gin.Context) {
+	spaceID, err := uuid.Parse(c.Param("space_id"))
+	if err != nil {
+		c.JSON(http.StatusBadRequest, serializer.ParamErr("", err))
+		return
+	}
+
+	req := GetExperienceSearchStreamReq{
+		Limit:         10,
+		MaxIterations: 16,
+	}
+	if err := c.ShouldBindQuery(&req); err != nil {
+		c.JSON(http.StatusBadRequest, serializer.ParamErr("", err))
+		return
+	}
+
+	project, ok := c.MustGet("project").(*model.Project)
+	if !ok {
+		c.JSON(http.StatusBadRequest, serializer.ParamErr("", errors.New("project not found")))
+		return
+	}
+
+	// Call core service
+	stream, err := h.coreClient.ExperienceSearchStream(c.Request.Context(), project.ID, spaceID, httpclient.ExperienceSearchStreamRequest{
+		Query:             req.Query,
+		Limit:             req.Limit,
+		MaxIterations:     req.MaxIterations,
+		MaxLatencyMs:      req.MaxLatencyMs,
+		MaxTokens:         req.MaxTokens,
+		FastPathThreshold: req.FastPathThreshold,
+	})
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, serializer.Err(http.StatusInternalServerError, "Failed to call core service", err))
+		return
+	}
+	defer stream.Close()
+
+	c.Header("Content-Type", "text/event-stream")
+	c.Header("Cache-Control", "no-cache")
+	c.Header("Connection", "keep-alive")
+	c.Header("X-Accel-Buffering", "no")
+	c.Status(http.StatusOK)
+
+	// Relay line by line so every event reaches the client as soon as core sends it
+	reader := bufio.NewReader(stream)
+	for {
+		line, err := reader.ReadBytes('\n')
+		if len(line) > 0 {
+			if _, werr := c.Writer.Write(line); werr != nil {
+				return
+			}
+			c.Writer.Flush()
+		}
+		if err != nil {
+			return
+		}
+	}
+}
+
 type GetSemanticGlobalReq struct {
 	Query     string   `form:"query" json:"query" binding:"required"`
 	Limit     int      `form:"limit,default=10" json:"limit" binding:"omitempty,min=1,max=50"`
@@ -337,6 +433,7 @@ type GetSemanticGrepReq struct {
 	Query     string   `form:"query" json:"query" binding:"required"`
 	Limit     int      `form:"limit,default=10" json:"limit" binding:"omitempty,min=1,max=50"`
 	Threshold *float64 `form:"threshold" json:"threshold" binding:"omitempty,min=0,max=2"`
+	Mode      string   `form:"mode,default=fast" json:"mode" binding:"omitempty,oneof=fast hybrid"`
 }
 
 // GetSemanticGrep godoc
@@ -350,6 +447,7 @@ type GetSemanticGrepReq struct {
 //	@Param			query		query	string	true	"Search query for content blocks"
 //	@Param			limit		query	int		false	"Maximum number of results to return (1-50, default 10)"
 //	@Param			threshold	query	float64	false	"Cosine distance threshold (0=identical, 2=opposite)"
+//	@Param			mode		query	string	false	"Search mode: fast or hybrid (default fast)"
 //	@Security		BearerAuth
 //	@Success		200	{object}	serializer.Response{data=[]httpclient.SearchResultBlockItem}
 //	@Router			/space/{space_id}/semantic_grep [get]
@@ -363,6 +461,7 @@ func (h *SpaceHandler) GetSemanticGrep(c *gin.Context) {
 
 	req := GetSemanticGrepReq{
 		Limit: 10,
+		Mode:  "fast",
 	}
 	if err := c.ShouldBindQuery(&req); err != nil {
 		c.JSON(http.StatusBadRequest, serializer.ParamErr("", err))
@@ -380,6 +479,66 @@ func (h *SpaceHandler) GetSemanticGrep(c *gin.Context) {
 		Query:     req.Query,
 		Limit:     req.Limit,
 		Threshold: req.Threshold,
+		Mode:      req.Mode,
+	})
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, serializer.Err(http.StatusInternalServerError, "Failed to call core service", err))
+		return
+	}
+
+	c.JSON(http.StatusOK, serializer.Response{Data: result})
+}
+
+type BatchSearchReq struct {
+	Queries   []string `form:"queries" json:"queries" binding:"required,min=1,max=32,dive,required"`
+	Target    string   `form:"target,default=content" json:"target" binding:"omitempty,oneof=content path"`
+	Limit     int      `form:"limit,default=10" json:"limit" binding:"omitempty,min=1,max=50"`
+	Threshold *float64 `form:"threshold" json:"threshold" binding:"omitempty,min=0,max=2"`
+	Dedupe    bool     `form:"dedupe" json:"dedupe"`
+}
+
+// BatchSearch godoc
+//
+//	@Summary		Batch search
+//	@Description	Run several semantic searches over the content or path blocks of a space in one request. Results are returned in the order of the queries
+//	@Tags			space
+//	@Accept			json
+//	@Produce		json
+//	@Param			space_id	path	string			true	"Space ID"	Format(uuid)	Example(123e4567-e89b-12d3-a456-426614174000)
+//	@Param			request		body	BatchSearchReq	true	"Queries (1-32), target (content or path, default content), limit per query (1-50, default 10), threshold and dedupe across queries"
+//	@Security		BearerAuth
+//	@Success		200	{object}	serializer.Response{data=httpclient.BatchSearchResult}
+//	@Router			/space/{space_id}/batch_search [post]
+//	@x-code-samples	[{"lang":"python","source":"from acontext import AcontextClient\n\nclient = AcontextClient(api_key='sk_project_token')\n\n# Batch search\nresult = client.spaces.batch_search(\n    space_id='space-uuid',\n    queries=['JWT token validation', 'refresh token rotation'],\n    limit=5,\n    dedupe=True\n)\nfor query_blocks in result.results:\n    print([block.title for block in query_blocks])\n","label":"Python"},{"lang":"javascript","source":"import { AcontextClient } from '@acontext/acontext';\n\nconst client = new AcontextClient({ apiKey: 'sk_project_token' });\n\n// Batch search\nconst result = await client.spaces.batchSearch('space-uuid', {\n  queries: ['JWT token validation', 'refresh token rotation'],\n  limit: 5,\n  dedupe: true\n});\nfor (const queryBlocks of result.results) {\n  console.log(queryBlocks.map((block) => block.title));\n}\n","label":"JavaScript"}]
+func (h *SpaceHandler) BatchSearch(c *gin.Context) {
+	spaceID, err := uuid.Parse(c.Param("space_id"))
+	if err != nil {
+		c.JSON(http.StatusBadRequest, serializer.ParamErr("", err))
+		return
+	}
+
+	req := BatchSearchReq{
+		Target: "content",
+		Limit:  10,
+	}
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, serializer.ParamErr("", err))
+		return
+	}
+
+	project, ok := c.MustGet("project").(*model.Project)
+	if !ok {
+		c.JSON(http.StatusBadRequest, serializer.ParamErr("", errors.New("project not found")))
+		return
+	}
+
+	// Call core service
+	result, err := h.coreClient.BatchSearch(c.Request.Context(), project.ID, spaceID, httpclient.BatchSearchRequest{
+		Queries:   req.Queries,
+		Target:    req.Target,
+		Limit:     req.Limit,
+		Threshold: req.Threshold,
+		Dedupe:    req.Dedupe,
 	})
 	if err != nil {
 		c.JSON(http.StatusInternalServerError, serializer.Err(http.StatusInternalServerError, "Failed to call core service", err))
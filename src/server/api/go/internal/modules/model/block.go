@@ -84,6 +84,9 @@ type Block struct {
 	Sort       int64 `gorm:"not null;default:0;uniqueIndex:ux_blocks_space_parent_sort,priority:3" json:"sort"`
 	IsArchived bool  `gorm:"not null;default:false;index:idx_blocks_space_type_archived,priority:3;index" json:"is_archived"`
 
+	// set by the core while the embedding of a new block is queued
+	EmbeddingPending bool `gorm:"not null;default:false" json:"embedding_pending"`
+
 	Children  []*Block  `gorm:"foreignKey:ParentID;constraint:fk_blocks_children,OnUpdate:CASCADE,OnDelete:CASCADE;" json:"-"`
 	ToolSOPs  []ToolSOP `gorm:"foreignKey:SOPBlockID;constraint:OnDelete:CASCADE,OnUpdate:CASCADE;" json:"-"`
 	CreatedAt time.Time `gorm:"autoCreateTime;not null;default:CURRENT_TIMESTAMP" json:"created_at"`
@@ -28,6 +28,7 @@ type Message struct {
 	Meta datatypes.JSONType[map[string]any] `gorm:"type:jsonb;not null;default:'{}'" swaggertype:"object" json:"meta"`
 
 	PartsAssetMeta datatypes.JSONType[Asset] `gorm:"type:jsonb;not null" swaggertype:"-" json:"-"`
+	PartsInline    datatypes.JSON            `gorm:"type:jsonb" swaggertype:"-" json:"-"` // set instead of PartsAssetMeta for small parts
 	Parts          []Part                    `gorm:"-" swaggertype:"array,object" json:"parts"`
 
 	TaskID *uuid.UUID `gorm:"type:uuid;index" json:"task_id"`
@@ -2,6 +2,7 @@ package repo
 
 import (
 	"context"
+	"fmt"
 	"math"
 
 	"github.com/google/uuid"
@@ -86,12 +87,17 @@ func (r *blockRepo) ListBySpace(ctx context.Context, spaceID uuid.UUID, blockTyp
 	return list, nil
 }
 
-// NextSort returns max(sort)+1 within group (space_id, parent_id)
+// SortGap spaces the sort keys of siblings, as the core service does, so a block
+// can be placed between two siblings without renumbering the ones after it.
+// The API addresses siblings by position, positions are translated to keys here.
+const SortGap int64 = 1 << 16
+
+// NextSort returns max(sort)+SortGap within group (space_id, parent_id)
 func (r *blockRepo) NextSort(ctx context.Context, spaceID uuid.UUID, parentID *uuid.UUID) (int64, error) {
 	type result struct{ Next int64 }
 	var res result
 	query := r.buildGroupQuery(r.db.WithContext(ctx), spaceID, parentID).
-		Select("COALESCE(MAX(sort), -1) + 1 AS next")
+		Select("COALESCE(MAX(sort), 0) + ? AS next", SortGap)
 	if err := query.Take(&res).Error; err != nil {
 		return 0, err
 	}
@@ -108,7 +114,9 @@ func (r *blockRepo) MoveToParentAppend(ctx context.Context, id uuid.UUID, newPar
 
 		// Compute next sort in target group
 		var next int64
-		q := r.buildGroupQuery(tx, b.SpaceID, newParentID).Select("COALESCE(MAX(sort), -1) + 1")
+		q := r.buildGroupQuery(tx, b.SpaceID, newParentID).
+			Where("id <> ?", id).
+			Select("COALESCE(MAX(sort), 0) + ?", SortGap)
 		if err := q.Take(&next).Error; err != nil {
 			return err
 		}
@@ -121,7 +129,7 @@ func (r *blockRepo) MoveToParentAppend(ctx context.Context, id uuid.UUID, newPar
 	})
 }
 
-// ReorderWithinGroup safely reorders an item to newSort within its current (space_id, parent_id) group.
+// ReorderWithinGroup moves an item to position newSort (0-based) within its current (space_id, parent_id) group.
 func (r *blockRepo) ReorderWithinGroup(ctx context.Context, id uuid.UUID, newSort int64) error {
 	return r.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
 		var b model.Block
@@ -132,7 +140,7 @@ func (r *blockRepo) ReorderWithinGroup(ctx context.Context, id uuid.UUID, newSor
 	})
 }
 
-// MoveToParentAtSort moves a block to a specific position in the target parent group.
+// MoveToParentAtSort moves a block to position targetSort (0-based) in the target parent group.
 func (r *blockRepo) MoveToParentAtSort(ctx context.Context, id uuid.UUID, newParentID *uuid.UUID, targetSort int64) error {
 	return r.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
 		// Lock and load current block
@@ -155,79 +163,97 @@ func (r *blockRepo) MoveToParentAtSort(ctx context.Context, id uuid.UUID, newPar
 	})
 }
 
-// reorderInTransaction reorders a block within its current parent group
-func (r *blockRepo) reorderInTransaction(tx *gorm.DB, b *model.Block, targetSort int64) error {
-	if targetSort < 0 {
-		targetSort = 0
-	}
-	if targetSort == b.Sort {
-		return nil
-	}
-
-	// Set sentinel value to avoid conflicts
-	if err := tx.Model(&model.Block{}).Where(&model.Block{ID: b.ID}).Update("sort", math.MinInt64).Error; err != nil {
+// reorderInTransaction moves a block to a position within its current parent group
+func (r *blockRepo) reorderInTransaction(tx *gorm.DB, b *model.Block, position int64) error {
+	sort, err := r.sortAtPosition(tx, b.SpaceID, b.ParentID, b.ID, position)
+	if err != nil {
 		return err
 	}
-
-	// Build group query
-	group := r.buildGroupQuery(tx, b.SpaceID, b.ParentID)
-
-	// Shift items based on direction
-	if targetSort < b.Sort {
-		// Moving up: shift items down
-		if err := group.Where("sort >= ? AND sort < ?", targetSort, b.Sort).Update("sort", gorm.Expr("sort + 1")).Error; err != nil {
-			return err
-		}
-	} else {
-		// Moving down: shift items up
-		if err := group.Where("sort <= ? AND sort > ?", targetSort, b.Sort).Update("sort", gorm.Expr("sort - 1")).Error; err != nil {
-			return err
-		}
-	}
-
-	// Set final position
-	return tx.Model(&model.Block{}).Where(&model.Block{ID: b.ID}).Update("sort", targetSort).Error
+	return tx.Model(&model.Block{}).Where(&model.Block{ID: b.ID}).Update("sort", sort).Error
 }
 
 // moveToNewParentInTransaction moves a block to a new parent group at a specific position
-func (r *blockRepo) moveToNewParentInTransaction(tx *gorm.DB, b *model.Block, id uuid.UUID, newParentID *uuid.UUID, targetSort int64) error {
-	// Get max sort in target group to normalize targetSort
-	var maxSort int64
-	q := r.buildGroupQuery(tx, b.SpaceID, newParentID).Select("COALESCE(MAX(sort), -1)")
-	if err := q.Take(&maxSort).Error; err != nil {
+func (r *blockRepo) moveToNewParentInTransaction(tx *gorm.DB, b *model.Block, id uuid.UUID, newParentID *uuid.UUID, position int64) error {
+	// The old group keeps its gaps, only the target group gets a new key
+	sort, err := r.sortAtPosition(tx, b.SpaceID, newParentID, id, position)
+	if err != nil {
 		return err
 	}
+	return tx.Model(&model.Block{}).Where(&model.Block{ID: id}).Updates(map[string]any{
+		"parent_id": newParentID,
+		"sort":      sort,
+	}).Error
+}
 
-	// Normalize targetSort
-	if targetSort < 0 {
-		targetSort = 0
-	}
-	if targetSort > maxSort+1 {
-		targetSort = maxSort + 1
+// sortAtPosition finds a sort key that places block id at position (0-based) among the
+// other blocks of the group, without touching them. Positions past the end append.
+// The group is rebalanced once the gap between the two neighbours is exhausted.
+func (r *blockRepo) sortAtPosition(tx *gorm.DB, spaceID uuid.UUID, parentID *uuid.UUID, id uuid.UUID, position int64) (int64, error) {
+	if position < 0 {
+		position = 0
 	}
-
-	// Set sentinel value to avoid conflicts
-	if err := tx.Model(&model.Block{}).Where(&model.Block{ID: id}).Update("sort", math.MinInt64).Error; err != nil {
-		return err
+	// Park the block so its own key neither counts as a neighbour nor collides
+	if err := tx.Model(&model.Block{}).Where(&model.Block{ID: id}).Update("sort", int64(math.MinInt64)).Error; err != nil {
+		return 0, err
 	}
-
-	// Close gap in old group
-	oldGroup := r.buildGroupQuery(tx, b.SpaceID, b.ParentID)
-	if err := oldGroup.Where("sort > ?", b.Sort).Update("sort", gorm.Expr("sort - 1")).Error; err != nil {
-		return err
+	for attempt := 0; attempt < 2; attempt++ {
+		limit := 2
+		if position == 0 {
+			limit = 1
+		}
+		var sorts []int64
+		err := r.buildGroupQuery(tx, spaceID, parentID).
+			Where("id <> ?", id).
+			Order("sort ASC").
+			Offset(int(max(position-1, 0))).
+			Limit(limit).
+			Pluck("sort", &sorts).Error
+		if err != nil {
+			return 0, err
+		}
+		if position == 0 {
+			sorts = append([]int64{0}, sorts...)
+		}
+		switch {
+		case len(sorts) == 0:
+			// past the end of the group
+			var last int64
+			q := r.buildGroupQuery(tx, spaceID, parentID).
+				Where("id <> ?", id).
+				Select("COALESCE(MAX(sort), 0)")
+			if err := q.Take(&last).Error; err != nil {
+				return 0, err
+			}
+			return last + SortGap, nil
+		case len(sorts) == 1:
+			return sorts[0] + SortGap, nil
+		case sorts[1]-sorts[0] > 1:
+			return sorts[0] + (sorts[1]-sorts[0])/2, nil
+		}
+		if err := r.rebalanceGroup(tx, spaceID, parentID, id); err != nil {
+			return 0, err
+		}
 	}
+	return 0, fmt.Errorf("failed to find a sort at position %d", position)
+}
 
-	// Make space in target group
-	newGroup := r.buildGroupQuery(tx, b.SpaceID, newParentID)
-	if err := newGroup.Where("sort >= ?", targetSort).Update("sort", gorm.Expr("sort + 1")).Error; err != nil {
+// rebalanceGroup spreads the sorts of a group SortGap apart again, keeping their order.
+// Block id, parked on a sentinel sort, is left out.
+func (r *blockRepo) rebalanceGroup(tx *gorm.DB, spaceID uuid.UUID, parentID *uuid.UUID, id uuid.UUID) error {
+	// Park the siblings on negative sorts first, so no two of them share a sort
+	// while they are renumbered under ux_blocks_space_parent_sort
+	ranked := r.buildGroupQuery(tx, spaceID, parentID).
+		Where("id <> ?", id).
+		Select("id, ROW_NUMBER() OVER (ORDER BY sort) AS position")
+	if err := tx.Exec(
+		"UPDATE blocks SET sort = -ranked.position FROM (?) AS ranked WHERE blocks.id = ranked.id",
+		ranked,
+	).Error; err != nil {
 		return err
 	}
-
-	// Move to new position
-	return tx.Model(&model.Block{}).Where(&model.Block{ID: id}).Updates(map[string]any{
-		"parent_id": newParentID,
-		"sort":      targetSort,
-	}).Error
+	return r.buildGroupQuery(tx, spaceID, parentID).
+		Where("id <> ? AND sort < 0", id).
+		Update("sort", gorm.Expr("-sort * ?", SortGap)).Error
 }
 
 // buildGroupQuery builds a query for blocks in the same group (same space_id and parent_id)
@@ -410,6 +410,69 @@ func TestBlockRepo_GetNonSOPBlock(t *testing.T) {
 	}
 }
 
+// TestBlockRepo_SortPositions tests that API positions are translated to gapped sort keys
+func TestBlockRepo_SortPositions(t *testing.T) {
+	db := setupTestDB(t)
+	if db == nil {
+		return // Test was skipped
+	}
+	repo := NewBlockRepo(db)
+	ctx := context.Background()
+
+	project := &model.Project{
+		ID:               uuid.New(),
+		SecretKeyHMAC:    "test_hmac",
+		SecretKeyHashPHC: "test_hash",
+	}
+	require.NoError(t, db.Create(project).Error)
+	defer cleanupTestDB(t, db, project.ID)
+
+	space := &model.Space{
+		ID:        uuid.New(),
+		ProjectID: project.ID,
+	}
+	require.NoError(t, db.Create(space).Error)
+
+	titles := func(parentID *uuid.UUID) []string {
+		list, err := repo.ListBySpace(ctx, space.ID, model.BlockTypePage, parentID)
+		require.NoError(t, err)
+		out := make([]string, len(list))
+		for i, b := range list {
+			out[i] = b.Title
+		}
+		return out
+	}
+
+	// Append three pages at the root
+	pages := make([]*model.Block, 3)
+	for i, title := range []string{"A", "B", "C"} {
+		next, err := repo.NextSort(ctx, space.ID, nil)
+		require.NoError(t, err)
+		assert.Equal(t, int64(i+1)*SortGap, next)
+		pages[i] = &model.Block{ID: uuid.New(), SpaceID: space.ID, Type: model.BlockTypePage, Title: title, Sort: next}
+		require.NoError(t, repo.Create(ctx, pages[i]))
+	}
+
+	// Move C to position 0, then A to the end
+	require.NoError(t, repo.ReorderWithinGroup(ctx, pages[2].ID, 0))
+	assert.Equal(t, []string{"C", "A", "B"}, titles(nil))
+	require.NoError(t, repo.ReorderWithinGroup(ctx, pages[0].ID, 10))
+	assert.Equal(t, []string{"C", "B", "A"}, titles(nil))
+
+	// Positions keep working once the gap between two siblings is exhausted
+	for i := 0; i < 20; i++ {
+		require.NoError(t, repo.ReorderWithinGroup(ctx, pages[i%3].ID, 1))
+	}
+	assert.Len(t, titles(nil), 3)
+
+	// Moving to a folder places the block at the position among the new siblings
+	folder := &model.Block{ID: uuid.New(), SpaceID: space.ID, Type: model.BlockTypeFolder, Title: "F", Sort: 4 * SortGap}
+	require.NoError(t, repo.Create(ctx, folder))
+	require.NoError(t, repo.MoveToParentAppend(ctx, pages[0].ID, &folder.ID))
+	require.NoError(t, repo.MoveToParentAtSort(ctx, pages[1].ID, &folder.ID, 0))
+	assert.Equal(t, []string{"B", "A"}, titles(&folder.ID))
+}
+
 // Helper function to create string pointers
 func strPtr(s string) *string {
 	return &s
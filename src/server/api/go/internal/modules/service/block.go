@@ -7,6 +7,7 @@ import (
 	"github.com/google/uuid"
 	"github.com/memodb-io/Acontext/internal/modules/model"
 	"github.com/memodb-io/Acontext/internal/modules/repo"
+	"github.com/redis/go-redis/v9"
 )
 
 type BlockService interface {
@@ -30,9 +31,36 @@ type BlockService interface {
 	UpdateSort(ctx context.Context, blockID uuid.UUID, sort int64) error
 }
 
-type blockService struct{ r repo.BlockRepo }
+type blockService struct {
+	r     repo.BlockRepo
+	redis *redis.Client
+}
+
+// Redis key prefix of the space version, the core service caches space trees per version
+const redisKeyPrefixSpaceVersion = "space.version."
 
-func NewBlockService(r repo.BlockRepo) BlockService { return &blockService{r: r} }
+func NewBlockService(r repo.BlockRepo, redis *redis.Client) BlockService {
+	return &blockService{r: r, redis: redis}
+}
+
+// bumpSpaceVersion invalidates the cached trees of a space after a block write.
+// A failed bump is not fatal, the write itself has succeeded.
+func (s *blockService) bumpSpaceVersion(ctx context.Context, spaceID uuid.UUID) {
+	if s.redis == nil {
+		return
+	}
+	_ = s.redis.Incr(ctx, redisKeyPrefixSpaceVersion+spaceID.String()).Err()
+}
+
+// bumpSpaceVersionOfBlock bumps the version of the space a block belongs to
+func (s *blockService) bumpSpaceVersionOfBlock(ctx context.Context, blockID uuid.UUID) {
+	if s.redis == nil {
+		return
+	}
+	if b, err := s.r.Get(ctx, blockID); err == nil {
+		s.bumpSpaceVersion(ctx, b.SpaceID)
+	}
+}
 
 // validateAndPrepareCreate validates a block for creation and prepares its parent
 func (s *blockService) validateAndPrepareCreate(ctx context.Context, b *model.Block) (*model.Block, error) {
@@ -96,7 +124,11 @@ func (s *blockService) Create(ctx context.Context, b *model.Block) error {
 		return err
 	}
 
-	return s.r.Create(ctx, b)
+	if err := s.r.Create(ctx, b); err != nil {
+		return err
+	}
+	s.bumpSpaceVersion(ctx, b.SpaceID)
+	return nil
 }
 
 // isDescendant checks if candidateID is a descendant of ancestorID in the tree
@@ -180,7 +212,11 @@ func (s *blockService) Delete(ctx context.Context, spaceID uuid.UUID, blockID uu
 	if len(blockID) == 0 {
 		return errors.New("block id is empty")
 	}
-	return s.r.Delete(ctx, spaceID, blockID)
+	if err := s.r.Delete(ctx, spaceID, blockID); err != nil {
+		return err
+	}
+	s.bumpSpaceVersion(ctx, spaceID)
+	return nil
 }
 
 // GetBlockProperties - unified get properties method
@@ -196,7 +232,11 @@ func (s *blockService) UpdateBlockProperties(ctx context.Context, b *model.Block
 	if len(b.ID) == 0 {
 		return errors.New("block id is empty")
 	}
-	return s.r.Update(ctx, b)
+	if err := s.r.Update(ctx, b); err != nil {
+		return err
+	}
+	s.bumpSpaceVersionOfBlock(ctx, b.ID)
+	return nil
 }
 
 // List - unified list method with optional type and parent_id filters
@@ -232,9 +272,15 @@ func (s *blockService) Move(ctx context.Context, blockID uuid.UUID, newParentID
 	}
 
 	if targetSort == nil {
-		return s.r.MoveToParentAppend(ctx, blockID, newParentID)
+		err = s.r.MoveToParentAppend(ctx, blockID, newParentID)
+	} else {
+		err = s.r.MoveToParentAtSort(ctx, blockID, newParentID, *targetSort)
 	}
-	return s.r.MoveToParentAtSort(ctx, blockID, newParentID, *targetSort)
+	if err != nil {
+		return err
+	}
+	s.bumpSpaceVersion(ctx, block.SpaceID)
+	return nil
 }
 
 // UpdateSort - unified sort method for all block types
@@ -242,5 +288,9 @@ func (s *blockService) UpdateSort(ctx context.Context, blockID uuid.UUID, sort i
 	if len(blockID) == 0 {
 		return errors.New("block id is empty")
 	}
-	return s.r.ReorderWithinGroup(ctx, blockID, sort)
+	if err := s.r.ReorderWithinGroup(ctx, blockID, sort); err != nil {
+		return err
+	}
+	s.bumpSpaceVersionOfBlock(ctx, blockID)
+	return nil
 }
@@ -158,7 +158,7 @@ func TestBlockService_Create_Page(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			err := service.Create(ctx, tt.block)
 
 			if tt.wantErr {
@@ -220,7 +220,7 @@ func TestBlockService_Delete(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			err := service.Delete(ctx, spaceID, tt.blockID)
 
 			if tt.wantErr {
@@ -360,7 +360,7 @@ func TestBlockService_Create_Text(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			err := service.Create(ctx, tt.block)
 
 			if tt.wantErr {
@@ -495,7 +495,7 @@ func TestBlockService_Create_Folder(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			err := service.Create(ctx, tt.block)
 
 			if tt.wantErr {
@@ -606,7 +606,7 @@ func TestBlockService_Move_Folder(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			err := service.Move(ctx, tt.folderID, tt.newParentID, tt.targetSort)
 
 			if tt.wantErr {
@@ -683,7 +683,7 @@ func TestBlockService_List(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			_, err := service.List(ctx, tt.spaceID, tt.blockType, tt.parentID)
 
 			if tt.wantErr {
@@ -716,7 +716,7 @@ func TestBlockService_ComprehensiveNesting(t *testing.T) {
 			return b.Type == model.BlockTypeFolder && b.GetFolderPath() == "Root"
 		})).Return(nil)
 
-		service := NewBlockService(repo)
+		service := NewBlockService(repo, nil)
 		err := service.Create(ctx, rootFolder)
 		assert.NoError(t, err)
 		assert.Equal(t, "Root", rootFolder.GetFolderPath())
@@ -741,7 +741,7 @@ func TestBlockService_ComprehensiveNesting(t *testing.T) {
 		}
 		repo.On("Get", ctx, pageID).Return(pageBlock, nil)
 
-		service := NewBlockService(repo)
+		service := NewBlockService(repo, nil)
 		err := service.Create(ctx, folderUnderPage)
 		assert.Error(t, err)
 		assert.Contains(t, err.Error(), "cannot be a child of")
@@ -758,7 +758,7 @@ func TestBlockService_ComprehensiveNesting(t *testing.T) {
 			Title:   "InvalidText",
 		}
 
-		service := NewBlockService(repo)
+		service := NewBlockService(repo, nil)
 		err := service.Create(ctx, textAtRoot)
 		assert.Error(t, err)
 		// The error comes from Validate() which checks RequireParent first
@@ -999,7 +999,7 @@ func TestBlockService_Move_CircularReference(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			err := service.Move(ctx, tt.blockID, tt.newParentID, nil)
 
 			if tt.wantErr {
@@ -1143,7 +1143,7 @@ func TestBlockService_isDescendant(t *testing.T) {
 			repo := &MockBlockRepo{}
 			tt.setup(repo)
 
-			service := NewBlockService(repo)
+			service := NewBlockService(repo, nil)
 			result, err := service.(*blockService).isDescendant(ctx, tt.ancestorID, tt.candidateID)
 
 			if tt.wantErr {
@@ -48,6 +48,10 @@ const (
 	redisKeyPrefixParts = "message:parts:"
 	// Default TTL for message parts cache (1 hour)
 	defaultPartsCacheTTL = time.Hour
+	// Redis key of the last published insert notify of a session, read by the core
+	redisKeyNotifyPublished = "notify.%s.%s.published"
+	// Matches the core's session_message_notify_coalesce_ttl_seconds
+	notifyPublishedTTL = 10 * time.Minute
 )
 
 func NewSessionService(sessionRepo repo.SessionRepo, assetReferenceRepo repo.AssetReferenceRepo, log *zap.Logger, s3 *blob.S3Deps, publisher *mq.Publisher, cfg *config.Config, redis *redis.Client) SessionService {
@@ -241,22 +245,33 @@ func (s *sessionService) SendMessage(ctx context.Context, in SendMessageInput) (
 		parts = append(parts, part)
 	}
 
-	// upload parts to S3 as JSON file
-	asset, err := s.s3.UploadJSON(ctx, "parts/"+in.ProjectID.String(), parts)
+	partsJSON, err := sonic.Marshal(parts)
 	if err != nil {
-		return nil, fmt.Errorf("upload parts to S3 failed: %w", err)
+		return nil, fmt.Errorf("marshal parts: %w", err)
 	}
 
-	if err := s.assetReferenceRepo.IncrementAssetRef(ctx, in.ProjectID, *asset); err != nil {
-		return nil, fmt.Errorf("increment asset reference: %w", err)
-	}
+	// Small parts are stored inline in the message row, larger ones are uploaded to S3
+	var partsAssetMeta model.Asset
+	inlineParts := s.shouldInlineParts(parts, len(partsJSON))
+	if !inlineParts {
+		// upload parts to S3 as JSON file
+		asset, err := s.s3.UploadJSON(ctx, "parts/"+in.ProjectID.String(), parts)
+		if err != nil {
+			return nil, fmt.Errorf("upload parts to S3 failed: %w", err)
+		}
 
-	// Cache parts data in Redis after successful S3 upload
-	if s.redis != nil {
-		if err := s.cachePartsInRedis(ctx, asset.SHA256, parts); err != nil {
-			// Log error but don't fail the request if Redis caching fails
-			s.log.Warn("failed to cache parts in Redis", zap.String("sha256", asset.SHA256), zap.Error(err))
+		if err := s.assetReferenceRepo.IncrementAssetRef(ctx, in.ProjectID, *asset); err != nil {
+			return nil, fmt.Errorf("increment asset reference: %w", err)
+		}
+
+		// Cache parts data in Redis after successful S3 upload
+		if s.redis != nil {
+			if err := s.cachePartsInRedis(ctx, asset.SHA256, parts); err != nil {
+				// Log error but don't fail the request if Redis caching fails
+				s.log.Warn("failed to cache parts in Redis", zap.String("sha256", asset.SHA256), zap.Error(err))
+			}
 		}
+		partsAssetMeta = *asset
 	}
 
 	// Prepare message metadata
@@ -269,9 +284,12 @@ func (s *sessionService) SendMessage(ctx context.Context, in SendMessageInput) (
 		SessionID:      in.SessionID,
 		Role:           in.Role,
 		Meta:           datatypes.NewJSONType(messageMeta), // Store message-level metadata
-		PartsAssetMeta: datatypes.NewJSONType(*asset),
+		PartsAssetMeta: datatypes.NewJSONType(partsAssetMeta),
 		Parts:          parts,
 	}
+	if inlineParts {
+		msg.PartsInline = datatypes.JSON(partsJSON)
+	}
 
 	if err := s.sessionRepo.CreateMessageWithAssets(ctx, &msg); err != nil {
 		return nil, err
@@ -284,6 +302,12 @@ func (s *sessionService) SendMessage(ctx context.Context, in SendMessageInput) (
 			MessageID: msg.ID,
 		}); err != nil {
 			s.log.Error("publish session message", zap.Error(err))
+		} else if s.redis != nil {
+			// Let the core skip notifications superseded by this one
+			key := fmt.Sprintf(redisKeyNotifyPublished, s.cfg.RabbitMQ.RoutingKey.SessionMessageInsert, in.SessionID)
+			if err := s.redis.Set(ctx, key, msg.ID.String(), notifyPublishedTTL).Err(); err != nil {
+				s.log.Warn("record published session message notify", zap.Error(err))
+			}
 		}
 	}
 
@@ -330,8 +354,7 @@ func (s *sessionService) GetMessages(ctx context.Context, in GetMessagesInput) (
 	}
 
 	for i, m := range msgs {
-		meta := m.PartsAssetMeta.Data()
-		parts := s.loadPartsForMessage(ctx, meta)
+		parts := s.loadPartsForMessage(ctx, m)
 		if len(parts) == 0 {
 			continue // Skip messages with failed parts loading
 		}
@@ -432,10 +455,33 @@ func (s *sessionService) getPartsFromRedis(ctx context.Context, sha256 string) (
 	return parts, nil
 }
 
-// loadPartsForMessage loads parts for a message from cache or S3
+// shouldInlineParts reports whether the parts JSON is small enough to be stored in the message row.
+// Parts referencing uploaded files always keep the S3 path, so asset references stay tracked.
+func (s *sessionService) shouldInlineParts(parts []model.Part, size int) bool {
+	if s.cfg == nil || size > s.cfg.Message.InlinePartsMaxBytes {
+		return false
+	}
+	for _, p := range parts {
+		if p.Asset != nil {
+			return false
+		}
+	}
+	return true
+}
+
+// loadPartsForMessage loads parts for a message from the inline column, cache or S3
 // Returns the loaded parts, or empty slice if loading fails
-func (s *sessionService) loadPartsForMessage(ctx context.Context, meta model.Asset) []model.Part {
+func (s *sessionService) loadPartsForMessage(ctx context.Context, m model.Message) []model.Part {
 	parts := []model.Part{}
+	if len(m.PartsInline) > 0 {
+		if err := sonic.Unmarshal(m.PartsInline, &parts); err != nil {
+			s.log.Warn("failed to unmarshal inline parts", zap.String("message_id", m.ID.String()), zap.Error(err))
+			return []model.Part{}
+		}
+		return parts
+	}
+
+	meta := m.PartsAssetMeta.Data()
 	cacheHit := false
 
 	// Try to get parts from Redis cache first, fallback to S3 if not found
@@ -477,8 +523,7 @@ func (s *sessionService) GetAllMessages(ctx context.Context, sessionID uuid.UUID
 
 	// Load parts for each message
 	for i, m := range msgs {
-		meta := m.PartsAssetMeta.Data()
-		msgs[i].Parts = s.loadPartsForMessage(ctx, meta)
+		msgs[i].Parts = s.loadPartsForMessage(ctx, m)
 	}
 
 	// Sort messages from old to new (ascending by created_at)
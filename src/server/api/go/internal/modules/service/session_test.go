@@ -984,3 +984,20 @@ func TestSessionService_GetMessages_SortOrder(t *testing.T) {
 		})
 	}
 }
+
+func TestSessionService_InlineParts(t *testing.T) {
+	cfg := &config.Config{Message: config.MessageCfg{InlinePartsMaxBytes: 64}}
+	s := &sessionService{log: zap.NewNop(), cfg: cfg}
+
+	textParts := []model.Part{{Type: "text", Text: "hello"}}
+	fileParts := []model.Part{{Type: "file", Asset: &model.Asset{SHA256: "abc"}}}
+
+	assert.True(t, s.shouldInlineParts(textParts, 32))
+	assert.False(t, s.shouldInlineParts(textParts, 65), "parts above the threshold go to S3")
+	assert.False(t, s.shouldInlineParts(fileParts, 32), "parts with file assets go to S3")
+	assert.False(t, (&sessionService{}).shouldInlineParts(textParts, 1), "no config disables inlining")
+
+	msg := model.Message{PartsInline: []byte(`[{"type":"text","text":"hello"}]`)}
+	parts := s.loadPartsForMessage(context.Background(), msg)
+	assert.Equal(t, textParts, parts)
+}
@@ -134,8 +134,10 @@ func NewRouter(d RouterDeps) *gin.Engine {
 			space.GET("/:space_id/configs", d.SpaceHandler.GetConfigs)
 
 			space.GET("/:space_id/experience_search", d.SpaceHandler.GetExperienceSearch)
+			space.GET("/:space_id/experience_search/stream", d.SpaceHandler.GetExperienceSearchStream)
 			space.GET("/:space_id/semantic_glob", d.SpaceHandler.GetSemanticGlobal)
 			space.GET("/:space_id/semantic_grep", d.SpaceHandler.GetSemanticGrep)
+			space.POST("/:space_id/batch_search", d.SpaceHandler.BatchSearch)
 
 			space.GET("/:space_id/experience_confirmations", d.SpaceHandler.ListExperienceConfirmations)
 			space.PATCH("/:space_id/experience_confirmations/:experience_id", d.SpaceHandler.ConfirmExperience)
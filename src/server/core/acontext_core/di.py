@@ -3,6 +3,7 @@ from .env import LOG, DEFAULT_CORE_CONFIG
 from .infra.db import init_database, close_database, DB_CLIENT
 from .infra.redis import init_redis, close_redis, REDIS_CLIENT
 from .infra.async_mq import init_mq, close_mq, MQ_CLIENT
+from .infra.delayed_publish import close_delayed_publisher, DELAYED_PUBLISHER
 from .infra.s3 import init_s3, close_s3, S3_CLIENT
 from .llm.complete import llm_sanity_check
 from .llm.embeddings import embedding_sanity_check
@@ -18,6 +19,7 @@ async def setup() -> None:
 
 
 async def cleanup() -> None:
+    await close_delayed_publisher()
     await close_database()
     await close_redis()
     await close_s3()
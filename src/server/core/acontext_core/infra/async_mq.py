@@ -4,6 +4,7 @@ import asyncio
 import json
 import traceback
 from enum import StrEnum
+from contextlib import AsyncExitStack
 from pydantic import ValidationError, BaseModel
 from dataclasses import dataclass, field
 from typing import Callable, Awaitable, Any, Dict, Optional, List, Set, Tuple
@@ -13,7 +14,12 @@ from aio_pika import connect_robust, ExchangeType, Message
 from aio_pika.abc import AbstractConnection, AbstractChannel, AbstractQueue
 
 from ..env import LOG, DEFAULT_CORE_CONFIG, bound_logging_vars
-from ..util.handler_spec import check_handler_function_sanity, get_handler_body_type
+from ..util.handler_spec import (
+    check_handler_function_sanity,
+    get_handler_body_type,
+    check_batch_handler_function_sanity,
+    get_batch_handler_body_type,
+)
 
 # Optional OpenTelemetry imports - only used when tracing is enabled
 try:
@@ -40,6 +46,15 @@ class SpecialHandler(StrEnum):
 LOGGING_FIELDS = {"project_id", "session_id"}
 
 
+def _batch_logging_vars(payloads: List[dict]) -> dict:
+    """Logging fields shared by every message of a batch, None when they differ"""
+    _vars = {}
+    for k in LOGGING_FIELDS:
+        values = {p.get(k, None) for p in payloads}
+        _vars[k] = values.pop() if len(values) == 1 else None
+    return _vars
+
+
 def _is_otel_enabled() -> bool:
     """Check if OpenTelemetry tracing is enabled"""
     try:
@@ -221,6 +236,14 @@ class ConsumerConfigData:
     dlx_ttl_days: int = DEFAULT_CORE_CONFIG.mq_default_dlx_ttl_days
     use_dlx_ex_rk: Optional[tuple[str, str]] = None
     dlx_suffix: str = "dead"
+    # Micro-batching (opt-in): when max_batch_size > 1, the handler receives
+    # `(bodies: List[Model], messages: List[Message])` instead of a single body
+    max_batch_size: int = 1
+    max_batch_linger_ms: int = 0
+
+    @property
+    def batch_mode(self) -> bool:
+        return self.max_batch_size > 1
 
 
 @dataclass
@@ -228,7 +251,9 @@ class ConsumerConfig(ConsumerConfigData):
     """Configuration for a single consumer"""
 
     handler: Optional[
-        Callable[[BaseModel, Message], Awaitable[Any]] | SpecialHandler
+        Callable[[BaseModel, Message], Awaitable[Any]]
+        | Callable[[List[BaseModel], List[Message]], Awaitable[Any]]
+        | SpecialHandler
     ] = field(default=None)
     body_pydantic_type: Optional[BaseModel] = field(default=None)
 
@@ -236,16 +261,77 @@ class ConsumerConfig(ConsumerConfigData):
         assert self.handler is not None, "Consumer Handler can not be None"
         if isinstance(self.handler, SpecialHandler):
             return
-        _, eil = check_handler_function_sanity(self.handler).unpack()
+        if self.batch_mode:
+            _, eil = check_batch_handler_function_sanity(self.handler).unpack()
+        else:
+            _, eil = check_handler_function_sanity(self.handler).unpack()
         if eil:
             raise ValueError(
                 f"Handler function {self.handler} does not meet the sanity requirements:\n{eil}"
             )
 
-        self.body_pydantic_type = get_handler_body_type(self.handler)
+        if self.batch_mode:
+            self.body_pydantic_type = get_batch_handler_body_type(self.handler)
+            if self.prefetch_count < self.max_batch_size:
+                LOG.warning(
+                    f"Queue {self.queue_name}: prefetch_count ({self.prefetch_count}) < "
+                    f"max_batch_size ({self.max_batch_size}), batches will never be full"
+                )
+        else:
+            self.body_pydantic_type = get_handler_body_type(self.handler)
         assert self.body_pydantic_type is not None, "Handler body type can not be None"
 
 
+class MessageBatcher:
+    """
+    Collect delivered messages into micro-batches.
+
+    A batch is dispatched when it reaches `max_batch_size`, or `max_batch_linger_ms`
+    after its first message arrived, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_batch_linger_ms: int,
+        dispatch: Callable[[List[Any]], None],
+    ):
+        assert max_batch_size > 0, "max_batch_size must be positive"
+        self.max_batch_size = max_batch_size
+        self.max_batch_linger_seconds = max(max_batch_linger_ms, 0) / 1000
+        self._dispatch = dispatch
+        self._batch: List[Any] = []
+        self._linger_handle: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        return len(self._batch)
+
+    def add(self, item: Any) -> None:
+        self._batch.append(item)
+        if len(self._batch) >= self.max_batch_size:
+            self.flush()
+        elif len(self._batch) == 1:
+            self._linger_handle = asyncio.get_running_loop().call_later(
+                self.max_batch_linger_seconds, self.flush
+            )
+
+    def flush(self) -> None:
+        if self._linger_handle is not None:
+            self._linger_handle.cancel()
+            self._linger_handle = None
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        self._dispatch(batch)
+
+    def discard(self) -> None:
+        """Drop the pending batch, unacked messages will be redelivered by MQ"""
+        if self._linger_handle is not None:
+            self._linger_handle.cancel()
+            self._linger_handle = None
+        self._batch = []
+
+
 @dataclass
 class ConnectionConfig:
     """MQ connection configuration"""
@@ -446,6 +532,136 @@ class AsyncSingleThreadMQConsumer:
             if span:
                 span.end()
 
+    async def _process_batch(
+        self,
+        config: ConsumerConfig,
+        messages: List[Message],
+    ) -> None:
+        """Process a micro-batch of messages with retry logic.
+
+        Messages that fail validation are rejected individually. The handler can
+        ack/reject single messages itself as soon as they are settled: a timeout or
+        an error only retries the messages left unsettled, the rest are acked after
+        the handler succeeds, or rejected once the retries are exhausted.
+        """
+        extracted_context = _extract_trace_context_from_headers(messages[0])
+        span, process_context = _create_process_span(
+            config, messages[0], extracted_context
+        )
+        if span:
+            span.set_attribute("mq.batch_size", len(messages))
+
+        try:
+            async with AsyncExitStack() as stack:
+                for message in messages:
+                    await stack.enter_async_context(
+                        message.process(requeue=False, ignore_processed=True)
+                    )
+
+                validated_bodies = []
+                validated_messages = []
+                payloads = []
+                for message in messages:
+                    try:
+                        payload = json.loads(message.body.decode("utf-8"))
+                        validated_bodies.append(
+                            config.body_pydantic_type.model_validate(payload)
+                        )
+                        validated_messages.append(message)
+                        payloads.append(payload)
+                    except (ValidationError, ValueError) as e:
+                        LOG.error(
+                            f"Message validation failed - queue: {config.queue_name}, "
+                            f"error: {str(e)}"
+                        )
+                        await message.reject(requeue=False)
+                if not validated_messages:
+                    return
+
+                retry_count = 0
+                max_retries = config.max_retries
+                while retry_count <= max_retries:
+                    # messages settled by the handler in a previous attempt are done
+                    pending = [
+                        (body, message, payload)
+                        for body, message, payload in zip(
+                            validated_bodies, validated_messages, payloads
+                        )
+                        if not message.processed
+                    ]
+                    if not pending:
+                        return
+                    pending_bodies = [body for body, _, _ in pending]
+                    pending_messages = [message for _, message, _ in pending]
+                    try:
+                        with bound_logging_vars(
+                            queue_name=config.queue_name,
+                            **_batch_logging_vars([p for _, _, p in pending]),
+                        ):
+                            token = None
+                            if process_context and OTEL_AVAILABLE:
+                                token = otel_context.attach(process_context)
+                            try:
+                                _start_s = perf_counter()
+                                await asyncio.wait_for(
+                                    config.handler(pending_bodies, pending_messages),
+                                    timeout=config.timeout,
+                                )
+                                _end_s = perf_counter()
+                            finally:
+                                if token is not None:
+                                    otel_context.detach(token)
+                        LOG.debug(
+                            f"Queue: {config.queue_name} processed batch of {len(pending_messages)} in {_end_s - _start_s:.4f}s"
+                        )
+                        if span:
+                            span.set_attribute(
+                                "mq.processing_time_seconds", _end_s - _start_s
+                            )
+                            span.set_attribute("mq.retry_count", retry_count)
+                            _set_span_status(span, StatusCode.OK)
+                        return
+                    except Exception as e:
+                        if isinstance(e, asyncio.TimeoutError):
+                            e = TimeoutError(
+                                f"Handler timeout after {config.timeout}s - queue: {config.queue_name}"
+                            )
+                        retry_count += 1
+                        _wait_for = config.retry_delay * (retry_count**2)
+                        if retry_count <= max_retries:
+                            LOG.warning(
+                                f"Batch processing unknown error - queue: {config.queue_name}, "
+                                f"unsettled: {len(pending_messages)}, "
+                                f"attempt: {retry_count}/{config.max_retries}, "
+                                f"retry after {_wait_for}s, "
+                                f"error: {str(e)}.",
+                                extra={"traceback": traceback.format_exc()},
+                            )
+                            await asyncio.sleep(_wait_for)
+                            continue
+                        LOG.error(
+                            f"Batch processing failed permanently - queue: {config.queue_name}, "
+                            f"error: {str(e)}",
+                            extra={"traceback": traceback.format_exc()},
+                        )
+                        if span:
+                            _record_span_exception(span, e)
+                            _set_span_status(span, StatusCode.ERROR, str(e))
+                            span.set_attribute("mq.failed_permanently", True)
+                        # goto DLX if any
+                        for message in pending_messages:
+                            if not message.processed:
+                                await message.reject(requeue=False)
+                        return
+        finally:
+            if span:
+                span.end()
+
+    def _dispatch_batch(self, config: ConsumerConfig, messages: List[Message]) -> None:
+        task = asyncio.create_task(self._process_batch(config, messages))
+        self._processing_tasks.add(task)
+        task.add_done_callback(self.cleanup_message_task)
+
     def cleanup_message_task(self, task: asyncio.Task) -> None:
         try:
             task.result()
@@ -496,6 +712,11 @@ class AsyncSingleThreadMQConsumer:
                 )
 
                 async with queue.iterator() as queue_iter:
+                    if config.batch_mode:
+                        await self._consume_batches(config, queue_iter)
+                        if self._shutdown_event.is_set():
+                            break
+                        continue
                     async for message in queue_iter:
                         if self._shutdown_event.is_set():
                             break
@@ -557,6 +778,21 @@ class AsyncSingleThreadMQConsumer:
                         )
                 LOG.info(f"Consumer channel closed - queue: {config.queue_name}")
 
+    async def _consume_batches(self, config: ConsumerConfig, queue_iter) -> None:
+        """Group delivered messages into micro-batches before dispatching"""
+        batcher = MessageBatcher(
+            config.max_batch_size,
+            config.max_batch_linger_ms,
+            lambda batch: self._dispatch_batch(config, batch),
+        )
+        try:
+            async for message in queue_iter:
+                if self._shutdown_event.is_set():
+                    break
+                batcher.add(message)
+        finally:
+            batcher.discard()
+
     async def _setup_consumer_on_channel(
         self,
         config: ConsumerConfig,
@@ -1,7 +1,8 @@
+import asyncio
 import traceback
 import os
-from typing import Optional
-from collections.abc import AsyncGenerator
+from typing import Optional, Hashable
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import (
@@ -16,10 +17,39 @@ from sqlalchemy.exc import DisconnectionError, OperationalError
 
 # from ..schema.orm import Base
 from ..schema.orm import ORM_BASE, BlockEmbedding
-from ..schema.orm.block_embedding import check_legal_embedding_dim
+from ..schema.orm.block_embedding import (
+    check_legal_embedding_dim,
+    ensure_vector_indexes,
+)
 from ..env import LOG as logger
 from ..env import DEFAULT_CORE_CONFIG
 
+POST_COMMIT_HOOKS = "acontext.post_commit_hooks"
+
+
+def add_post_commit_hook(
+    db_session: AsyncSession, key: Hashable, hook: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Run `hook` after the session commits, it is dropped on rollback.
+    Hooks added with the same key run once.
+    """
+    db_session.info.setdefault(POST_COMMIT_HOOKS, {})[key] = hook
+
+
+async def _run_post_commit_hooks(
+    hooks: dict[Hashable, Callable[[], Awaitable[None]]],
+) -> None:
+    for key, hook in hooks.items():
+        try:
+            await hook()
+        except Exception as e:
+            # The transaction is already committed, don't fail the caller
+            logger.error(
+                f"Post-commit hook {key} failed: {str(e)}",
+                extra={"traceback": traceback.format_exc()},
+            )
+
 
 class DatabaseClient:
     """
@@ -103,19 +133,21 @@ class DatabaseClient:
 
         # Set up event listeners for connection monitoring
         self._setup_event_listeners(engine)
-        
+
         # Instrument with OpenTelemetry if enabled
         try:
             from ..telemetry.config import TelemetryConfig
+
             telemetry_config = TelemetryConfig.from_env()
             if telemetry_config.enabled:
                 from ..telemetry.otel import instrument_sqlalchemy
+
                 instrument_sqlalchemy(engine)
                 logger.info("SQLAlchemy OpenTelemetry instrumentation enabled")
         except Exception as e:
             logger.warning(
                 f"Failed to instrument SQLAlchemy with OpenTelemetry, continuing without tracing: {e}",
-                exc_info=True
+                exc_info=True,
             )
 
         return engine
@@ -161,15 +193,18 @@ class DatabaseClient:
         try:
             yield session
             await session.commit()
+            post_commit_hooks = session.info.pop(POST_COMMIT_HOOKS, {})
         except Exception as e:
             logger.error(
                 f"DB Session failed: {str(e)}. Rollback...",
                 extra={"traceback": traceback.format_exc()},
             )
+            session.info.pop(POST_COMMIT_HOOKS, None)
             await session.rollback()
             raise e
         finally:
             await session.close()
+        await _run_post_commit_hooks(post_commit_hooks)
 
     async def health_check(self) -> bool:
         """
@@ -228,6 +263,17 @@ class DatabaseClient:
 
 # Lazy Loading Global database client instance
 DB_CLIENT = DatabaseClient()
+VECTOR_INDEX_BUILD_TASK: asyncio.Task | None = None
+
+
+async def _build_vector_indexes() -> None:
+    try:
+        await ensure_vector_indexes(BlockEmbedding, DB_CLIENT.engine)
+    except Exception as e:
+        logger.error(
+            f"Failed to build vector indexes: {str(e)}",
+            extra={"traceback": traceback.format_exc()},
+        )
 
 
 # Convenience functions
@@ -239,10 +285,15 @@ async def init_database() -> None:
         await check_legal_embedding_dim(
             BlockEmbedding, db_session, DEFAULT_CORE_CONFIG.block_embedding_dim
         )
+    # Index builds can take minutes on large tables, don't block startup
+    global VECTOR_INDEX_BUILD_TASK
+    VECTOR_INDEX_BUILD_TASK = asyncio.create_task(_build_vector_indexes())
     logger.info(f"Database created successfully {DB_CLIENT.get_pool_status()}")
 
 
 async def close_database() -> None:
     """Close database connections."""
+    if VECTOR_INDEX_BUILD_TASK is not None:
+        VECTOR_INDEX_BUILD_TASK.cancel()
     await DB_CLIENT.close()
     logger.info("Database closed")
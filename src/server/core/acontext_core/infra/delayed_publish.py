@@ -0,0 +1,188 @@
+import asyncio
+import json
+import time
+import traceback
+from typing import Optional
+
+from ..env import LOG, DEFAULT_CORE_CONFIG
+from .redis import REDIS_CLIENT, RedisClient
+from .async_mq import MQ_CLIENT, AsyncSingleThreadMQConsumer
+
+# Atomically pop the due entries and their payloads, so that concurrent pollers
+# (one per core replica) never fire the same entry twice.
+_POP_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local out = {}
+for _, member in ipairs(due) do
+    redis.call('ZREM', KEYS[1], member)
+    local payload = redis.call('HGET', KEYS[2], member)
+    redis.call('HDEL', KEYS[2], member)
+    if payload then
+        table.insert(out, payload)
+    end
+end
+return out
+"""
+
+
+def _default_dedup_key(exchange_name: str, routing_key: str, body: str) -> str:
+    return f"{exchange_name}.{routing_key}.{body}"
+
+
+class RedisDelayedPublisher:
+    """
+    Delayed MQ publishing backed by a Redis sorted set and a single poller.
+
+    Features:
+    - No sleeping coroutine per delayed message
+    - Pending entries survive core restarts
+    - Entries are coalesced by `dedup_key`: scheduling the same key again replaces
+      the payload and the deadline, so only the latest one fires
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        mq_client: AsyncSingleThreadMQConsumer,
+        namespace: str = "mq.delayed",
+        poll_interval_seconds: float = DEFAULT_CORE_CONFIG.mq_delayed_publish_poll_interval_seconds,
+        batch_size: int = DEFAULT_CORE_CONFIG.mq_delayed_publish_batch_size,
+    ):
+        self.redis_client = redis_client
+        self.mq_client = mq_client
+        self.schedule_key = f"{namespace}.schedule"
+        self.payload_key = f"{namespace}.payload"
+        self.poll_interval_seconds = poll_interval_seconds
+        self.batch_size = batch_size
+        self._shutdown_event = asyncio.Event()
+        self.__running = False
+
+    @property
+    def running(self) -> bool:
+        return self.__running
+
+    async def publish_later(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        body: str,
+        delay_seconds: float,
+        dedup_key: Optional[str] = None,
+    ) -> None:
+        """Schedule a message to be published after `delay_seconds`"""
+        dedup_key = dedup_key or _default_dedup_key(exchange_name, routing_key, body)
+        await self._schedule(
+            exchange_name, routing_key, body, delay_seconds, dedup_key, replace=True
+        )
+
+    async def _schedule(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        body: str,
+        delay_seconds: float,
+        dedup_key: str,
+        replace: bool,
+    ) -> None:
+        payload = json.dumps(
+            {
+                "exchange_name": exchange_name,
+                "routing_key": routing_key,
+                "body": body,
+                "dedup_key": dedup_key,
+            }
+        )
+        deadline = time.time() + delay_seconds
+        async with self.redis_client.get_client_context() as client:
+            async with client.pipeline(transaction=True) as pipe:
+                if replace:
+                    pipe.hset(self.payload_key, dedup_key, payload)
+                else:
+                    pipe.hsetnx(self.payload_key, dedup_key, payload)
+                pipe.zadd(self.schedule_key, {dedup_key: deadline}, nx=not replace)
+                await pipe.execute()
+        LOG.debug(f"Scheduled delayed message {dedup_key} in {delay_seconds}s")
+
+    async def pending_count(self) -> int:
+        async with self.redis_client.get_client_context() as client:
+            return await client.zcard(self.schedule_key)
+
+    async def poll_once(self) -> int:
+        """Publish all due messages (up to `batch_size`), return the number fired"""
+        async with self.redis_client.get_client_context() as client:
+            payloads = await client.eval(
+                _POP_DUE_SCRIPT,
+                2,
+                self.schedule_key,
+                self.payload_key,
+                time.time(),
+                self.batch_size,
+            )
+        for raw in payloads:
+            payload = json.loads(raw)
+            try:
+                await self.mq_client.publish(
+                    exchange_name=payload["exchange_name"],
+                    routing_key=payload["routing_key"],
+                    body=payload["body"],
+                )
+            except Exception as e:
+                LOG.warning(
+                    f"Failed to publish delayed message to {payload['routing_key']}, "
+                    f"reschedule in {self.poll_interval_seconds}s: {e}"
+                )
+                # keep coalescing under the original key, an entry scheduled with
+                # it meanwhile is newer and wins
+                await self._schedule(
+                    payload["exchange_name"],
+                    payload["routing_key"],
+                    payload["body"],
+                    self.poll_interval_seconds,
+                    payload.get("dedup_key")
+                    or _default_dedup_key(
+                        payload["exchange_name"],
+                        payload["routing_key"],
+                        payload["body"],
+                    ),
+                    replace=False,
+                )
+        return len(payloads)
+
+    async def start(self) -> None:
+        """Run the poller until `stop()` is called"""
+        if self.running:
+            raise RuntimeError("Delayed publisher is already running")
+        self.__running = True
+        self._shutdown_event.clear()
+        LOG.info(f"Delayed publisher started (schedule: {self.schedule_key})")
+        while not self._shutdown_event.is_set():
+            try:
+                fired = await self.poll_once()
+                if fired >= self.batch_size:
+                    # more due entries are waiting, poll again right away
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOG.error(
+                    f"Delayed publisher poll error: {e}",
+                    extra={"traceback": traceback.format_exc()},
+                )
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(), timeout=self.poll_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+        self.__running = False
+        LOG.info("Delayed publisher stopped")
+
+    async def stop(self) -> None:
+        self._shutdown_event.set()
+
+
+DELAYED_PUBLISHER = RedisDelayedPublisher(REDIS_CLIENT, MQ_CLIENT)
+
+
+async def close_delayed_publisher() -> None:
+    await DELAYED_PUBLISHER.stop()
@@ -1,4 +1,7 @@
 import asyncio
+import heapq
+import itertools
+from enum import IntEnum
 from typing import Optional, Dict, Any, AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -407,8 +410,145 @@ class S3Client:
         logger.info("S3 client connections closed")
 
 
+class FetchPriority(IntEnum):
+    """Lower value is served first"""
+
+    HIGH = 0  # user-facing API reads
+    NORMAL = 1  # session message processing
+    LOW = 2  # background agents
+
+
+class PrioritySemaphore:
+    """Semaphore that wakes up waiters by priority, FIFO within the same priority"""
+
+    def __init__(self, value: int):
+        assert value > 0, "value must be positive"
+        self._value = value
+        # [priority, seq, future], lists so a waiter can be promoted in place
+        self._waiters: list[list] = []
+        self._tokens: Dict[Any, list] = {}
+        self._seq = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    async def acquire(
+        self, priority: int = FetchPriority.NORMAL, token: Optional[Any] = None
+    ) -> None:
+        """Wait for a slot, a waiter acquired with a `token` can be promoted later"""
+        if self._value > 0 and not self.waiting:
+            self._value -= 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        waiter = [priority, next(self._seq), fut]
+        heapq.heappush(self._waiters, waiter)
+        if token is not None:
+            self._tokens[token] = waiter
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over right before the cancellation
+                self.release()
+            raise
+        finally:
+            if token is not None and self._tokens.get(token) is waiter:
+                del self._tokens[token]
+
+    def promote(self, token: Any, priority: int) -> None:
+        """Raise the priority of the waiter acquired with `token`, if still waiting"""
+        waiter = self._tokens.get(token)
+        if waiter is None or waiter[2].done() or priority >= waiter[0]:
+            return
+        waiter[0] = priority
+        heapq.heapify(self._waiters)
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self._value += 1
+
+    @asynccontextmanager
+    async def slot(self, priority: int = FetchPriority.NORMAL):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class S3FetchScheduler:
+    """
+    Shared download scheduler in front of the S3 client.
+
+    Features:
+    - Bounded concurrency, so bulk loads cannot exhaust the connection pool
+    - Priority: waiting HIGH requests are served before NORMAL and LOW ones
+    - Deduplication: concurrent downloads of the same object share one request,
+      a queued download is promoted to the highest priority of its callers
+    """
+
+    def __init__(self, client: S3Client, max_concurrency: int):
+        self.client = client
+        self.semaphore = PrioritySemaphore(max_concurrency)
+        self.deduplicated = 0
+        self._inflight: Dict[tuple[str, str], asyncio.Task] = {}
+        # highest priority among the callers of each in-flight download
+        self._priorities: Dict[tuple[str, str], FetchPriority] = {}
+
+    async def _download(
+        self, key: str, bucket: Optional[str], inflight_key: tuple[str, str]
+    ) -> bytes:
+        await self.semaphore.acquire(
+            self._priorities[inflight_key], token=inflight_key
+        )
+        try:
+            return await self.client.download_object(key, bucket=bucket)
+        finally:
+            self.semaphore.release()
+
+    async def download_object(
+        self,
+        key: str,
+        bucket: Optional[str] = None,
+        priority: FetchPriority = FetchPriority.NORMAL,
+    ) -> bytes:
+        inflight_key = (bucket or self.client.bucket, key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            self._priorities[inflight_key] = priority
+            task = asyncio.create_task(self._download(key, bucket, inflight_key))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._forget(inflight_key))
+        else:
+            self.deduplicated += 1
+            if priority < self._priorities[inflight_key]:
+                self._priorities[inflight_key] = priority
+                self.semaphore.promote(inflight_key, priority)
+        # A cancelled caller must not cancel the download shared with others
+        return await asyncio.shield(task)
+
+    def _forget(self, inflight_key: tuple[str, str]) -> None:
+        self._inflight.pop(inflight_key, None)
+        self._priorities.pop(inflight_key, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "inflight": len(self._inflight),
+            "waiting": self.semaphore.waiting,
+            "deduplicated": self.deduplicated,
+        }
+
+
 # Global S3 client instance
 S3_CLIENT = S3Client()
+S3_FETCHER = S3FetchScheduler(
+    S3_CLIENT, max_concurrency=DEFAULT_CORE_CONFIG.s3_fetch_max_concurrency
+)
 
 
 # FastAPI dependency function
@@ -1,12 +1,26 @@
+import asyncio
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Optional
 from ...env import LOG, bound_logging_vars
 from ...infra.db import AsyncSession, DB_CLIENT
-from ..complete import llm_complete, response_to_sendable_message
+from ..complete import (
+    llm_complete,
+    response_to_sendable_message,
+    response_total_tokens,
+)
+from ...schema.block.general import LocatedContentBlock
+from ...service.data import block_render as BR
+from ...service.data import block_search as BS
 from ...util.generate_ids import track_process
 from ...schema.result import Result
 from ...schema.utils import asUUID
 from ..prompt.space_search import SpaceSearchPrompt
 from ..tool.space_search_tools import SPACE_SEARCH_TOOLS, SpaceSearchCtx
 
+# Called with ("block", LocatedContentBlock) for every attached block and
+# ("thinking", str) for every reported thought, as soon as they happen
+SearchEventHandler = Callable[[str, Any], Awaitable[None]]
+
 
 async def build_space_search_ctx(
     db_session: AsyncSession,
@@ -23,6 +37,40 @@ async def build_space_search_ctx(
     return ctx
 
 
+async def fast_path_search(
+    ctx: SpaceSearchCtx, user_query: str, threshold: float
+) -> Result[list[LocatedContentBlock]]:
+    """
+    Hybrid search for the query, keeping the blocks whose vector distance is within
+    `threshold`. Any such block means the space answers the query directly.
+    """
+    r = await BS.search_content_blocks_hybrid(
+        ctx.db_session, ctx.space_id, user_query, topk=ctx.block_limit
+    )
+    if not r.ok():
+        return r
+    blocks = [
+        block
+        for block, distance in r.data
+        if distance is not None and distance <= threshold
+    ]
+    if not blocks:
+        return Result.resolve([])
+    r = await BR.render_content_blocks(ctx.db_session, ctx.space_id, blocks)
+    if not r.ok():
+        return r
+    located_blocks = []
+    for content_block in r.data:
+        r = await ctx.find_path_by_id(content_block.parent_id)
+        if not r.ok():
+            return r
+        path, _ = r.data
+        located_blocks.append(
+            LocatedContentBlock(path=path, render_block=content_block)
+        )
+    return Result.resolve(located_blocks)
+
+
 @track_process
 async def space_agent_search(
     project_id: asUUID,
@@ -30,10 +78,43 @@ async def space_agent_search(
     user_query: str,
     limit: int = 10,
     max_iterations: int = 16,
+    on_event: Optional[SearchEventHandler] = None,
+    max_latency_ms: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    fast_path_threshold: Optional[float] = None,
 ) -> Result[SpaceSearchCtx]:
+    """
+    Let the agent search the space until it finishes, attaches `limit` blocks or
+    runs out of iterations, latency (`max_latency_ms`) or tokens (`max_tokens`).
+    With `fast_path_threshold`, a hybrid search runs first and the agent is
+    skipped when it finds blocks within that distance.
+    The spent budget is reported in the `usage` of the returned context.
+    """
+    _start_s = perf_counter()
+
+    def elapsed_ms() -> int:
+        return int((perf_counter() - _start_s) * 1000)
+
+    async with DB_CLIENT.get_session_context() as db_session:
+        USE_CTX = await build_space_search_ctx(db_session, project_id, space_id, limit)
+        if fast_path_threshold is not None:
+            r = await fast_path_search(USE_CTX, user_query, fast_path_threshold)
+            if not r.ok():
+                return r
+            USE_CTX.located_content_blocks.extend(r.data)
+    usage = USE_CTX.usage
+    if USE_CTX.located_content_blocks:
+        LOG.info("Fast path found close enough blocks, skip the agent")
+        if on_event is not None:
+            for block in USE_CTX.located_content_blocks:
+                await on_event("block", block)
+        usage.fast_path = True
+        usage.stop_reason = "fast_path"
+        usage.elapsed_ms = elapsed_ms()
+        USE_CTX.db_session = None
+        return Result.resolve(USE_CTX)
 
     json_tools = [tool.model_dump() for tool in SpaceSearchPrompt.tool_schema()]
-    already_iterations = 0
     _messages = [
         {
             "role": "user",
@@ -41,21 +122,43 @@ async def space_agent_search(
         }
     ]
     just_finish = False
-    USE_CTX = None
-    while already_iterations < max_iterations:
-        r = await llm_complete(
-            system_prompt=SpaceSearchPrompt.system_prompt(),
-            history_messages=_messages,
-            tools=json_tools,
-            prompt_kwargs=SpaceSearchPrompt.prompt_kwargs(),
-        )
+    usage.stop_reason = "max_iterations"
+    while usage.iterations < max_iterations:
+        if max_tokens is not None and usage.tokens >= max_tokens:
+            LOG.info(f"Spent {usage.tokens} tokens, exit the loop")
+            usage.stop_reason = "token_budget"
+            break
+        timeout = None
+        if max_latency_ms is not None:
+            timeout = (max_latency_ms - elapsed_ms()) / 1000
+            if timeout <= 0:
+                LOG.info(f"Spent {elapsed_ms()}ms, exit the loop")
+                usage.stop_reason = "latency_budget"
+                break
+        try:
+            r = await asyncio.wait_for(
+                llm_complete(
+                    system_prompt=SpaceSearchPrompt.system_prompt(),
+                    history_messages=_messages,
+                    tools=json_tools,
+                    prompt_kwargs=SpaceSearchPrompt.prompt_kwargs(),
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            LOG.info(f"LLM call outlived the budget of {max_latency_ms}ms")
+            usage.stop_reason = "latency_budget"
+            break
         llm_return, eil = r.unpack()
         if eil:
             return r
+        usage.iterations += 1
+        usage.tokens += response_total_tokens(llm_return)
         _messages.append(response_to_sendable_message(llm_return))
         LOG.info(f"LLM Response: {llm_return.content}...")
         if not llm_return.tool_calls:
             LOG.info("No tool calls found, stop iterations")
+            usage.stop_reason = "no_tool_calls"
             break
         use_tools = llm_return.tool_calls
         tool_response = []
@@ -76,10 +179,16 @@ async def space_agent_search(
                             limit,
                             before_use_ctx=USE_CTX,
                         )
+                        attached = len(USE_CTX.located_content_blocks)
                         r = await tool.handler(USE_CTX, tool_arguments)
                     t, eil = r.unpack()
                     if eil:
                         return r
+                if on_event is not None:
+                    if tool_name == "report_thinking":
+                        await on_event("thinking", tool_arguments.get("thinking", ""))
+                    for block in USE_CTX.located_content_blocks[attached:]:
+                        await on_event("block", block)
                 if tool_name != "report_thinking":
                     LOG.info(f"Tool Call: {tool_name} - {tool_arguments} -> {t}")
                 tool_response.append(
@@ -96,10 +205,12 @@ async def space_agent_search(
         _messages.extend(tool_response)
         if just_finish:
             LOG.info("finish tool called, exit the loop")
+            usage.stop_reason = "finish"
             break
         if len(USE_CTX.located_content_blocks) >= limit:
             LOG.info("Reached the limit to attach more blocks, exit the loop")
+            usage.stop_reason = "limit"
             break
-        already_iterations += 1
+    usage.elapsed_ms = elapsed_ms()
     USE_CTX.db_session = None  # remove the out-dated session
     return Result.resolve(USE_CTX)
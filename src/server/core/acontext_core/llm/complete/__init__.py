@@ -57,6 +57,18 @@ async def llm_sanity_check():
     LOG.info("LLM check passed")
 
 
+def response_total_tokens(message: LLMResponse) -> int:
+    usage = getattr(message.raw_response, "usage", None)
+    if usage is None:
+        return 0
+    if DEFAULT_CORE_CONFIG.llm_sdk == "openai":
+        return usage.total_tokens or 0
+    elif DEFAULT_CORE_CONFIG.llm_sdk == "anthropic":
+        return (usage.input_tokens or 0) + (usage.output_tokens or 0)
+    else:
+        raise ValueError(f"Unsupported LLM SDK: {DEFAULT_CORE_CONFIG.llm_sdk}")
+
+
 def response_to_sendable_message(message: LLMResponse) -> dict:
     if DEFAULT_CORE_CONFIG.llm_sdk == "openai":
         return message.raw_response.choices[0].message.model_dump()
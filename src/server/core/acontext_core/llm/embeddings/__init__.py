@@ -1,3 +1,4 @@
+import numpy as np
 from typing import Literal
 from traceback import format_exc
 from ...env import LOG, DEFAULT_CORE_CONFIG
@@ -6,6 +7,8 @@ from ...schema.embedding import EmbeddingReturn
 from ...telemetry.otel import instrument_llm_embedding
 from .jina_embedding import jina_embedding
 from .openai_embedding import openai_embedding
+from .cache import embedding_cache_key, get_cached_embeddings, set_cached_embeddings
+from .coalescer import EmbeddingCoalescer
 
 FACTORIES = {
     "openai": openai_embedding,
@@ -16,6 +19,22 @@ assert (
 ), f"Unsupported embedding provider: {DEFAULT_CORE_CONFIG.block_embedding_provider}"
 
 
+async def _provider_embedding(
+    model: str, texts: list[str], phase: Literal["query", "document"]
+) -> EmbeddingReturn:
+    return await FACTORIES[DEFAULT_CORE_CONFIG.block_embedding_provider](
+        model, texts, phase
+    )
+
+
+EMBEDDING_COALESCER = EmbeddingCoalescer(
+    _provider_embedding,
+    max_batch_size=DEFAULT_CORE_CONFIG.block_embedding_max_batch_size,
+    max_batch_tokens=DEFAULT_CORE_CONFIG.block_embedding_max_batch_tokens,
+    linger_ms=DEFAULT_CORE_CONFIG.block_embedding_coalesce_linger_ms,
+)
+
+
 async def embedding_sanity_check():
     r = await get_embedding(["Hello, world!"])
     if not r.ok():
@@ -39,11 +58,42 @@ async def get_embedding(
 ) -> Result[EmbeddingReturn]:
     model = model or DEFAULT_CORE_CONFIG.block_embedding_model
     provider = DEFAULT_CORE_CONFIG.block_embedding_provider
+
+    # Queries repeat a lot (agentic search), only embed the ones not seen recently
+    use_cache = phase == "query" and DEFAULT_CORE_CONFIG.query_embedding_cache_enabled
+    if use_cache:
+        keys = [
+            embedding_cache_key(
+                provider, model, DEFAULT_CORE_CONFIG.block_embedding_dim, phase, text
+            )
+            for text in texts
+        ]
+        cached = await get_cached_embeddings(keys)
+        missing = [i for i, e in enumerate(cached) if e is None]
+        if not missing:
+            return Result.resolve(
+                EmbeddingReturn(
+                    embedding=np.stack(cached), prompt_tokens=0, total_tokens=0
+                )
+            )
+        texts = [texts[i] for i in missing]
+
     try:
-        results = await FACTORIES[provider](
-            model, texts, phase
-        )
+        if DEFAULT_CORE_CONFIG.block_embedding_coalesce_linger_ms > 0:
+            results = await EMBEDDING_COALESCER.embed(model, texts, phase)
+        else:
+            results = await _provider_embedding(model, texts, phase)
     except Exception as e:
         LOG.error(f"Error in get_embedding: {e} {format_exc()}")
         return Result.reject(f"Error in get_embedding: {e}")
+
+    if use_cache:
+        await set_cached_embeddings([keys[i] for i in missing], results.embedding)
+        for i, embedding in zip(missing, results.embedding):
+            cached[i] = embedding
+        results = EmbeddingReturn(
+            embedding=np.stack(cached),
+            prompt_tokens=results.prompt_tokens,
+            total_tokens=results.total_tokens,
+        )
     return Result.resolve(results)
@@ -0,0 +1,103 @@
+import base64
+import hashlib
+from typing import List, Optional, Sequence
+import numpy as np
+from ...env import LOG, DEFAULT_CORE_CONFIG
+from ...infra.redis import REDIS_CLIENT
+from ...util.cache import TTLLRUCache, CacheStats, CACHE_REGISTRY
+
+QUERY_EMBEDDING_KEY = "embedding.query.{digest}"
+
+
+def embedding_cache_key(
+    provider: str, model: str, dim: int, phase: str, text: str
+) -> str:
+    return hashlib.sha256(
+        "\x00".join([provider, model, str(dim), phase, text]).encode()
+    ).hexdigest()
+
+
+def _encode(embedding: np.ndarray) -> str:
+    # The redis client decodes responses, store vectors as base64 text
+    return base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode()
+
+
+def _decode(raw: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(raw), dtype=np.float32)
+
+
+class RedisEmbeddingCache:
+    """Query embeddings shared between replicas, behind the in-process LRU"""
+
+    def __init__(self, name: str, ttl_seconds: int):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        CACHE_REGISTRY[name] = self
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        async with REDIS_CLIENT.get_client_context() as client:
+            raws = await client.mget(
+                [QUERY_EMBEDDING_KEY.format(digest=key) for key in keys]
+            )
+        found = [_decode(raw) if raw is not None else None for raw in raws]
+        hits = sum(1 for e in found if e is not None)
+        self.stats.hits += hits
+        self.stats.misses += len(found) - hits
+        return found
+
+    async def set_many(self, keys: Sequence[str], embeddings: Sequence[np.ndarray]):
+        async with REDIS_CLIENT.get_client_context() as client:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, embedding in zip(keys, embeddings):
+                    pipe.set(
+                        QUERY_EMBEDDING_KEY.format(digest=key),
+                        _encode(embedding),
+                        ex=self.ttl_seconds,
+                    )
+                await pipe.execute()
+
+    def info(self) -> dict:
+        return {"ttl_seconds": self.ttl_seconds, **self.stats.to_dict()}
+
+
+QUERY_EMBEDDING_CACHE: TTLLRUCache[str, np.ndarray] = TTLLRUCache(
+    "query_embedding",
+    max_size=DEFAULT_CORE_CONFIG.query_embedding_cache_max_size,
+    ttl_seconds=DEFAULT_CORE_CONFIG.query_embedding_cache_ttl_seconds,
+)
+QUERY_EMBEDDING_REDIS_CACHE = RedisEmbeddingCache(
+    "query_embedding_redis",
+    ttl_seconds=DEFAULT_CORE_CONFIG.query_embedding_cache_ttl_seconds,
+)
+
+
+async def get_cached_embeddings(keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+    found = [QUERY_EMBEDDING_CACHE.get(key) for key in keys]
+    missing = [i for i, e in enumerate(found) if e is None]
+    if not missing or not DEFAULT_CORE_CONFIG.query_embedding_cache_redis:
+        return found
+    try:
+        shared = await QUERY_EMBEDDING_REDIS_CACHE.get_many([keys[i] for i in missing])
+    except Exception as e:
+        LOG.warning(f"Failed to read query embeddings from redis: {e}")
+        return found
+    for i, embedding in zip(missing, shared):
+        if embedding is not None:
+            QUERY_EMBEDDING_CACHE.set(keys[i], embedding)
+            found[i] = embedding
+    return found
+
+
+async def set_cached_embeddings(
+    keys: Sequence[str], embeddings: Sequence[np.ndarray]
+) -> None:
+    embeddings = [np.asarray(e, dtype=np.float32) for e in embeddings]
+    for key, embedding in zip(keys, embeddings):
+        QUERY_EMBEDDING_CACHE.set(key, embedding)
+    if not DEFAULT_CORE_CONFIG.query_embedding_cache_redis:
+        return
+    try:
+        await QUERY_EMBEDDING_REDIS_CACHE.set_many(keys, embeddings)
+    except Exception as e:
+        LOG.warning(f"Failed to store query embeddings in redis: {e}")
@@ -0,0 +1,110 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional
+from ...schema.embedding import EmbeddingReturn
+
+EmbedFunc = Callable[[str, list[str], str], Awaitable[EmbeddingReturn]]
+
+
+def estimate_tokens(texts: list[str]) -> int:
+    # ~4 characters per token for English text, good enough to bound a request
+    return sum(len(text) // 4 + 1 for text in texts)
+
+
+@dataclass
+class _PendingBatch:
+    texts: List[str] = field(default_factory=list)
+    tokens: int = 0
+    # (number of texts, estimated tokens, future) of each caller, in order
+    callers: List[tuple[int, int, asyncio.Future]] = field(default_factory=list)
+    linger_handle: Optional[asyncio.TimerHandle] = None
+
+
+class EmbeddingCoalescer:
+    """
+    Merge concurrent embedding calls into one provider request.
+
+    Calls for the same model and phase arriving within `linger_ms` of each other are
+    sent together, a batch is sent early once it reaches `max_batch_size` texts or
+    `max_batch_tokens` estimated tokens. The texts of one call are never split.
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFunc,
+        max_batch_size: int,
+        max_batch_tokens: int,
+        linger_ms: int,
+    ):
+        assert max_batch_size > 0, "max_batch_size must be positive"
+        self._embed = embed
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.linger_seconds = max(linger_ms, 0) / 1000
+        self._pending: dict[tuple[str, str], _PendingBatch] = {}
+        self._running: set[asyncio.Task] = set()
+
+    def _is_full(self, batch: _PendingBatch, texts_num: int, tokens: int) -> bool:
+        return (
+            len(batch.texts) + texts_num > self.max_batch_size
+            or batch.tokens + tokens > self.max_batch_tokens
+        )
+
+    async def embed(self, model: str, texts: list[str], phase: str) -> EmbeddingReturn:
+        key = (model, phase)
+        tokens = estimate_tokens(texts)
+        batch = self._pending.get(key)
+        if batch is not None and self._is_full(batch, len(texts), tokens):
+            self.flush(key)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[key] = batch
+            batch.linger_handle = asyncio.get_running_loop().call_later(
+                self.linger_seconds, self.flush, key
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        batch.texts.extend(texts)
+        batch.tokens += tokens
+        batch.callers.append((len(texts), tokens, future))
+        if (
+            len(batch.texts) >= self.max_batch_size
+            or batch.tokens >= self.max_batch_tokens
+        ):
+            self.flush(key)
+        return await future
+
+    def flush(self, key: tuple[str, str]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.linger_handle is not None:
+            batch.linger_handle.cancel()
+        task = asyncio.create_task(self._send(key, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _send(self, key: tuple[str, str], batch: _PendingBatch) -> None:
+        model, phase = key
+        try:
+            result = await self._embed(model, batch.texts, phase)
+        except Exception as e:
+            for _, _, future in batch.callers:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Usage is reported per request, share it by the estimated tokens of each call
+        start = 0
+        for texts_num, tokens, future in batch.callers:
+            share = tokens / batch.tokens if batch.tokens else 0
+            if not future.done():
+                future.set_result(
+                    EmbeddingReturn(
+                        embedding=result.embedding[start : start + texts_num],
+                        prompt_tokens=round((result.prompt_tokens or 0) * share),
+                        total_tokens=round((result.total_tokens or 0) * share),
+                    )
+                )
+            start += texts_num
@@ -28,7 +28,7 @@ async def _delete_block_handler(
         )
     if block_index < 0 or block_index >= len(page_block.children):
         return Result.resolve(f"Block index {block_index} out of range")
-    r = await BN.get_block_by_sort(
+    r = await BN.get_block_by_index(
         ctx.db_session, ctx.space_id, page_block.id, block_index - 1
     )
     if not r.ok():
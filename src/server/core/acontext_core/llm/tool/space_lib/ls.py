@@ -25,9 +25,7 @@ async def _ls_handler(
     if path_block is not None and path_block.type != BLOCK_TYPE_FOLDER:
         return Result.resolve(f"Path {folder_path} is not a folder, can't be listed")
 
-    r = await BN.list_paths_under_block(
-        ctx.db_session,
-        ctx.space_id,
+    r = await ctx.list_paths(
         path_block.id if path_block is not None else None,
         path_prefix=folder_path,
         depth=depth,
@@ -35,7 +33,6 @@ async def _ls_handler(
     if not r.ok():
         return r
     path_caches, sub_page_num, sub_folder_num = r.data
-    ctx.path_2_block_ids.update(path_caches)
 
     repr_tree = repr_path_tree(path_caches)
     return Result.resolve(
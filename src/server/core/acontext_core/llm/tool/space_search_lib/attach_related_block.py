@@ -27,16 +27,16 @@ async def _attach_related_block_handler(
         return Result.resolve(
             f"Page {page_path} is not a page (type: {page_block.type})"
         )
-    r = await BN.get_block_by_sort(
+    r = await BN.get_block_by_index(
         ctx.db_session, ctx.space_id, page_block.id, block_index - 1
     )
     if not r.ok():
         return Result.resolve(f"Failed to find the block: {r.error}")
     block = r.data
-    r = await BR.render_content_block(ctx.db_session, ctx.space_id, block)
+    r = await BR.render_content_blocks(ctx.db_session, ctx.space_id, [block])
     if not r.ok():
         return Result.resolve(f"Failed to render the block: {r.error}")
-    rendered_block = r.data
+    rendered_block = r.data[0]
     ctx.located_content_blocks.append(
         LocatedContentBlock(
             path=page_path,
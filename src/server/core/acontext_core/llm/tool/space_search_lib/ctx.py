@@ -1,11 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
 from ....schema.block.path_node import PathNode
 from ....schema.block.general import LocatedContentBlock
+from ....schema.api.response import SpaceSearchUsage
 from ....schema.result import Result
 from ....infra.db import AsyncSession
 from ....schema.utils import asUUID
-from ....service.data import block_nav as BN
+from ....service.data import space_tree as ST
 
 
 @dataclass
@@ -17,21 +18,33 @@ class SpaceSearchCtx:
     located_content_blocks: list[LocatedContentBlock]
     path_2_block_ids: dict[str, PathNode | None]
     final_answer: Optional[str] = None
+    usage: SpaceSearchUsage = field(default_factory=SpaceSearchUsage)
 
     async def find_block(self, path: str) -> Result[PathNode]:
         if path in self.path_2_block_ids:
             return Result.resolve(self.path_2_block_ids[path])
-        r = await BN.find_block_by_path(self.db_session, self.space_id, path)
+        r = await ST.find_block(self.db_session, self.space_id, path)
         if not r.ok():
             return r
         self.path_2_block_ids[path] = r.data
         return Result.resolve(r.data)
 
     async def find_path_by_id(self, block_id: asUUID) -> Result[tuple[str, PathNode]]:
-        r = await BN.get_path_info_by_id(self.db_session, self.space_id, block_id)
+        r = await ST.find_path_by_id(self.db_session, self.space_id, block_id)
         if not r.ok():
             return r
         path, path_node = r.data
         # update path cache
         self.path_2_block_ids[path] = path_node
         return Result.resolve((path, path_node))
+
+    async def list_paths(
+        self, block_id: Optional[asUUID], path_prefix: str, depth: int
+    ) -> Result[tuple[dict[str, PathNode], int, int]]:
+        r = await ST.list_paths(
+            self.db_session, self.space_id, block_id, path_prefix, depth
+        )
+        if not r.ok():
+            return r
+        self.path_2_block_ids.update(r.data[0])
+        return r
@@ -48,27 +48,25 @@ async def _read_blocks_handler(
             f"Path {page_path} is not a page (type: {page_block.type})"
         )
 
-    # Read all content blocks from the page
-    r = await BN.read_blocks_from_par_id(
+    # Read the requested range of content blocks from the page
+    r = await BN.read_blocks_page_from_par_id(
         ctx.db_session,
         ctx.space_id,
         page_block.id,
+        offset=offset,
+        limit=limit,
     )
     if not r.ok():
         return r
 
-    all_blocks = r.data
-    total_blocks = len(all_blocks)
+    blocks_to_render, total_blocks = r.data
 
-    blocks_to_render = all_blocks[offset : offset + limit]
-
-    # Render each block
+    # Render the blocks in one batch
+    r = await BR.render_content_blocks(ctx.db_session, ctx.space_id, blocks_to_render)
+    if not r.ok():
+        return r
     rendered_blocks = []
-    for block in blocks_to_render:
-        r = await BR.render_content_block(ctx.db_session, ctx.space_id, block)
-        if not r.ok():
-            return r
-        rendered_block = r.data
+    for rendered_block in r.data:
         rendered_blocks.append(
             {
                 "block_index": rendered_block.order + 1,
@@ -33,12 +33,13 @@ async def _search_content_handler(
     if not r.ok():
         return r
     block_distances = r.data
+    r = await BR.render_content_blocks(
+        ctx.db_session, ctx.space_id, [b for b, _ in block_distances]
+    )
+    if not r.ok():
+        return r
     display_results = []
-    for b, d in block_distances:
-        r = await BR.render_content_block(ctx.db_session, ctx.space_id, b)
-        if not r.ok():
-            return r
-        content_block = r.data
+    for content_block in r.data:
         r = await ctx.find_path_by_id(content_block.parent_id)
         if not r.ok():
             return r
@@ -3,7 +3,8 @@ from typing import Literal, Any, Optional
 from ..utils import asUUID
 
 
-SearchMode = Literal["fast", "agentic"]
+SearchMode = Literal["fast", "hybrid", "agentic"]
+GrepMode = Literal["fast", "hybrid"]
 
 
 class ToolRename(BaseModel):
@@ -20,3 +21,26 @@ class InsertBlockRequest(BaseModel):
     props: dict[str, Any] = Field(..., description="Block properties")
     title: str = Field(..., description="Block title")
     type: str = Field(..., description="Block type")
+
+
+class BatchSearchRequest(BaseModel):
+    queries: list[str] = Field(
+        ..., min_length=1, max_length=32, description="Search queries"
+    )
+    target: Literal["content", "path"] = Field(
+        "content",
+        description="'content' to search content blocks like semantic_grep, 'path' for pages/folders like semantic_glob",
+    )
+    limit: int = Field(
+        10, ge=1, le=50, description="Maximum number of results per query"
+    )
+    threshold: Optional[float] = Field(
+        None,
+        ge=0.0,
+        le=2.0,
+        description="Cosine distance threshold (0=identical, 2=opposite). Uses config default if not specified",
+    )
+    dedupe: bool = Field(
+        False,
+        description="Return each block only once, under the query it matches best",
+    )
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from pydantic import BaseModel, Field
 from ..utils import asUUID
 
@@ -17,11 +17,50 @@ class SearchResultBlockItem(BaseModel):
     )
 
 
+class SpaceSearchUsage(BaseModel):
+    iterations: int = Field(0, description="LLM iterations run by the agent")
+    tokens: int = Field(0, description="LLM tokens spent, prompt and completion")
+    elapsed_ms: int = Field(0, description="Wall-clock time of the search")
+    fast_path: bool = Field(
+        False, description="Answered by the vector search, the agent did not run"
+    )
+    stop_reason: Optional[str] = Field(
+        None,
+        description="Why the search stopped: 'fast_path', 'finish', 'no_tool_calls', "
+        "'limit', 'max_iterations', 'latency_budget' or 'token_budget'",
+    )
+
+
 class SpaceSearchResult(BaseModel):
     cited_blocks: list[SearchResultBlockItem] = Field(..., description="Cited blocks")
     final_answer: Optional[str] = Field(
         ..., description="Final answer, not-null for 'agentic' mode."
     )
+    usage: Optional[SpaceSearchUsage] = Field(
+        None, description="Accounting of the agent, set for 'agentic' mode"
+    )
+
+
+class SpaceSearchEvent(BaseModel):
+    type: Literal["block", "thinking", "done", "error"] = Field(
+        ..., description="Event type, 'done' and 'error' end the stream"
+    )
+    block: Optional[SearchResultBlockItem] = Field(
+        None, description="Attached block, set for 'block' events"
+    )
+    thinking: Optional[str] = Field(
+        None, description="Reported thought, set for 'thinking' events"
+    )
+    result: Optional[SpaceSearchResult] = Field(
+        None, description="Whole search result, set for the 'done' event"
+    )
+    error: Optional[str] = Field(None, description="Set for the 'error' event")
+
+
+class BatchSearchResult(BaseModel):
+    results: list[list[SearchResultBlockItem]] = Field(
+        ..., description="Cited blocks of each query, in request order"
+    )
 
 
 class Flag(BaseModel):
@@ -40,3 +79,27 @@ class LearningStatusResponse(BaseModel):
     not_space_digested_count: int = Field(
         ..., description="Number of tasks that are not space digested"
     )
+
+
+class VectorIndexStatus(BaseModel):
+    name: str = Field(..., description="Index name")
+    group: str = Field(..., description="Block type group, 'path' or 'content'")
+    method: str = Field(..., description="Index method, 'hnsw' or 'ivfflat'")
+    exists: bool = Field(..., description="Whether the index exists")
+    valid: bool = Field(..., description="Whether the index is built and usable")
+    size_bytes: int = Field(..., description="On-disk size of the index")
+    build_phase: Optional[str] = Field(
+        ..., description="Phase of the running build, None when not building"
+    )
+    build_blocks_done: Optional[int] = None
+    build_blocks_total: Optional[int] = None
+    build_tuples_done: Optional[int] = None
+    build_tuples_total: Optional[int] = None
+    recall: Optional[float] = Field(
+        None, description="Estimated top-k recall, None when not sampled"
+    )
+
+
+class VectorIndexHealthResponse(BaseModel):
+    method: str = Field(..., description="Configured index method")
+    indexes: list[VectorIndexStatus] = Field(..., description="Managed indexes")
@@ -44,11 +44,56 @@ class CoreConfig(BaseModel):
     block_embedding_api_key: Optional[str] = None
     block_embedding_base_url: Optional[str] = None
     block_embedding_search_cosine_distance_threshold: float = 0.8
+    block_embedding_vector_index: Literal["hnsw", "ivfflat", "none"] = "hnsw"
+    block_embedding_hnsw_m: int = 16
+    block_embedding_hnsw_ef_construction: int = 64
+    block_embedding_hnsw_ef_search: Optional[int] = 100
+    block_embedding_ivfflat_lists: int = 100
+    block_embedding_ivfflat_probes: Optional[int] = 10
+    # pgvector >= 0.8, keeps scanning the index until the space filter is satisfied
+    block_embedding_iterative_scan: Literal["off", "strict_order", "relaxed_order"] = (
+        "relaxed_order"
+    )
+    block_embedding_coalesce_linger_ms: int = 5
+    block_embedding_max_batch_size: int = 256
+    block_embedding_max_batch_tokens: int = 100_000
+    block_embedding_deferred: bool = False
+    block_embedding_deferred_max_batch_size: int = 32
+    block_embedding_deferred_max_batch_linger_ms: int = 200
+    # periodic requeue of blocks left pending: runs once per interval across replicas,
+    # blocks changed more recently are assumed to be still queued
+    block_embedding_requeue_interval_seconds: int = 600
+    block_embedding_requeue_min_age_seconds: int = 300
+    block_search_include_pending: bool = False
+    # embedding rows read per requested block, covers blocks with several embeddings
+    block_search_overfetch: int = 4
+    block_search_rrf_k: int = 60
+    query_embedding_cache_enabled: bool = True
+    query_embedding_cache_max_size: int = 4096
+    query_embedding_cache_ttl_seconds: int = 3600
+    query_embedding_cache_redis: bool = False
+    search_result_cache_enabled: bool = True
+    search_result_cache_max_size: int = 2048
+    search_result_cache_ttl_seconds: int = 300
+    search_result_cache_redis: bool = True
+    space_tree_cache_max_size: int = 256
+    space_tree_cache_ttl_seconds: int = 600
+    block_vector_index_enabled: bool = False
+    block_vector_index_max_bytes: int = 256 * 1024 * 1024
+    block_vector_index_hnsw_min_rows: int = 20000
+    block_vector_index_hnsw_ef_search: int = 128
 
     # Core Configuration
     logging_format: str = "text"
     session_message_session_lock_wait_seconds: int = 1
     session_message_processing_timeout_seconds: int = 60
+    session_message_insert_max_batch_size: int = 32
+    session_message_insert_max_batch_linger_ms: int = 50
+    session_message_notify_coalesce_ttl_seconds: int = 600
+    # project configs are written outside of this service, a cached config is
+    # refreshed only once its TTL expires
+    project_config_cache_max_size: int = 1024
+    project_config_cache_ttl_seconds: int = 300
     space_task_sop_lock_wait_seconds: int = 1
 
     # MQ Configuration
@@ -68,6 +113,8 @@ class CoreConfig(BaseModel):
     mq_default_dlx_ttl_days: int = 7
     mq_default_max_retries: int = 1
     mq_default_retry_delay_unit_sec: float = 1.0
+    mq_delayed_publish_poll_interval_seconds: float = 0.5
+    mq_delayed_publish_batch_size: int = 256
 
     # Database Configuration
     database_pool_size: int = 64
@@ -87,6 +134,10 @@ class CoreConfig(BaseModel):
     s3_max_pool_connections: int = 32
     s3_connection_timeout: float = 60.0
     s3_read_timeout: float = 60.0
+    s3_fetch_max_concurrency: int = 16
+    message_parts_memory_cache_max_bytes: int = 64 * 1024 * 1024
+    message_parts_disk_cache_dir: Optional[str] = None  # disabled when unset
+    message_parts_disk_cache_max_bytes: int = 1024 * 1024 * 1024
 
     # otel
     otel_exporter_otlp_endpoint: str = "http://localhost:4317"
@@ -6,3 +6,8 @@ class NewTaskComplete(BaseModel):
     project_id: asUUID
     session_id: asUUID
     task_id: asUUID
+
+
+class EmbedBlock(BaseModel):
+    space_id: asUUID
+    block_id: asUUID
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from sqlalchemy import (
+    text,
     String,
     ForeignKey,
     Index,
@@ -71,6 +72,15 @@ BLOCK_PARENT_ALLOW = {
 }
 
 
+# Full-text document of a block for lexical search, the query must use the same
+# expression to be served by idx_blocks_search_document
+BLOCK_SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, title || ' ' || "
+    "coalesce(props ->> 'view_when', '') || ' ' || "
+    "coalesce(props ->> 'preferences', ''))"
+)
+
+
 def is_valid_block_type(block_type: str) -> bool:
     """Check if the given type is valid"""
     return block_type in BLOCK_TYPES
@@ -99,6 +109,11 @@ class Block(CommonMixin):
         Index("idx_blocks_space_type", "space_id", "type"),
         Index("idx_blocks_space_title", "space_id", "title"),
         Index("idx_blocks_space_type_archived", "space_id", "type", "is_archived"),
+        Index(
+            "idx_blocks_search_document",
+            text(BLOCK_SEARCH_DOCUMENT),
+            postgresql_using="gin",
+        ),
         # Unique constraint for space, parent, sort combination
         Index(
             "ux_blocks_space_parent_sort", "space_id", "parent_id", "sort", unique=True
@@ -185,6 +200,19 @@ class Block(CommonMixin):
         },
     )
 
+    # Set while the embedding of a new block is queued, see `block_embedding_deferred`
+    embedding_pending: bool = field(
+        default=False,
+        metadata={
+            "db": Column(
+                Boolean,
+                nullable=False,
+                default=False,
+                server_default="false",
+            )
+        },
+    )
+
     # Relationships
     space: "Space" = field(
         init=False,
@@ -1,7 +1,7 @@
 import numpy as np
 from dataclasses import dataclass, field
 from sqlalchemy import String, ForeignKey, Index, Column, Integer, text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, AsyncConnection
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from pgvector.sqlalchemy import Vector
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Optional, List, Type
 
 from ...env import DEFAULT_CORE_CONFIG, LOG
 from .base import ORM_BASE, CommonMixin
+from .block import PATH_BLOCK, CONTENT_BLOCK
 from ..utils import asUUID
 
 if TYPE_CHECKING:
@@ -30,8 +31,8 @@ class BlockEmbedding(CommonMixin):
         # Indexes for efficient queries
         Index("idx_block_embeddings_space", "space_id"),
         Index("idx_block_embeddings_space_type", "space_id", "block_type"),
-        # Vector similarity search index (using IVFFlat or HNSW)
-        # You can add this via migration: CREATE INDEX ON block_embeddings USING ivfflat (embedding vector_cosine_ops);
+        # Vector similarity search indexes are partial per block type group,
+        # built concurrently at startup, see `ensure_vector_indexes`
     )
 
     block_id: asUUID = field(
@@ -155,3 +156,148 @@ async def check_legal_embedding_dim(
     except Exception as e:
         LOG.warning(f"Failed to check embedding dimension: {str(e)}")
         raise e
+
+
+# pgvector can't index `vector` columns above 2000 dimensions
+VECTOR_INDEX_MAX_DIM = 2000
+VECTOR_INDEX_GROUPS = {"path": PATH_BLOCK, "content": CONTENT_BLOCK}
+
+
+def vector_index_name(group: str, method: str) -> str:
+    return f"idx_block_embeddings_{group}_{method}"
+
+
+def vector_index_ddl(cls: Type[BlockEmbedding], group: str, method: str) -> str:
+    if method == "hnsw":
+        params = (
+            f"m = {int(DEFAULT_CORE_CONFIG.block_embedding_hnsw_m)}, "
+            f"ef_construction = {int(DEFAULT_CORE_CONFIG.block_embedding_hnsw_ef_construction)}"
+        )
+    else:
+        params = f"lists = {int(DEFAULT_CORE_CONFIG.block_embedding_ivfflat_lists)}"
+    block_types = ", ".join(f"'{t}'" for t in sorted(VECTOR_INDEX_GROUPS[group]))
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {vector_index_name(group, method)} "
+        f"ON {cls.__tablename__} USING {method} (embedding vector_cosine_ops) "
+        f"WITH ({params}) WHERE block_type IN ({block_types})"
+    )
+
+
+async def fetch_vector_index_status(
+    cls: Type[BlockEmbedding], session: AsyncSession | AsyncConnection
+) -> List[dict]:
+    """
+    Status of the managed vector indexes of the configured method: whether they exist
+    and are valid, their size, and the progress of a running build.
+    """
+    method = DEFAULT_CORE_CONFIG.block_embedding_vector_index
+    if method == "none":
+        return []
+    names = [vector_index_name(group, method) for group in VECTOR_INDEX_GROUPS]
+    sql = text("""
+    SELECT c.relname AS name,
+           i.indisvalid AS valid,
+           pg_relation_size(c.oid) AS size_bytes,
+           p.phase AS build_phase,
+           p.blocks_done AS build_blocks_done,
+           p.blocks_total AS build_blocks_total,
+           p.tuples_done AS build_tuples_done,
+           p.tuples_total AS build_tuples_total
+    FROM pg_class c
+    JOIN pg_index i ON i.indexrelid = c.oid
+    JOIN pg_namespace n ON c.relnamespace = n.oid
+    LEFT JOIN pg_stat_progress_create_index p ON p.index_relid = c.oid
+    WHERE c.relname = ANY(:names)
+    AND n.nspname = current_schema();
+    """)
+    result = await session.execute(sql, {"names": names})
+    found = {row["name"]: dict(row) for row in result.mappings().all()}
+    return [
+        found.get(
+            name,
+            {
+                "name": name,
+                "valid": False,
+                "size_bytes": 0,
+                "build_phase": None,
+                "build_blocks_done": None,
+                "build_blocks_total": None,
+                "build_tuples_done": None,
+                "build_tuples_total": None,
+            },
+        )
+        | {"group": group, "method": method, "exists": name in found}
+        for group, name in zip(VECTOR_INDEX_GROUPS, names)
+    ]
+
+
+async def ensure_vector_indexes(cls: Type[BlockEmbedding], engine: AsyncEngine):
+    """
+    Build the missing partial vector indexes of the configured method.
+
+    Indexes are built with CREATE INDEX CONCURRENTLY so writes are not blocked,
+    an index left invalid by an interrupted build is dropped and rebuilt.
+    Builds already running on another replica are left alone.
+    """
+    method = DEFAULT_CORE_CONFIG.block_embedding_vector_index
+    if method == "none":
+        return
+    if DEFAULT_CORE_CONFIG.block_embedding_dim > VECTOR_INDEX_MAX_DIM:
+        LOG.warning(
+            f"Embedding dimension {DEFAULT_CORE_CONFIG.block_embedding_dim} is above "
+            f"{VECTOR_INDEX_MAX_DIM}, {method} indexes can't be built"
+        )
+        return
+    # CONCURRENTLY can't run inside a transaction block
+    autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+    for group in VECTOR_INDEX_GROUPS:
+        name = vector_index_name(group, method)
+        async with autocommit_engine.connect() as conn:
+            status = next(
+                s
+                for s in await fetch_vector_index_status(cls, conn)
+                if s["name"] == name
+            )
+            if status["valid"] or status["build_phase"] is not None:
+                continue
+            if status["exists"]:
+                LOG.warning(f"Vector index {name} is invalid, rebuilding")
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            LOG.info(f"Building vector index {name}")
+            await conn.execute(text(vector_index_ddl(cls, group, method)))
+            LOG.info(f"Vector index {name} built")
+
+
+def vector_search_settings() -> List[str]:
+    """
+    SET LOCAL statements for the configured ef_search/probes and iterative scan.
+
+    The partial indexes are shared by every space, the `space_id` filter is applied
+    to the rows they return. An iterative scan keeps reading the index until the
+    LIMIT is filled instead of stopping after ef_search/probes rows.
+    """
+    method = DEFAULT_CORE_CONFIG.block_embedding_vector_index
+    iterative_scan = DEFAULT_CORE_CONFIG.block_embedding_iterative_scan
+    settings = []
+    if method == "hnsw":
+        if DEFAULT_CORE_CONFIG.block_embedding_hnsw_ef_search:
+            settings.append(
+                f"SET LOCAL hnsw.ef_search = {int(DEFAULT_CORE_CONFIG.block_embedding_hnsw_ef_search)}"
+            )
+        if iterative_scan != "off":
+            settings.append(f"SET LOCAL hnsw.iterative_scan = {iterative_scan}")
+    elif method == "ivfflat":
+        if DEFAULT_CORE_CONFIG.block_embedding_ivfflat_probes:
+            settings.append(
+                f"SET LOCAL ivfflat.probes = {int(DEFAULT_CORE_CONFIG.block_embedding_ivfflat_probes)}"
+            )
+        if iterative_scan != "off":
+            # ivfflat only supports relaxed ordering
+            settings.append("SET LOCAL ivfflat.iterative_scan = relaxed_order")
+    return settings
+
+
+async def set_vector_search_params(session: AsyncSession):
+    """Apply the configured vector search settings to the current transaction"""
+    for setting in vector_search_settings():
+        await session.execute(text(setting))
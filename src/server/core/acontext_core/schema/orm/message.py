@@ -88,6 +88,11 @@ class Message(CommonMixin):
 
     parts: Optional[List[Part]] = field(default=None)
 
+    # Small parts are stored inline instead of S3 (matches Go's PartsInline field)
+    parts_inline: Optional[list] = field(
+        default=None, metadata={"db": Column(JSONB, nullable=True)}
+    )
+
     parent_id: Optional[asUUID] = field(
         default=None,
         metadata={
@@ -1,3 +1,4 @@
 from . import session_message  # noqa: F401
 from . import space_receive_sop  # noqa: F401
 from . import digest_task_to_sop  # noqa: F401
+from . import block_embedding  # noqa: F401
@@ -0,0 +1,110 @@
+import asyncio
+from typing import List
+from ..env import LOG, DEFAULT_CORE_CONFIG
+from ..infra.db import DB_CLIENT
+from ..infra.redis import REDIS_CLIENT
+from ..infra.async_mq import (
+    register_consumer,
+    MQ_CLIENT,
+    Message,
+    ConsumerConfigData,
+)
+from ..llm.embeddings import get_embedding
+from ..schema.mq.space import EmbedBlock
+from .constants import EX, RK
+from .data import block as BD
+
+
+@register_consumer(
+    mq_client=MQ_CLIENT,
+    config=ConsumerConfigData(
+        exchange_name=EX.space_block,
+        routing_key=RK.space_block_embed,
+        queue_name=RK.space_block_embed,
+        max_batch_size=DEFAULT_CORE_CONFIG.block_embedding_deferred_max_batch_size,
+        max_batch_linger_ms=DEFAULT_CORE_CONFIG.block_embedding_deferred_max_batch_linger_ms,
+    ),
+)
+async def embed_pending_blocks(bodies: List[EmbedBlock], messages: List[Message]):
+    """
+    MQ Consumer for deferred block embeddings - embed a batch of pending blocks
+    with one embedding call, outside of any DB transaction
+    """
+    block_ids = list({body.block_id for body in bodies})
+    async with DB_CLIENT.get_session_context() as db_session:
+        r = await BD.fetch_pending_embedding_blocks(db_session, block_ids)
+        blocks, eil = r.unpack()
+        if eil:
+            raise RuntimeError(f"Failed to fetch pending blocks: {eil}")
+    if not blocks:
+        return
+
+    r = await get_embedding([BD.block_embedding_content(block) for block in blocks])
+    if not r.ok():
+        # retried by the consumer, then dead-lettered; blocks stay pending
+        raise RuntimeError(f"Failed to embed pending blocks: {r.error}")
+
+    async with DB_CLIENT.get_session_context() as db_session:
+        r = await BD.write_pending_block_embeddings(
+            db_session, blocks, r.data.embedding
+        )
+        written, eil = r.unpack()
+        if eil:
+            raise RuntimeError(f"Failed to write block embeddings: {eil}")
+    LOG.info(f"Embedded {len(written)}/{len(block_ids)} pending blocks")
+
+
+_REQUEUE_LOCK_KEY = "lock.block_embedding.requeue"
+
+
+async def requeue_pending_block_embeddings(limit: int = 10000) -> None:
+    """
+    Queue blocks left pending, e.g. when the process died before publishing or the
+    publish was lost. Only one replica requeues per interval.
+    """
+    if not DEFAULT_CORE_CONFIG.block_embedding_deferred:
+        return
+    try:
+        async with REDIS_CLIENT.get_client_context() as client:
+            acquired = await client.set(
+                _REQUEUE_LOCK_KEY,
+                "1",
+                nx=True,
+                ex=DEFAULT_CORE_CONFIG.block_embedding_requeue_interval_seconds,
+            )
+        if not acquired:
+            LOG.debug("Pending block embeddings were requeued recently, skip")
+            return
+        async with DB_CLIENT.get_session_context() as db_session:
+            r = await BD.fetch_pending_embedding_blocks(
+                db_session,
+                limit=limit,
+                min_age_seconds=DEFAULT_CORE_CONFIG.block_embedding_requeue_min_age_seconds,
+            )
+            blocks, eil = r.unpack()
+            if eil:
+                LOG.error(f"Failed to fetch pending blocks: {eil}")
+                return
+        for block in blocks:
+            await MQ_CLIENT.publish(
+                exchange_name=EX.space_block,
+                routing_key=RK.space_block_embed,
+                body=EmbedBlock(
+                    space_id=block.space_id, block_id=block.id
+                ).model_dump_json(),
+            )
+        if blocks:
+            LOG.info(f"Requeued {len(blocks)} pending block embeddings")
+    except Exception as e:
+        LOG.error(f"Failed to requeue pending block embeddings: {e}")
+
+
+async def sweep_pending_block_embeddings() -> None:
+    """Run until cancelled, requeueing blocks left pending once per interval"""
+    if not DEFAULT_CORE_CONFIG.block_embedding_deferred:
+        return
+    while True:
+        await requeue_pending_block_embeddings()
+        await asyncio.sleep(
+            DEFAULT_CORE_CONFIG.block_embedding_requeue_interval_seconds
+        )
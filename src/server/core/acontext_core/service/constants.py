@@ -1,6 +1,7 @@
 class EX:
     session_message = "session.message"
     space_task = "space.task"
+    space_block = "space.block"
 
 
 class RK:
@@ -8,6 +9,8 @@ class RK:
     space_task_sop_complete = "space.task.sop.complete"
     space_task_sop_complete_retry = "space.task.sop.complete.retry"
 
+    space_block_embed = "space.block.embed"
+
     session_message_insert = "session.message.insert"
     session_message_insert_retry = "session.message.insert.retry"
     session_message_buffer_process = "session.message.buffer.process"
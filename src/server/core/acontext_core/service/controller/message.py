@@ -1,5 +1,6 @@
 from ..data import message as MD
 from ...infra.db import DB_CLIENT
+from ...infra.s3 import FetchPriority
 from ...schema.session.task import TaskStatus
 from ...schema.session.message import MessageBlob
 from ...schema.utils import asUUID
@@ -10,7 +11,10 @@ from ...schema.config import ProjectConfig
 
 
 async def process_session_pending_message(
-    project_config: ProjectConfig, project_id: asUUID, session_id: asUUID
+    project_config: ProjectConfig,
+    project_id: asUUID,
+    session_id: asUUID,
+    priority: FetchPriority = FetchPriority.NORMAL,
 ) -> Result[None]:
     pending_message_ids = None
     try:
@@ -35,7 +39,9 @@ async def process_session_pending_message(
         LOG.info(f"Unpending {len(pending_message_ids)} session messages to process")
 
         async with DB_CLIENT.get_session_context() as session:
-            r = await MD.fetch_messages_data_by_ids(session, pending_message_ids)
+            r = await MD.fetch_messages_data_by_ids(
+                session, pending_message_ids, priority
+            )
             messages, eil = r.unpack()
             if eil:
                 return r
@@ -45,6 +51,7 @@ async def process_session_pending_message(
                 session_id,
                 messages[0].created_at,
                 limit=project_config.project_session_message_use_previous_messages_turns,
+                priority=priority,
             )
             messages_data = [
                 MessageBlob(
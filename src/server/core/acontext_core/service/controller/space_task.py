@@ -1,5 +1,6 @@
 from ..data import message as MD
 from ...infra.db import DB_CLIENT
+from ...infra.s3 import FetchPriority
 from ...schema.session.task import TaskStatus
 from ...schema.session.message import MessageBlob
 from ...schema.utils import asUUID
@@ -24,7 +25,9 @@ async def process_space_task(
     async with DB_CLIENT.get_session_context() as db_session:
         # 1. fetch messages from task
         msg_ids = task.raw_message_ids
-        r = await MD.fetch_messages_data_by_ids(db_session, msg_ids)
+        r = await MD.fetch_messages_data_by_ids(
+            db_session, msg_ids, priority=FetchPriority.LOW
+        )
         if not r.ok():
             return
         messages, _ = r.unpack()
@@ -1,19 +1,36 @@
+import numpy as np
+from datetime import timedelta
 from typing import List, Optional
-from sqlalchemy import select, update, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.ext.asyncio import AsyncSession
+from ...env import DEFAULT_CORE_CONFIG
+from ...infra.db import add_post_commit_hook
+from ...infra.async_mq import MQ_CLIENT
 from ...llm.embeddings import get_embedding
+from ...schema.mq.space import EmbedBlock
 from ...schema.orm.block import (
     BLOCK_TYPE_FOLDER,
     BLOCK_TYPE_ROOT,
     BLOCK_TYPE_PAGE,
+    BLOCK_TYPE_SOP,
     BLOCK_PARENT_ALLOW,
 )
 from ...schema.orm import Block, BlockEmbedding
 from ...schema.utils import asUUID
 from ...schema.result import Result
-from .block_nav import assert_block_type, _normalize_path_block_title
+from .block_nav import (
+    assert_block_type,
+    fetch_block_ancestors,
+    _normalize_path_block_title,
+)
+from .space_tree import mark_space_changed
+from ..constants import EX, RK
+
+# Siblings are appended SORT_GAP apart, so a block can be inserted between two
+# siblings without renumbering the ones after it
+SORT_GAP = 1 << 16
 
 
 async def _find_block_sort(
@@ -39,7 +56,7 @@ async def _find_block_sort(
             f"Parent block {par_block_id}(type {parent_type}) is not allowed to have children of type {block_type}"
         )
     next_sort_query = (
-        select(func.coalesce(func.max(Block.sort), -1) + 1)
+        select(func.coalesce(func.max(Block.sort), 0) + SORT_GAP)
         .where(Block.space_id == space_id)
         .where(Block.parent_id == par_block_id)
     )
@@ -50,24 +67,72 @@ async def _find_block_sort(
     return Result.resolve(next_sort)
 
 
-async def update_block_children_sort_by_delta(
+async def rebalance_block_children_sort(
     db_session: AsyncSession,
     space_id: asUUID,
     block_id: Optional[asUUID],
-    gt_sort: int,
-    delta: int = 1,
 ) -> Result[None]:
-    query = (
+    """Spread the children sorts of a block SORT_GAP apart again, keeping their order"""
+    ranked = (
+        select(
+            Block.id,
+            func.row_number().over(order_by=Block.sort).label("position"),
+        )
+        .where(Block.space_id == space_id)
+        .where(Block.parent_id == block_id)
+        .subquery()
+    )
+    # Park the children on negative sorts first, so no two siblings share a sort
+    # while they are renumbered under ux_blocks_space_parent_sort
+    await db_session.execute(
+        update(Block).where(Block.id == ranked.c.id).values(sort=-ranked.c.position)
+    )
+    await db_session.execute(
         update(Block)
         .where(Block.space_id == space_id)
         .where(Block.parent_id == block_id)
-        .where(Block.sort > gt_sort)
-        .values(sort=Block.sort + delta)
+        .where(Block.sort < 0)
+        .values(sort=-Block.sort * SORT_GAP)
     )
-    await db_session.execute(query)
     return Result.resolve(None)
 
 
+async def _find_block_sort_at_index(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    par_block_id: asUUID,
+    block_index: int,
+) -> Result[int]:
+    """
+    Find a sort that places a new child at position `block_index` (0-based) without
+    touching its siblings. The children are rebalanced once the gap is exhausted.
+    """
+    for _ in range(2):
+        query = (
+            select(Block.sort)
+            .where(Block.space_id == space_id)
+            .where(Block.parent_id == par_block_id)
+            .order_by(Block.sort)
+            .offset(max(block_index - 1, 0))
+            .limit(2 if block_index > 0 else 1)
+        )
+        result = await db_session.execute(query)
+        sorts = list(result.scalars().all())
+        if block_index == 0:
+            sorts.insert(0, 0)
+        if not sorts:
+            return Result.reject(f"block_index {block_index} is out of range")
+        if len(sorts) == 1:
+            return Result.resolve(sorts[0] + SORT_GAP)
+        prev_sort, next_sort = sorts
+        if next_sort - prev_sort > 1:
+            return Result.resolve((prev_sort + next_sort) // 2)
+        r = await rebalance_block_children_sort(db_session, space_id, par_block_id)
+        if not r.ok():
+            return r
+    return Result.reject(f"Failed to find a sort at index {block_index}")
+
+
 async def create_new_block_embedding(
     db_session: AsyncSession,
     block: Block,
@@ -91,6 +156,112 @@ async def create_new_block_embedding(
     return Result.resolve(new_embedding)
 
 
+def block_embedding_content(block: Block) -> str:
+    if block.type == BLOCK_TYPE_SOP:
+        # title of a sop block is its use_when
+        return block.title
+    content = block.title
+    if "view_when" in block.props:
+        content += " " + block.props["view_when"]
+    return content.strip()
+
+
+async def embed_new_block(db_session: AsyncSession, block: Block) -> Result[None]:
+    """
+    Embed a new block in this transaction, or when `block_embedding_deferred` is set,
+    mark it pending and queue it once the transaction commits.
+    """
+    if not DEFAULT_CORE_CONFIG.block_embedding_deferred:
+        r = await create_new_block_embedding(
+            db_session, block, block_embedding_content(block)
+        )
+        if not r.ok():
+            return r
+        return Result.resolve(None)
+
+    block.embedding_pending = True
+    await db_session.flush()
+    body = EmbedBlock(space_id=block.space_id, block_id=block.id)
+    add_post_commit_hook(
+        db_session,
+        (RK.space_block_embed, block.id),
+        lambda: MQ_CLIENT.publish(
+            exchange_name=EX.space_block,
+            routing_key=RK.space_block_embed,
+            body=body.model_dump_json(),
+        ),
+    )
+    return Result.resolve(None)
+
+
+async def fetch_pending_embedding_blocks(
+    db_session: AsyncSession,
+    block_ids: Optional[List[asUUID]] = None,
+    limit: int = 0,
+    min_age_seconds: int = 0,
+) -> Result[List[Block]]:
+    """
+    Pending blocks among `block_ids`, or the oldest pending blocks up to `limit`
+    left unchanged for at least `min_age_seconds`
+    """
+    query = select(Block).where(Block.embedding_pending == True)  # noqa: E712
+    if block_ids is not None:
+        query = query.where(Block.id.in_(block_ids))
+    else:
+        if min_age_seconds > 0:
+            query = query.where(
+                Block.updated_at < func.now() - timedelta(seconds=min_age_seconds)
+            )
+        query = query.order_by(Block.created_at).limit(limit)
+    result = await db_session.execute(query)
+    return Result.resolve(list(result.scalars().all()))
+
+
+async def write_pending_block_embeddings(
+    db_session: AsyncSession,
+    blocks: List[Block],
+    embeddings: np.ndarray,
+) -> Result[List[asUUID]]:
+    """
+    Store the embeddings of pending blocks in bulk and clear their pending flag.
+    Blocks deleted or already embedded meanwhile are skipped.
+    """
+    query = (
+        select(Block.id)
+        .where(Block.id.in_([block.id for block in blocks]))
+        .where(Block.embedding_pending == True)  # noqa: E712
+        .with_for_update()
+    )
+    result = await db_session.execute(query)
+    still_pending = set(result.scalars().all())
+    written = [
+        (block, embedding)
+        for block, embedding in zip(blocks, embeddings)
+        if block.id in still_pending
+    ]
+    if not written:
+        return Result.resolve([])
+    db_session.add_all(
+        [
+            BlockEmbedding(
+                block_id=block.id,
+                space_id=block.space_id,
+                block_type=block.type,
+                embedding=embedding,
+            )
+            for block, embedding in written
+        ]
+    )
+    await db_session.execute(
+        update(Block)
+        .where(Block.id.in_(list(still_pending)))
+        .values(embedding_pending=False)
+    )
+    for space_id in {block.space_id for block, _ in written}:
+        mark_space_changed(db_session, space_id)
+    return Result.resolve([block.id for block, _ in written])
+
+
 async def create_new_path_block(
     db_session: AsyncSession,
     space_id: asUUID,
@@ -118,12 +289,10 @@ async def create_new_path_block(
         return r
     db_session.add(new_block)
     await db_session.flush()
+    mark_space_changed(db_session, space_id)
 
     # add embedding for path block
-    index_content = title
-    if "view_when" in props:
-        index_content += " " + props["view_when"]
-    r = await create_new_block_embedding(db_session, new_block, index_content.strip())
+    r = await embed_new_block(db_session, new_block)
     if not r.ok():
         return r
     return Result.resolve(new_block)
@@ -134,16 +303,10 @@ async def find_all_parent_ids(
 ) -> Result[List[asUUID]]:
     if block_id is None:
         return Result.resolve([])
-    parent_ids: List[asUUID] = [block_id]
-    while block_id is not None:
-        query = select(Block.parent_id).where(
-            Block.space_id == space_id, Block.id == block_id
-        )
-        result = await db_session.execute(query)
-        block = result.mappings().one_or_none()
-        parent_ids.append(block["parent_id"])
-        block_id = block["parent_id"]
-    return Result.resolve(parent_ids)
+    r = await fetch_block_ancestors(db_session, space_id, block_id)
+    if not r.ok():
+        return r
+    return Result.resolve([row["id"] for row in r.data] + [None])
 
 
 async def move_path_block_to_new_parent(
@@ -179,21 +342,13 @@ async def move_path_block_to_new_parent(
     if not r.ok():
         return r
 
-    before_par_block_id = path_block.parent_id
-    before_sort = path_block.sort
     next_sort = r.data
     path_block.parent_id = new_par_block_id
     path_block.sort = next_sort
     flag_modified(path_block, "parent_id")
     flag_modified(path_block, "sort")
     await db_session.flush()
-    # update the before parent block's children sort
-    r = await update_block_children_sort_by_delta(
-        db_session, space_id, before_par_block_id, before_sort - 1, delta=-1
-    )
-    if not r.ok():
-        return r
-    await db_session.flush()
+    mark_space_changed(db_session, space_id)
     return Result.resolve(path_block)
 
 
@@ -219,6 +374,7 @@ async def update_block(
         block.props.update(patch_props)
         flag_modified(block, "props")
     await db_session.flush()
+    mark_space_changed(db_session, space_id)
     return Result.resolve(block)
 
 
@@ -228,54 +384,28 @@ async def delete_block_recursively(
     block_id: asUUID,
 ) -> Result[None]:
     """
-    Recursively delete a block and all its children.
-    This function will:
-    1. Verify the block exists and belongs to the space
-    2. Recursively delete all children blocks
-    3. Delete the block itself (cascading to embeddings and tool_sops)
-    4. Adjust the sort order of sibling blocks
+    Delete a block and all its descendants in a single statement.
+    The subtree is collected by a recursive CTE, BlockEmbeddings and ToolSOP entries
+    of every deleted block go with it through their ON DELETE CASCADE foreign keys.
+    Sibling blocks keep their sorts, the order is unchanged by the gap.
     """
-    # Fetch the block with its children eagerly loaded
-    query = (
-        select(Block)
+    subtree = (
+        select(Block.id)
         .where(Block.id == block_id)
         .where(Block.space_id == space_id)
-        .options(selectinload(Block.children))
+        .cte("subtree", recursive=True)
     )
-    result = await db_session.execute(query)
-    block = result.scalar_one_or_none()
-
-    if block is None:
-        return Result.reject(f"Block {block_id} not found in space {space_id}")
-
-    # Store parent_id and sort for later sibling adjustment
-    parent_id = block.parent_id
-    block_sort = block.sort
-
-    # Recursively delete all children
-    # We need to collect child IDs first to avoid issues with the children collection being modified
-    # Note: We must delete sequentially because all operations share the same db session
-    child_ids = [child.id for child in block.children]
-    for child_id in child_ids:
-        r = await delete_block_recursively(db_session, space_id, child_id)
-        if not r.ok():
-            return r
-
-    # Clear the children collection to prevent cascade from trying to delete already-deleted children
-    block.children = []
-
-    # Delete the block itself
-    # This will cascade delete:
-    # - BlockEmbeddings (cascade="all, delete-orphan")
-    # - ToolSOP entries (cascade="all, delete-orphan")
-    await db_session.delete(block)
-    await db_session.flush()
-
-    # Adjust the sort order of sibling blocks that come after this one
-    r = await update_block_children_sort_by_delta(
-        db_session, space_id, parent_id, block_sort - 1, delta=-1
+    child = aliased(Block)
+    subtree = subtree.union_all(
+        select(child.id).where(
+            child.space_id == space_id, child.parent_id == subtree.c.id
+        )
     )
-    if not r.ok():
-        return r
-
+    result = await db_session.execute(
+        delete(Block).where(Block.id.in_(select(subtree.c.id))).returning(Block.id)
+    )
+    deleted_ids = result.scalars().all()
+    if not deleted_ids:
+        return Result.reject(f"Block {block_id} not found in space {space_id}")
+    mark_space_changed(db_session, space_id)
     return Result.resolve(None)
@@ -1,6 +1,8 @@
 from typing import List, Optional
-from sqlalchemy import select
+from sqlalchemy import select, literal, func
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from ...schema.orm.block import (
     BLOCK_TYPE_FOLDER,
     BLOCK_TYPE_PAGE,
@@ -72,28 +74,64 @@ async def fetch_path_children_by_id(
     return Result.resolve(blocks)
 
 
-async def list_paths_under_block(
+async def fetch_path_subtree(
     db_session: AsyncSession,
     space_id: asUUID,
-    block_id: Optional[asUUID] = None,
-    path_prefix: str = "",
-    depth: int = 0,
-) -> Result[tuple[dict[str, PathNode], int, int]]:
-    if path_prefix and not path_prefix.endswith("/"):
-        path_prefix += "/"
-    # 2. list all page and folder block
-    r = await fetch_path_children_by_id(db_session, space_id, block_id)
-    if not r.ok():
-        return r
-    blocks = r.data
+    block_id: Optional[asUUID],
+    max_level: int,
+) -> Result[List[dict]]:
+    """
+    Fetch the folder/page blocks up to `max_level` levels under `block_id` in one
+    `WITH RECURSIVE` query. A non-root `block_id` is returned as the level-0 row.
+    """
+    path_types = [BLOCK_TYPE_FOLDER, BLOCK_TYPE_PAGE]
+    columns = (Block.id, Block.parent_id, Block.title, Block.type, Block.props)
+    if block_id is None:
+        anchor = select(*columns, literal(1).label("level")).where(
+            Block.space_id == space_id,
+            Block.parent_id.is_(None),
+            Block.type.in_(path_types),
+        )
+    else:
+        anchor = select(*columns, literal(0).label("level")).where(
+            Block.space_id == space_id, Block.id == block_id
+        )
+    tree = anchor.cte("path_tree", recursive=True)
+    child = aliased(Block)
+    tree = tree.union_all(
+        select(
+            child.id,
+            child.parent_id,
+            child.title,
+            child.type,
+            child.props,
+            (tree.c.level + 1).label("level"),
+        )
+        .join(tree, child.parent_id == tree.c.id)
+        .where(
+            child.space_id == space_id,
+            child.type.in_(path_types),
+            tree.c.type == BLOCK_TYPE_FOLDER,
+            tree.c.level < max_level,
+        )
+    )
+    result = await db_session.execute(select(tree).order_by(tree.c.level))
+    return Result.resolve([dict(row) for row in result.mappings().all()])
+
 
-    path_dict: dict[str, asUUID] = {}
+def _assemble_path_tree(
+    children: dict[Optional[asUUID], List[dict]],
+    block_id: Optional[asUUID],
+    path_prefix: str,
+    depth: int,
+) -> tuple[dict[str, PathNode], int, int]:
+    blocks = children.get(block_id, [])
+    path_dict: dict[str, PathNode] = {}
     sub_page_num = sum([1 for block in blocks if block["type"] == BLOCK_TYPE_PAGE])
     sub_folder_num = sum([1 for block in blocks if block["type"] == BLOCK_TYPE_FOLDER])
     if depth < 0:
         # don't list acutally path, only return some static information
-        return Result.resolve((path_dict, sub_page_num, sub_folder_num))
-    # 3. build path dictionary
+        return path_dict, sub_page_num, sub_folder_num
     for block in blocks:
         if block["type"] == BLOCK_TYPE_PAGE:
             path_dict[f"{path_prefix}{block['title']}"] = PathNode(
@@ -102,31 +140,86 @@ async def list_paths_under_block(
                 type=block["type"],
                 props=block["props"],
             )
-        # Recursively fetch paths for folder blocks
         elif block["type"] == BLOCK_TYPE_FOLDER:
-            r = await list_paths_under_block(
-                db_session,
-                space_id,
+            sub_paths, sub_sub_page_num, sub_sub_folder_num = _assemble_path_tree(
+                children,
                 block["id"],
-                path_prefix=f"{path_prefix}{block['title']}/",
-                depth=depth - 1,
+                f"{path_prefix}{block['title']}/",
+                depth - 1,
             )
-            if not r.ok():
-                return r
-
-            path_dict.update(r.data[0])
+            path_dict.update(sub_paths)
             path_dict[f"{path_prefix}{block['title']}/"] = PathNode(
                 id=block["id"],
                 title=block["title"],
                 type=block["type"],
                 props=block["props"],
-                sub_page_num=r.data[1],
-                sub_folder_num=r.data[2],
+                sub_page_num=sub_sub_page_num,
+                sub_folder_num=sub_sub_folder_num,
             )
         else:
             raise ValueError(f"Invalid block type: {block['type']}")
+    return path_dict, sub_page_num, sub_folder_num
 
-    return Result.resolve((path_dict, sub_page_num, sub_folder_num))
+
+async def list_paths_under_block(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    block_id: Optional[asUUID] = None,
+    path_prefix: str = "",
+    depth: int = 0,
+) -> Result[tuple[dict[str, PathNode], int, int]]:
+    if path_prefix and not path_prefix.endswith("/"):
+        path_prefix += "/"
+    # Folders at the last listed level still report their sub page/folder numbers,
+    # so fetch one level more than listed.
+    r = await fetch_path_subtree(
+        db_session, space_id, block_id, max_level=max(depth + 2, 1)
+    )
+    if not r.ok():
+        return r
+    rows = r.data
+
+    children: dict[Optional[asUUID], List[dict]] = {}
+    for row in rows:
+        if row["level"] == 0:
+            continue
+        children.setdefault(row["parent_id"], []).append(row)
+    if block_id is not None:
+        root = next((row for row in rows if row["level"] == 0), None)
+        if root is None:
+            return Result.reject(f"Block {block_id} not found")
+        if root["type"] != BLOCK_TYPE_FOLDER:
+            return Result.reject(
+                f"Block {block_id}(type {root['type']}) is not a {BLOCK_TYPE_FOLDER}"
+            )
+
+    return Result.resolve(_assemble_path_tree(children, block_id, path_prefix, depth))
+
+
+def _sub_path_count(parent_id_column, block_type: str):
+    return (
+        select(func.count(Block.id))
+        .where(Block.parent_id == parent_id_column, Block.type == block_type)
+        .scalar_subquery()
+    )
+
+
+def _path_node_from_row(row) -> PathNode:
+    if row["type"] == BLOCK_TYPE_PAGE:
+        return PathNode(
+            id=row["id"], title=row["title"], type=row["type"], props=row["props"]
+        )
+    if row["type"] == BLOCK_TYPE_FOLDER:
+        return PathNode(
+            id=row["id"],
+            title=row["title"],
+            type=row["type"],
+            props=row["props"],
+            sub_page_num=row["sub_page_num"],
+            sub_folder_num=row["sub_folder_num"],
+        )
+    # unknown branch
+    raise ValueError(f"Invalid block type: {row['type']}")
 
 
 async def find_block_by_path(
@@ -138,45 +231,99 @@ async def find_block_by_path(
     if not len(path_parts):  # root
         return Result.resolve(None)
 
-    parent_id = None
-    for part in path_parts:
-        query = (
-            select(Block.id, Block.type, Block.title, Block.props)
-            .where(Block.space_id == space_id, Block.parent_id == parent_id)
-            .where(Block.title == part)
-            .where(Block.type.in_([BLOCK_TYPE_FOLDER, BLOCK_TYPE_PAGE]))
+    # Walk down the path segments in one recursive query, level N matches path_parts[N]
+    path_types = [BLOCK_TYPE_FOLDER, BLOCK_TYPE_PAGE]
+    parts_param = array(path_parts)
+    tree = (
+        select(
+            Block.id, Block.type, Block.title, Block.props, literal(1).label("level")
         )
-        result = await db_session.execute(query)
-        block = result.mappings().one_or_none()
-        if block is None:
-            return Result.reject(f"Path {abs_path} not found")
-        parent_id = block["id"]
-    if block["type"] == BLOCK_TYPE_PAGE:
-        return Result.resolve(
-            PathNode(
-                id=block["id"],
-                title=block["title"],
-                type=block["type"],
-                props=block["props"],
-            )
+        .where(Block.space_id == space_id, Block.parent_id.is_(None))
+        .where(Block.title == path_parts[0])
+        .where(Block.type.in_(path_types))
+        .cte("path_walk", recursive=True)
+    )
+    child = aliased(Block)
+    tree = tree.union_all(
+        select(
+            child.id,
+            child.type,
+            child.title,
+            child.props,
+            (tree.c.level + 1).label("level"),
         )
-    if block["type"] == BLOCK_TYPE_FOLDER:
-        r = await list_paths_under_block(db_session, space_id, block["id"], depth=-1)
-        if not r.ok():
-            return r
-        _, sub_page_num, sub_folder_num = r.data
-        return Result.resolve(
-            PathNode(
-                id=block["id"],
-                title=block["title"],
-                type=block["type"],
-                props=block["props"],
-                sub_page_num=sub_page_num,
-                sub_folder_num=sub_folder_num,
-            )
+        .join(tree, child.parent_id == tree.c.id)
+        .where(child.space_id == space_id)
+        .where(child.title == parts_param[tree.c.level + 1])
+        .where(child.type.in_(path_types))
+        .where(tree.c.type == BLOCK_TYPE_FOLDER, tree.c.level < len(path_parts))
+    )
+    query = select(
+        tree.c.id,
+        tree.c.type,
+        tree.c.title,
+        tree.c.props,
+        _sub_path_count(tree.c.id, BLOCK_TYPE_PAGE).label("sub_page_num"),
+        _sub_path_count(tree.c.id, BLOCK_TYPE_FOLDER).label("sub_folder_num"),
+    ).where(tree.c.level == len(path_parts))
+    result = await db_session.execute(query)
+    blocks = result.mappings().all()
+    if not blocks:
+        return Result.reject(f"Path {abs_path} not found")
+    if len(blocks) > 1:
+        return Result.reject(f"Path {abs_path} is ambiguous, siblings share a title")
+    return Result.resolve(_path_node_from_row(blocks[0]))
+
+
+async def fetch_block_ancestors(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    block_id: asUUID,
+    with_sub_path_count: bool = False,
+) -> Result[List[dict]]:
+    """
+    Fetch a block and all its ancestors in one recursive query, ordered from the
+    block itself up to the root-level block.
+    """
+    columns = (Block.id, Block.parent_id, Block.title, Block.type, Block.props)
+    tree = (
+        select(*columns, literal(0).label("level"))
+        .where(Block.space_id == space_id, Block.id == block_id)
+        .cte("ancestors", recursive=True)
+    )
+    parent = aliased(Block)
+    tree = tree.union_all(
+        select(
+            parent.id,
+            parent.parent_id,
+            parent.title,
+            parent.type,
+            parent.props,
+            (tree.c.level + 1).label("level"),
         )
-    # unknown branch
-    raise ValueError(f"Invalid block type: {block['type']}")
+        .join(tree, parent.id == tree.c.parent_id)
+        .where(parent.space_id == space_id)
+    )
+    selected = [tree]
+    if with_sub_path_count:
+        selected += [
+            _sub_path_count(tree.c.id, BLOCK_TYPE_PAGE).label("sub_page_num"),
+            _sub_path_count(tree.c.id, BLOCK_TYPE_FOLDER).label("sub_folder_num"),
+        ]
+    result = await db_session.execute(select(*selected).order_by(tree.c.level))
+    rows = [dict(row) for row in result.mappings().all()]
+    if not rows:
+        return Result.reject(f"Unknown block {block_id}")
+    if rows[-1]["parent_id"] is not None:
+        return Result.reject(f"Unknown block {rows[-1]['parent_id']}")
+    return Result.resolve(rows)
+
+
+def _path_from_ancestors(rows: List[dict], add_folder_slash: bool = False) -> str:
+    base = "/" + "/".join(row["title"] for row in rows[::-1])
+    if add_folder_slash:
+        return base.rstrip("/") + "/"
+    return base
 
 
 async def recover_path_by_id(
@@ -185,65 +332,27 @@ async def recover_path_by_id(
     block_id: asUUID,
     add_folder_slash: bool = False,
 ) -> Result[str]:
-    path_parts = []
-    while block_id is not None:
-        query = select(Block.id, Block.title, Block.parent_id).where(
-            Block.space_id == space_id, Block.id == block_id
-        )
-        result = await db_session.execute(query)
-        block = result.mappings().one_or_none()
-        if block is None:
-            return Result.reject(f"Unknown block {block_id}")
-        path_parts.append(block["title"])
-        block_id: Optional[asUUID] = block["parent_id"]
-    base = "/" + "/".join(path_parts[::-1])
-    if add_folder_slash:
-        return Result.resolve(base.rstrip("/") + "/")
-    return Result.resolve(base)
+    r = await fetch_block_ancestors(db_session, space_id, block_id)
+    if not r.ok():
+        return r
+    return Result.resolve(_path_from_ancestors(r.data, add_folder_slash))
 
 
 async def get_path_info_by_id(
     db_session: AsyncSession, space_id: asUUID, block_id: asUUID
 ) -> Result[tuple[str, PathNode]]:
-    query = select(Block.id, Block.type, Block.title, Block.props).where(
-        Block.space_id == space_id, Block.id == block_id
+    r = await fetch_block_ancestors(
+        db_session, space_id, block_id, with_sub_path_count=True
     )
-    result = await db_session.execute(query)
-    block = result.mappings().one_or_none()
-    if block is None:
-        return Result.reject(f"Block {block_id} not found")
-    if block["type"] == BLOCK_TYPE_PAGE:
-        pn = PathNode(
-            id=block["id"],
-            title=block["title"],
-            type=block["type"],
-            props=block["props"],
-        )
-        r = await recover_path_by_id(db_session, space_id, block["id"])
-        if not r.ok():
-            return r
-        return Result.resolve((r.data, pn))
-    elif block["type"] == BLOCK_TYPE_FOLDER:
-        r = await list_paths_under_block(db_session, space_id, block["id"], depth=-1)
-        if not r.ok():
-            return r
-        _, sub_page_num, sub_folder_num = r.data
-        pn = PathNode(
-            id=block["id"],
-            title=block["title"],
-            type=block["type"],
-            props=block["props"],
-            sub_page_num=sub_page_num,
-            sub_folder_num=sub_folder_num,
-        )
-        r = await recover_path_by_id(
-            db_session, space_id, block["id"], add_folder_slash=True
-        )
-        if not r.ok():
-            return r
-        return Result.resolve((r.data, pn))
-    else:
+    if not r.ok():
+        return r
+    block = r.data[0]
+    if block["type"] not in (BLOCK_TYPE_PAGE, BLOCK_TYPE_FOLDER):
         return Result.reject(f"Invalid path block type: {block['type']}")
+    path = _path_from_ancestors(
+        r.data, add_folder_slash=block["type"] == BLOCK_TYPE_FOLDER
+    )
+    return Result.resolve((path, _path_node_from_row(block)))
 
 
 async def read_blocks_from_par_id(
@@ -263,14 +372,79 @@ async def read_blocks_from_par_id(
     return Result.resolve(blocks)
 
 
-async def get_block_by_sort(
-    db_session: AsyncSession, space_id: asUUID, par_block_id: asUUID, sort: int
+async def read_blocks_page_from_par_id(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    block_id: asUUID,
+    offset: int,
+    limit: int,
+    allowed_types: set[str] = CONTENT_BLOCK,
+) -> Result[tuple[List[Block], int]]:
+    """Return one page of child blocks ordered by sort, and the total number of children"""
+    filters = (
+        Block.space_id == space_id,
+        Block.parent_id == block_id,
+        Block.type.in_(allowed_types),
+    )
+    query = (
+        select(Block, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Block.sort)
+        .offset(offset)
+        .limit(limit)
+    )
+    result = await db_session.execute(query)
+    rows = result.all()
+    if rows:
+        return Result.resolve(([row[0] for row in rows], rows[0][1]))
+    if offset == 0:
+        return Result.resolve(([], 0))
+    # The window is empty past the last block, count separately
+    total = await db_session.scalar(
+        select(func.count()).select_from(Block).where(*filters)
+    )
+    return Result.resolve(([], total or 0))
+
+
+async def get_block_by_index(
+    db_session: AsyncSession, space_id: asUUID, par_block_id: asUUID, index: int
 ) -> Result[Block]:
-    query = select(Block).where(
-        Block.space_id == space_id, Block.parent_id == par_block_id, Block.sort == sort
+    """Return the child at position `index` (0-based) in sort order"""
+    if index < 0:
+        return Result.reject("Block not found")
+    query = (
+        select(Block)
+        .where(Block.space_id == space_id, Block.parent_id == par_block_id)
+        .order_by(Block.sort)
+        .offset(index)
+        .limit(1)
     )
     result = await db_session.execute(query)
     block = result.scalar_one_or_none()
     if block is None:
         return Result.reject("Block not found")
     return Result.resolve(block)
+
+
+async def fetch_block_positions(
+    db_session: AsyncSession, space_id: asUUID, block_ids: List[asUUID]
+) -> Result[dict[asUUID, int]]:
+    """Return the 0-based position of each block among its siblings, in one query"""
+    if not block_ids:
+        return Result.resolve({})
+    sibling = aliased(Block)
+    position = (
+        select(func.count())
+        .where(
+            sibling.space_id == Block.space_id,
+            sibling.parent_id == Block.parent_id,
+            sibling.sort < Block.sort,
+        )
+        .correlate(Block)
+        .scalar_subquery()
+    )
+    query = select(Block.id, position).where(
+        Block.space_id == space_id, Block.id.in_(block_ids)
+    )
+    result = await db_session.execute(query)
+    return Result.resolve({row[0]: row[1] for row in result.all()})
@@ -1,6 +1,7 @@
+from typing import List, Sequence
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, joinedload
 from ...schema.orm import Block, ToolSOP
 from ...schema.orm.block import (
     BLOCK_TYPE_SOP,
@@ -10,18 +11,12 @@ from ...schema.block.general import LLMRenderBlock
 from ...schema.utils import asUUID
 from ...schema.result import Result
 from ...env import LOG
+from .block_nav import fetch_block_positions
 
 
-async def render_sop_block(
-    db_session: AsyncSession, space_id: asUUID, block: Block
-) -> Result[LLMRenderBlock]:
-    loaded_tools = await db_session.execute(
-        select(ToolSOP)
-        .where(ToolSOP.sop_block_id == block.id)
-        .order_by(ToolSOP.order)
-        .options(selectinload(ToolSOP.tool_reference))
-    )
-    tool_sops = loaded_tools.scalars().all()
+def _build_sop_render_block(
+    block: Block, order: int, tool_sops: Sequence[ToolSOP]
+) -> LLMRenderBlock:
     props = {
         "use_when": block.title,
         "preferences": block.props.get("preferences", ""),
@@ -42,35 +37,54 @@ async def render_sop_block(
         }
         props["tool_sops"].append(step_data)
 
-    return Result.resolve(
-        LLMRenderBlock(
-            order=block.sort,
-            block_id=block.id,
-            type=block.type,
-            title=block.title,
-            props=props,
-            parent_id=block.parent_id,
-        )
+    return LLMRenderBlock(
+        order=order,
+        block_id=block.id,
+        type=block.type,
+        title=block.title,
+        props=props,
+        parent_id=block.parent_id,
     )
 
 
-async def render_text_block(
-    db_session: AsyncSession, space_id: asUUID, block: Block
-) -> Result[LLMRenderBlock]:
+def _build_text_render_block(block: Block, order: int) -> LLMRenderBlock:
     props = {
         "use_when": block.title,
         "notes": block.props.get("notes", ""),
     }
-    return Result.resolve(
-        LLMRenderBlock(
-            order=block.sort,
-            block_id=block.id,
-            type=block.type,
-            title=block.title,
-            props=props,
-            parent_id=block.parent_id,
-        )
+    return LLMRenderBlock(
+        order=order,
+        block_id=block.id,
+        type=block.type,
+        title=block.title,
+        props=props,
+        parent_id=block.parent_id,
+    )
+
+
+async def render_sop_block(
+    db_session: AsyncSession, space_id: asUUID, block: Block
+) -> Result[LLMRenderBlock]:
+    loaded_tools = await db_session.execute(
+        select(ToolSOP)
+        .where(ToolSOP.sop_block_id == block.id)
+        .order_by(ToolSOP.order)
+        .options(selectinload(ToolSOP.tool_reference))
     )
+    tool_sops = loaded_tools.scalars().all()
+    r = await fetch_block_positions(db_session, space_id, [block.id])
+    if not r.ok():
+        return r
+    return Result.resolve(_build_sop_render_block(block, r.data[block.id], tool_sops))
+
+
+async def render_text_block(
+    db_session: AsyncSession, space_id: asUUID, block: Block
+) -> Result[LLMRenderBlock]:
+    r = await fetch_block_positions(db_session, space_id, [block.id])
+    if not r.ok():
+        return r
+    return Result.resolve(_build_text_render_block(block, r.data[block.id]))
 
 
 RENDER_BLOCK_HANDLERS = {
@@ -85,3 +99,47 @@ async def render_content_block(
     if block.type not in RENDER_BLOCK_HANDLERS:
         return Result.reject(f"Block type {block.type} is not supported to render")
     return await RENDER_BLOCK_HANDLERS[block.type](db_session, space_id, block)
+
+
+async def render_content_blocks(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    blocks: Sequence[Block],
+) -> Result[List[LLMRenderBlock]]:
+    """
+    Render content blocks in their given order. The tool SOPs of all SOP blocks
+    are loaded in a single query, and the positions of all blocks in another.
+    """
+    for block in blocks:
+        if block.type not in RENDER_BLOCK_HANDLERS:
+            return Result.reject(f"Block type {block.type} is not supported to render")
+    r = await fetch_block_positions(
+        db_session, space_id, [block.id for block in blocks]
+    )
+    if not r.ok():
+        return r
+    orders = [r.data[block.id] for block in blocks]
+
+    sop_block_ids = [block.id for block in blocks if block.type == BLOCK_TYPE_SOP]
+    tool_sops_by_block: dict[asUUID, list[ToolSOP]] = {
+        block_id: [] for block_id in sop_block_ids
+    }
+    if sop_block_ids:
+        loaded_tools = await db_session.execute(
+            select(ToolSOP)
+            .where(ToolSOP.sop_block_id.in_(sop_block_ids))
+            .order_by(ToolSOP.sop_block_id, ToolSOP.order)
+            .options(joinedload(ToolSOP.tool_reference))
+        )
+        for step in loaded_tools.scalars().all():
+            tool_sops_by_block[step.sop_block_id].append(step)
+
+    rendered = []
+    for block, order in zip(blocks, orders):
+        if block.type == BLOCK_TYPE_SOP:
+            rendered.append(
+                _build_sop_render_block(block, order, tool_sops_by_block[block.id])
+            )
+        else:
+            rendered.append(_build_text_render_block(block, order))
+    return Result.resolve(rendered)
@@ -1,13 +1,148 @@
-from sqlalchemy import select
+import re
+from sqlalchemy import select, func, text, literal, union_all, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Tuple, cast
+from typing import List, Optional, Sequence, Tuple
 
-from ...schema.orm import Block, BlockEmbedding
-from ...schema.orm.block import PATH_BLOCK, CONTENT_BLOCK
+from ...schema.orm import Block, BlockEmbedding, ToolSOP, ToolReference
+from ...schema.orm.block import (
+    PATH_BLOCK,
+    CONTENT_BLOCK,
+    BLOCK_TYPE_SOP,
+    BLOCK_SEARCH_DOCUMENT,
+)
+from ...schema.orm.block_embedding import set_vector_search_params
 from ...schema.utils import asUUID
 from ...schema.result import Result
 from ...llm.embeddings import get_embedding
-from ...env import LOG
+from ...env import LOG, DEFAULT_CORE_CONFIG
+from . import vector_index as VI
+
+# Any of the query terms may match, ranked by cover density
+LEXICAL_TSQUERY = (
+    "to_tsquery('simple'::regconfig, "
+    "replace(plainto_tsquery('simple'::regconfig, :query)::text, ' & ', ' | '))"
+)
+
+
+async def _fetch_blocks_of_hits(
+    db_session: AsyncSession, hits: List[Tuple[asUUID, float]]
+) -> Result[List[Tuple[Block, float]]]:
+    if not hits:
+        return Result.resolve([])
+    query = select(Block).where(
+        Block.id.in_([block_id for block_id, _ in hits]),
+        Block.is_archived == False,  # noqa: E712
+    )
+    result = await db_session.execute(query)
+    blocks = {block.id: block for block in result.scalars().all()}
+    return Result.resolve(
+        [
+            (blocks[block_id], float(distance))
+            for block_id, distance in hits
+            if block_id in blocks
+        ]
+    )
+
+
+def _nearest_blocks(
+    space_id: asUUID,
+    query_embedding: Sequence[float],
+    block_types: list[str],
+    topk: int,
+    threshold: float,
+    candidate_limit: int,
+):
+    """
+    Select up to `topk` unique (block_id, distance) closest to the query, where the
+    distance of a block is its best embedding among the candidates.
+
+    Candidates are the `candidate_limit` nearest embedding rows of unarchived blocks,
+    an ORDER BY distance LIMIT scan that the partial vector indexes serve. They are
+    grouped per block on top of it, every row also carries the number of candidates
+    scanned and the distance of the last one, see `_needs_more_candidates`.
+    Block rows are loaded for the winners by the caller.
+    """
+    distance = BlockEmbedding.embedding.cosine_distance(query_embedding).label(
+        "distance"
+    )
+    candidates = (
+        select(BlockEmbedding.block_id, distance)
+        .join(Block, Block.id == BlockEmbedding.block_id)
+        .where(
+            BlockEmbedding.space_id == space_id,
+            # Lets the planner match the partial vector index of the type group
+            BlockEmbedding.block_type.in_(block_types),
+            Block.is_archived == False,  # noqa: E712
+        )
+        .order_by(distance.asc())
+        .limit(candidate_limit)
+        .subquery()
+    )
+    best = func.min(candidates.c.distance)
+    per_block = (
+        select(
+            candidates.c.block_id,
+            best.label("distance"),
+            func.sum(func.count()).over().label("scanned"),
+            func.max(func.max(candidates.c.distance)).over().label("last_distance"),
+        )
+        .group_by(candidates.c.block_id)
+        .subquery()
+    )
+    return (
+        select(per_block)
+        .where(per_block.c.distance <= threshold)
+        .order_by(per_block.c.distance.asc(), per_block.c.block_id)
+        .limit(topk)
+    )
+
+
+def _needs_more_candidates(
+    found: int,
+    scanned: int,
+    last_distance: float,
+    candidate_limit: int,
+    topk: int,
+    threshold: float,
+) -> bool:
+    """
+    Whether a wider candidate scan can add blocks: the top-k is short, the scan hit
+    its limit and its farthest row is still within the threshold
+    """
+    return found < topk and scanned >= candidate_limit and last_distance <= threshold
+
+
+async def _with_pending_blocks(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    query_text: str,
+    block_types: list[str],
+    results: List[Tuple[Block, float]],
+    topk: int,
+    threshold: float,
+) -> List[Tuple[Block, float]]:
+    # Blocks whose embedding is still queued can only be matched lexically by any of
+    # the query terms, they rank after every vector match at the threshold distance
+    if not DEFAULT_CORE_CONFIG.block_search_include_pending or len(results) >= topk:
+        return results
+    query = (
+        select(Block)
+        .where(
+            Block.space_id == space_id,
+            Block.type.in_(block_types),
+            Block.is_archived == False,  # noqa: E712
+            Block.embedding_pending == True,  # noqa: E712
+            text(f"{BLOCK_SEARCH_DOCUMENT} @@ {LEXICAL_TSQUERY}"),
+        )
+        .order_by(
+            text(f"ts_rank_cd({BLOCK_SEARCH_DOCUMENT}, {LEXICAL_TSQUERY}) DESC"),
+            Block.created_at.desc(),
+        )
+        .limit(topk - len(results))
+        .params(query=query_text)
+    )
+    result = await db_session.execute(query)
+    return results + [(block, threshold) for block in result.scalars().all()]
 
 
 # TODO: add project_id to record
@@ -18,13 +153,13 @@ async def search_blocks(
     block_types: list[str],
     topk: int = 10,
     threshold: float = 0.8,
-    fetch_ratio: float = 1.5,
 ) -> Result[List[Tuple[Block, float]]]:
     """
     Search for page and folder blocks using semantic vector similarity.
 
-    Uses cosine distance on block embeddings with Python-side deduplication
-    for optimal performance when blocks have multiple embeddings.
+    Uses cosine distance on block embeddings through the vector index. Blocks with
+    several embeddings are deduplicated in SQL over an over-fetched candidate scan,
+    which is widened until it holds `topk` blocks or runs out of matches.
 
     Args:
         db_session: Database session
@@ -58,59 +193,243 @@ async def search_blocks(
         return r
     query_embedding = r.data.embedding[0]
 
-    # Calculate distance using pgvector's cosine distance method
-    # This uses the <=> operator for cosine distance in PostgreSQL
-    distance = BlockEmbedding.embedding.cosine_distance(query_embedding).label(
-        "distance"
+    # Answer from the in-memory index of the space when it is loaded and current
+    hits = await VI.search_space_index(
+        db_session, space_id, query_embedding, block_types, topk, threshold
     )
+    if hits is not None:
+        r = await _fetch_blocks_of_hits(db_session, hits)
+        if not r.ok():
+            return r
+        return Result.resolve(
+            await _with_pending_blocks(
+                db_session, space_id, query_text, block_types, r.data, topk, threshold
+            )
+        )
 
-    # Fetch more than needed to account for blocks with multiple embeddings
-    # Conservative estimate: 3x to ensure we get enough unique blocks
-    fetch_limit = int(topk * fetch_ratio)
+    # Postgres keeps the best distance per block of the nearest embedding rows
+    # and cuts the top-k, Block rows are only loaded for those. The candidate scan
+    # is widened until it holds top-k blocks, like the in-memory index does
+    candidate_limit = topk * DEFAULT_CORE_CONFIG.block_search_overfetch
+    try:
+        await set_vector_search_params(db_session)
+        while True:
+            nearest = _nearest_blocks(
+                space_id, query_embedding, block_types, topk, threshold, candidate_limit
+            ).subquery()
+            query = (
+                select(
+                    Block,
+                    nearest.c.distance,
+                    nearest.c.scanned,
+                    nearest.c.last_distance,
+                )
+                .join(nearest, Block.id == nearest.c.block_id)
+                .order_by(nearest.c.distance.asc(), Block.id)
+            )
+            rows = (await db_session.execute(query)).all()
+            if not rows or not _needs_more_candidates(
+                len(rows),
+                rows[0].scanned,
+                rows[0].last_distance,
+                candidate_limit,
+                topk,
+                threshold,
+            ):
+                break
+            candidate_limit *= 2
+        results = [(block, float(distance)) for block, distance, _, _ in rows]
+        results = await _with_pending_blocks(
+            db_session, space_id, query_text, block_types, results, topk, threshold
+        )
+        return Result.resolve(results)
 
-    # Build query - simple join without grouping for best performance
-    query = (
-        select(Block, distance)
-        .join(BlockEmbedding, Block.id == BlockEmbedding.block_id)
-        .where(
-            Block.space_id == space_id,
-            Block.type.in_(block_types),  # Only page and folder blocks
-            Block.is_archived == False,  # Exclude archived blocks  # noqa: E712
-            distance <= threshold,  # Apply distance threshold
+    except Exception as e:
+        LOG.error(f"Error in search_path_blocks: {e}")
+        return Result.reject(f"Vector search failed: {str(e)}")
+
+
+async def estimate_search_recall(
+    db_session: AsyncSession,
+    block_types: list[str],
+    sample_size: int = 10,
+    topk: int = 10,
+) -> Result[Optional[float]]:
+    """
+    Estimate the recall of vector search: stored embeddings are sampled as queries,
+    the planned (indexed) top-k of their space is compared with an exact scan.
+    Returns None when there is nothing to sample.
+    """
+
+    def _topk_query(space_id: asUUID, embedding):
+        return (
+            select(BlockEmbedding.id)
+            .where(
+                BlockEmbedding.space_id == space_id,
+                BlockEmbedding.block_type.in_(block_types),
+            )
+            .order_by(BlockEmbedding.embedding.cosine_distance(embedding))
+            .limit(topk)
         )
-        .order_by(distance.asc())  # Best matches first
-        .limit(fetch_limit)
-    )
 
-    # Execute query
     try:
-        result = await db_session.execute(query)
-        rows = result.all()
-
-        # Deduplicate in Python: keep best (lowest distance) match per block
-        # Since results are ordered by distance ASC, first occurrence is best
-        seen: dict[asUUID, Tuple[Block, float]] = {}
-        for row in rows:
-            block, distance = cast(
-                Tuple[Block, float], row
-            )  # Unpack tuple: (Block, distance)
-            if block.id in seen:
-                continue
+        result = await db_session.execute(
+            select(BlockEmbedding.space_id, BlockEmbedding.embedding)
+            .where(BlockEmbedding.block_type.in_(block_types))
+            .order_by(func.random())
+            .limit(sample_size)
+        )
+        samples = result.all()
+        if not samples:
+            return Result.resolve(None)
+
+        await set_vector_search_params(db_session)
+        approx = []
+        for space_id, embedding in samples:
+            result = await db_session.execute(_topk_query(space_id, embedding))
+            approx.append(set(result.scalars().all()))
+
+        await db_session.execute(text("SET LOCAL enable_indexscan = off"))
+        found, total = 0, 0
+        for (space_id, embedding), approx_ids in zip(samples, approx):
+            result = await db_session.execute(_topk_query(space_id, embedding))
+            exact_ids = set(result.scalars().all())
+            found += len(exact_ids & approx_ids)
+            total += len(exact_ids)
+        return Result.resolve(found / total if total else None)
+    except Exception as e:
+        LOG.error(f"Error in estimate_search_recall: {e}")
+        return Result.reject(f"Recall estimation failed: {str(e)}")
+
+
+def group_batch_hits(
+    rows: Sequence[Tuple[Block, int, float]],
+    query_count: int,
+    topk: int,
+    dedupe: bool = False,
+) -> List[List[Tuple[Block, float]]]:
+    """
+    Split (block, query_index, distance) rows, ordered by distance within each
+    query, into the top-k (block, distance) of every query.
+    With `dedupe`, a block is only kept for the query it is closest to.
+    """
+    # The first row of a block within a query is its best one
+    per_query: List[dict[asUUID, Tuple[Block, float]]] = [
+        {} for _ in range(query_count)
+    ]
+    for block, query_index, distance in rows:
+        seen = per_query[query_index]
+        if block.id not in seen and len(seen) < topk:
             seen[block.id] = (block, float(distance))
+    if dedupe:
+        best_query: dict[asUUID, int] = {}
+        for query_index, seen in enumerate(per_query):
+            for block_id, (_, distance) in seen.items():
+                best = best_query.get(block_id)
+                if best is None or distance < per_query[best][block_id][1]:
+                    best_query[block_id] = query_index
+        per_query = [
+            {
+                block_id: hit
+                for block_id, hit in seen.items()
+                if best_query[block_id] == query_index
+            }
+            for query_index, seen in enumerate(per_query)
+        ]
+    return [list(seen.values()) for seen in per_query]
 
-        # Get top-K unique blocks (already sorted by distance)
-        results = list(seen.values())[:topk]
 
-        # LOG.info(
-        #     f"Search '{query_text[:50]}...' found {len(results)} unique blocks "
-        #     f"(from {len(rows)} total embeddings)"
-        # )
-        return Result.resolve(results)
+async def search_blocks_batch(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    query_texts: list[str],
+    block_types: list[str],
+    topk: int = 10,
+    threshold: float = 0.8,
+    dedupe: bool = False,
+) -> Result[List[List[Tuple[Block, float]]]]:
+    """
+    Search several queries at once: all queries are embedded in one call and their
+    top-k are fetched in one SQL round trip, combined with UNION ALL.
+
+    Returns the (Block, distance) tuples of each query, in query order.
+    With `dedupe`, a block is only kept for the query it matches best.
+    """
+    r = await get_embedding(query_texts, phase="query")
+    if not r.ok():
+        return r
 
+    query_embeddings = r.data.embedding
+    candidate_limits = [topk * DEFAULT_CORE_CONFIG.block_search_overfetch] * len(
+        query_texts
+    )
+    try:
+        await set_vector_search_params(db_session)
+        # Widen the candidate scan of the queries whose top-k is short and rerun
+        while True:
+            members = []
+            for query_index, query_embedding in enumerate(query_embeddings):
+                nearest = _nearest_blocks(
+                    space_id,
+                    query_embedding,
+                    block_types,
+                    topk,
+                    threshold,
+                    candidate_limits[query_index],
+                ).subquery()
+                members.append(
+                    select(
+                        literal(query_index, Integer).label("query_index"),
+                        nearest.c.block_id,
+                        nearest.c.distance,
+                        nearest.c.scanned,
+                        nearest.c.last_distance,
+                    )
+                )
+            hits = union_all(*members).subquery()
+            query = (
+                select(
+                    Block,
+                    hits.c.query_index,
+                    hits.c.distance,
+                    hits.c.scanned,
+                    hits.c.last_distance,
+                )
+                .join(hits, Block.id == hits.c.block_id)
+                .order_by(hits.c.query_index, hits.c.distance, Block.id)
+            )
+            rows = (await db_session.execute(query)).all()
+
+            found = [0] * len(query_texts)
+            scans: dict[int, Tuple[int, float]] = {}
+            for _, query_index, _, scanned, last_distance in rows:
+                found[query_index] += 1
+                scans[query_index] = (scanned, last_distance)
+            short = [
+                query_index
+                for query_index, (scanned, last_distance) in scans.items()
+                if _needs_more_candidates(
+                    found[query_index],
+                    scanned,
+                    last_distance,
+                    candidate_limits[query_index],
+                    topk,
+                    threshold,
+                )
+            ]
+            if not short:
+                break
+            for query_index in short:
+                candidate_limits[query_index] *= 2
     except Exception as e:
-        LOG.error(f"Error in search_path_blocks: {e}")
+        LOG.error(f"Error in search_blocks_batch: {e}")
         return Result.reject(f"Vector search failed: {str(e)}")
 
+    rows = [
+        (block, query_index, distance) for block, query_index, distance, _, _ in rows
+    ]
+    return Result.resolve(group_batch_hits(rows, len(query_texts), topk, dedupe))
+
 
 async def search_path_blocks(
     db_session: AsyncSession,
@@ -118,10 +437,9 @@ async def search_path_blocks(
     query_text: str,
     topk: int = 10,
     threshold: float = 0.8,
-    fetch_ratio: float = 1.5,
 ) -> Result[List[Tuple[Block, float]]]:
     return await search_blocks(
-        db_session, space_id, query_text, list(PATH_BLOCK), topk, threshold, fetch_ratio
+        db_session, space_id, query_text, list(PATH_BLOCK), topk, threshold
     )
 
 
@@ -131,14 +449,127 @@ async def search_content_blocks(
     query_text: str,
     topk: int = 10,
     threshold: float = 0.8,
-    fetch_ratio: float = 1.5,
 ) -> Result[List[Tuple[Block, float]]]:
     return await search_blocks(
-        db_session,
-        space_id,
-        query_text,
-        list(CONTENT_BLOCK),
-        topk,
-        threshold,
-        fetch_ratio,
+        db_session, space_id, query_text, list(CONTENT_BLOCK), topk, threshold
+    )
+
+
+def rrf_fuse(rankings: Sequence[Sequence[asUUID]], k: int) -> List[asUUID]:
+    """Reciprocal rank fusion, ties keep the order of the earlier rankings"""
+    scores: dict[asUUID, float] = {}
+    for ranking in rankings:
+        for rank, block_id in enumerate(ranking):
+            scores[block_id] = scores.get(block_id, 0.0) + 1.0 / (k + rank + 1)
+    return sorted(scores, key=lambda block_id: -scores[block_id])
+
+
+async def search_blocks_lexical(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    query_text: str,
+    block_types: list[str],
+    limit: int = 10,
+) -> Result[List[asUUID]]:
+    """
+    Rank blocks by full-text match of their title and props. SOP blocks using a
+    tool named exactly like a query term rank first.
+    """
+    ranked: List[asUUID] = []
+    try:
+        terms = set(re.findall(r"[\w.\-]+", query_text.lower()))
+        if BLOCK_TYPE_SOP in block_types and terms:
+            query = (
+                select(ToolSOP.sop_block_id)
+                .join(ToolReference, ToolReference.id == ToolSOP.tool_reference_id)
+                .join(Block, Block.id == ToolSOP.sop_block_id)
+                .where(
+                    Block.space_id == space_id,
+                    Block.is_archived == False,  # noqa: E712
+                    ToolReference.name.in_(terms),
+                )
+                .group_by(ToolSOP.sop_block_id)
+                .order_by(func.count().desc())
+                .limit(limit)
+            )
+            result = await db_session.execute(query)
+            ranked.extend(result.scalars().all())
+
+        query = (
+            select(Block.id)
+            .where(
+                Block.space_id == space_id,
+                Block.type.in_(block_types),
+                Block.is_archived == False,  # noqa: E712
+                text(f"{BLOCK_SEARCH_DOCUMENT} @@ {LEXICAL_TSQUERY}"),
+            )
+            .order_by(
+                text(f"ts_rank_cd({BLOCK_SEARCH_DOCUMENT}, {LEXICAL_TSQUERY}) DESC")
+            )
+            .limit(limit)
+            .params(query=query_text)
+        )
+        result = await db_session.execute(query)
+        for block_id in result.scalars().all():
+            if block_id not in ranked:
+                ranked.append(block_id)
+    except Exception as e:
+        LOG.error(f"Error in search_blocks_lexical: {e}")
+        return Result.reject(f"Lexical search failed: {str(e)}")
+    return Result.resolve(ranked[:limit])
+
+
+async def search_blocks_hybrid(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    query_text: str,
+    block_types: list[str],
+    topk: int = 10,
+    threshold: float = 0.8,
+    fetch_ratio: float = 2.0,
+) -> Result[List[Tuple[Block, Optional[float]]]]:
+    """
+    Merge vector and lexical search with reciprocal rank fusion.
+
+    Returns up to `topk` (Block, distance) tuples, best first. The distance is
+    None for blocks only found by the lexical search.
+    """
+    fetch_limit = max(int(topk * fetch_ratio), topk)
+    r = await search_blocks(
+        db_session, space_id, query_text, block_types, fetch_limit, threshold
+    )
+    if not r.ok():
+        return r
+    vector_hits = r.data
+    r = await search_blocks_lexical(
+        db_session, space_id, query_text, block_types, fetch_limit
+    )
+    if not r.ok():
+        return r
+    lexical_ids = r.data
+
+    fused = rrf_fuse(
+        [[block.id for block, _ in vector_hits], lexical_ids],
+        DEFAULT_CORE_CONFIG.block_search_rrf_k,
+    )[:topk]
+    found: dict[asUUID, Tuple[Block, Optional[float]]] = {
+        block.id: (block, distance) for block, distance in vector_hits
+    }
+    missing = [block_id for block_id in fused if block_id not in found]
+    if missing:
+        result = await db_session.execute(select(Block).where(Block.id.in_(missing)))
+        for block in result.scalars().all():
+            found[block.id] = (block, None)
+    return Result.resolve([found[block_id] for block_id in fused if block_id in found])
+
+
+async def search_content_blocks_hybrid(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    query_text: str,
+    topk: int = 10,
+    threshold: float = 0.8,
+) -> Result[List[Tuple[Block, Optional[float]]]]:
+    return await search_blocks_hybrid(
+        db_session, space_id, query_text, list(CONTENT_BLOCK), topk, threshold
     )
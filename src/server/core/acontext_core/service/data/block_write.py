@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from ...schema.orm.block import BLOCK_TYPE_SOP
 from ...schema.orm import Block, ToolReference, ToolSOP, Space
@@ -9,9 +9,10 @@ from ...schema.block.sop_block import SOPData
 from ...schema.block.general import GeneralBlockData
 from .block import (
     _find_block_sort,
-    create_new_block_embedding,
-    update_block_children_sort_by_delta,
+    _find_block_sort_at_index,
+    embed_new_block,
 )
+from .space_tree import mark_space_changed
 
 
 async def write_sop_block_to_parent(
@@ -36,17 +37,22 @@ async def write_sop_block_to_parent(
         return r
     next_sort = r.unpack()[0]
     if after_block_index is not None:
-        if after_block_index < 0 or after_block_index > next_sort:
+        children_num = await db_session.scalar(
+            select(func.count())
+            .select_from(Block)
+            .where(Block.space_id == space_id)
+            .where(Block.parent_id == par_block_id)
+        )
+        if after_block_index < 0 or after_block_index > children_num:
             return Result.reject(
-                f"after_block_index out of range, it should be in [0, {next_sort}]"
+                f"after_block_index out of range, it should be in [0, {children_num}]"
             )
-        next_sort = after_block_index
-        r = await update_block_children_sort_by_delta(
-            db_session, space_id, par_block_id, after_block_index - 1, delta=1
+        r = await _find_block_sort_at_index(
+            db_session, space_id, par_block_id, after_block_index
         )
         if not r.ok():
             return r
-        await db_session.flush()
+        next_sort = r.data
 
     new_block = Block(
         space_id=space_id,
@@ -63,6 +69,7 @@ async def write_sop_block_to_parent(
         return r
     db_session.add(new_block)
     await db_session.flush()
+    mark_space_changed(db_session, space_id)
 
     for i, sop_step in enumerate(sop_data.tool_sops):
         tool_name = sop_step.tool_name.strip()
@@ -98,7 +105,7 @@ async def write_sop_block_to_parent(
         db_session.add(tool_sop)
 
     await db_session.flush()
-    r = await create_new_block_embedding(db_session, new_block, sop_data.use_when)
+    r = await embed_new_block(db_session, new_block)
     if not r.ok():
         return r
     return Result.resolve(new_block.id)
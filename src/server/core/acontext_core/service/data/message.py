@@ -1,6 +1,7 @@
 import asyncio
+import hashlib
 import json
-from typing import List
+from typing import List, Optional
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import ValidationError
@@ -10,16 +11,67 @@ from ...schema.session.task import TaskStatus
 from ...schema.orm import Message, Part, Asset
 from ...schema.result import Result
 from ...schema.utils import asUUID
-from ...infra.s3 import S3_CLIENT
-from ...env import LOG
+from ...infra.s3 import S3_FETCHER, FetchPriority
+from ...env import LOG, DEFAULT_CORE_CONFIG
+from ...util.cache import ByteLRUCache, DiskBlobCache
+
+# Parts blobs are immutable, so cached entries never need invalidation
+PARTS_MEMORY_CACHE: ByteLRUCache[str, List[Part]] = ByteLRUCache(
+    "message_parts_memory",
+    max_bytes=DEFAULT_CORE_CONFIG.message_parts_memory_cache_max_bytes,
+)
+PARTS_DISK_CACHE: Optional[DiskBlobCache] = (
+    DiskBlobCache(
+        "message_parts_disk",
+        root_dir=DEFAULT_CORE_CONFIG.message_parts_disk_cache_dir,
+        max_bytes=DEFAULT_CORE_CONFIG.message_parts_disk_cache_max_bytes,
+    )
+    if DEFAULT_CORE_CONFIG.message_parts_disk_cache_dir
+    else None
+)
+
 
+async def _download_parts_blob(
+    asset: Asset, priority: FetchPriority
+) -> tuple[str, bytes]:
+    """
+    Return the cache key and raw parts JSON of an asset, from the disk cache or S3.
 
-async def _fetch_message_parts(parts_meta: dict) -> Result[List[Part]]:
+    Blobs are cached on disk under their sha256 only when the content matches it.
+    """
+    if asset.sha256 and PARTS_DISK_CACHE is not None:
+        blob = await PARTS_DISK_CACHE.get(asset.sha256)
+        if blob is not None:
+            return asset.sha256, blob
+    blob = await S3_FETCHER.download_object(asset.s3_key, priority=priority)
+    if asset.sha256 and hashlib.sha256(blob).hexdigest() == asset.sha256:
+        if PARTS_DISK_CACHE is not None:
+            try:
+                await PARTS_DISK_CACHE.set(asset.sha256, blob)
+            except OSError as e:
+                LOG.warning(f"Failed to write parts blob {asset.sha256} to disk cache: {e}")
+        return asset.sha256, blob
+    return f"{asset.bucket}/{asset.s3_key}@{asset.etag}", blob
+
+
+def _parse_parts(parts_json: list) -> Result[List[Part]]:
+    if not isinstance(parts_json, list):
+        return Result.reject(f"Parts Json must be a list, got {type(parts_json)}")
+    try:
+        return Result.resolve([Part(**pj) for pj in parts_json])
+    except ValidationError as e:
+        return Result.reject(f"Failed to validate parts {parts_json}: {e}")
+
+
+async def _fetch_message_parts(
+    parts_meta: dict, priority: FetchPriority = FetchPriority.NORMAL
+) -> Result[List[Part]]:
     """
     Helper function to fetch parts for a single message from S3.
 
     Args:
         message: Message object with parts_meta containing S3 information
+        priority: Scheduling priority of the S3 download
 
     Returns:
         List of Part objects
@@ -30,16 +82,20 @@ async def _fetch_message_parts(parts_meta: dict) -> Result[List[Part]]:
             asset = Asset(**parts_meta)
         except ValidationError as e:
             return Result.reject(f"Failed to validate parts asset {parts_meta}: {e}")
-        s3_key = asset.s3_key
-        # Download parts JSON from S3
-        parts_json_bytes = await S3_CLIENT.download_object(s3_key)
+        if asset.sha256:
+            parts = PARTS_MEMORY_CACHE.get(asset.sha256)
+            if parts is not None:
+                return Result.resolve(list(parts))
+        # Download parts JSON from the disk cache or S3
+        cache_key, parts_json_bytes = await _download_parts_blob(asset, priority)
         parts_json = json.loads(parts_json_bytes.decode("utf-8"))
-        assert isinstance(parts_json, list), "Parts Json must be a list"
-        try:
-            parts = [Part(**pj) for pj in parts_json]
-        except ValidationError as e:
-            return Result.reject(f"Failed to validate parts {parts_json}: {e}")
-        return Result.resolve(parts)
+        r = _parse_parts(parts_json)
+        parts, eil = r.unpack()
+        if eil:
+            return r
+        if cache_key == asset.sha256:
+            PARTS_MEMORY_CACHE.set(cache_key, parts, len(parts_json_bytes))
+        return Result.resolve(list(parts))
     except Exception as e:
         return Result.reject(f"Unknown error to fetch parts {parts_meta}: {e}")
 
@@ -74,7 +130,9 @@ async def session_message_length(
 
 
 async def fetch_messages_data_by_ids(
-    db_session: AsyncSession, message_ids: List[asUUID]
+    db_session: AsyncSession,
+    message_ids: List[asUUID],
+    priority: FetchPriority = FetchPriority.NORMAL,
 ) -> Result[List[Message]]:
     """
     Fetch messages by their IDs with parts loaded from S3, maintaining the order of message_ids.
@@ -82,6 +140,7 @@ async def fetch_messages_data_by_ids(
     Args:
         db_session: Database session
         message_ids: List of message UUIDs to fetch
+        priority: Scheduling priority of the S3 downloads
 
     Returns:
         Result containing list of Message objects with parts loaded, in the same order as message_ids
@@ -106,12 +165,24 @@ async def fetch_messages_data_by_ids(
         if not ordered_messages:
             return Result.resolve([])
 
-        # Fetch parts concurrently for all messages
-        parts_tasks = [
-            _fetch_message_parts(message.parts_asset_meta)
+        # Inline parts come with the row, the rest are fetched concurrently
+        # from S3 (S3_FETCHER bounds the fan-out)
+        s3_messages = [m for m in ordered_messages if m.parts_inline is None]
+        s3_results = await asyncio.gather(
+            *[
+                _fetch_message_parts(message.parts_asset_meta, priority)
+                for message in s3_messages
+            ]
+        )
+        s3_parts = {m.id: r for m, r in zip(s3_messages, s3_results)}
+        parts_results = [
+            (
+                _parse_parts(message.parts_inline)
+                if message.parts_inline is not None
+                else s3_parts[message.id]
+            )
             for message in ordered_messages
         ]
-        parts_results = await asyncio.gather(*parts_tasks)
 
         # Assign parts to messages
         for message, parts_result in zip(ordered_messages, parts_results):
@@ -128,7 +199,10 @@ async def fetch_messages_data_by_ids(
 
 
 async def fetch_session_messages(
-    db_session: AsyncSession, session_id: asUUID, status: str = "pending"
+    db_session: AsyncSession,
+    session_id: asUUID,
+    status: str = "pending",
+    priority: FetchPriority = FetchPriority.NORMAL,
 ) -> Result[List[Message]]:
     """
     Fetch all pending messages for a given session with concurrent S3 parts loading.
@@ -156,7 +230,7 @@ async def fetch_session_messages(
 
     if not message_ids:
         return Result.resolve([])
-    return await fetch_messages_data_by_ids(db_session, message_ids)
+    return await fetch_messages_data_by_ids(db_session, message_ids, priority)
 
 
 async def get_message_ids(
@@ -218,7 +292,11 @@ async def check_session_message_status(
 
 
 async def fetch_previous_messages_by_datetime(
-    db_session: AsyncSession, session_id: asUUID, date_time: datetime, limit: int = 10
+    db_session: AsyncSession,
+    session_id: asUUID,
+    date_time: datetime,
+    limit: int = 10,
+    priority: FetchPriority = FetchPriority.NORMAL,
 ) -> Result[List[Message]]:
     query = (
         select(Message.id, Message.created_at)
@@ -230,7 +308,7 @@ async def fetch_previous_messages_by_datetime(
     _dp = sorted(result.all(), key=lambda x: x[1])
     message_ids = [dp[0] for dp in _dp]
 
-    return await fetch_messages_data_by_ids(db_session, message_ids)
+    return await fetch_messages_data_by_ids(db_session, message_ids, priority)
 
 
 async def update_message_status_to(
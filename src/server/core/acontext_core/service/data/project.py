@@ -8,10 +8,31 @@ from ...schema.config import ProjectConfig, filter_value_from_json
 from ...schema.result import Result
 from ...schema.utils import asUUID
 from ...util.config import DEFAULT_PROJECT_CONFIG
+from ...util.cache import TTLLRUCache
+from ...env import DEFAULT_CORE_CONFIG
+
+PROJECT_CONFIG_CACHE: TTLLRUCache[asUUID, ProjectConfig] = TTLLRUCache(
+    "project_config",
+    max_size=DEFAULT_CORE_CONFIG.project_config_cache_max_size,
+    ttl_seconds=DEFAULT_CORE_CONFIG.project_config_cache_ttl_seconds,
+)
 
 
 async def get_project_config(
     db_session: AsyncSession, project_id: asUUID
+) -> Result[ProjectConfig]:
+    """Cached per replica, changes show up once the cached entry expires"""
+    project_config = PROJECT_CONFIG_CACHE.get(project_id)
+    if project_config is not None:
+        return Result.resolve(project_config)
+    r = await _load_project_config(db_session, project_id)
+    if r.ok():
+        PROJECT_CONFIG_CACHE.set(project_id, r.data)
+    return r
+
+
+async def _load_project_config(
+    db_session: AsyncSession, project_id: asUUID
 ) -> Result[ProjectConfig]:
     query = select(Project).where(Project.id == project_id)
     result = await db_session.execute(query)
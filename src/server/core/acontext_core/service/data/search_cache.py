@@ -0,0 +1,115 @@
+import hashlib
+import json
+from typing import Awaitable, Callable, List, Optional
+from pydantic import TypeAdapter
+from ...env import LOG, DEFAULT_CORE_CONFIG
+from ...infra.redis import REDIS_CLIENT
+from ...schema.api.response import SearchResultBlockItem
+from ...schema.utils import asUUID
+from ...util.cache import TTLLRUCache, CacheStats, CACHE_REGISTRY
+from .space_tree import get_space_version
+
+# Entries are keyed by the space version, a block write makes them unreachable
+SEARCH_RESULT_KEY = "search.result.{digest}"
+
+_SEARCH_RESULT_ADAPTER = TypeAdapter(List[SearchResultBlockItem])
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split())
+
+
+def search_cache_key(
+    space_id: asUUID, version: int, endpoint: str, query: str, params: dict
+) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            [str(space_id), version, endpoint, normalize_query(query), params],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+
+class RedisSearchResultCache:
+    """Search results shared between replicas, behind the in-process LRU"""
+
+    def __init__(self, name: str, ttl_seconds: int):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        CACHE_REGISTRY[name] = self
+
+    async def get(self, key: str) -> Optional[List[SearchResultBlockItem]]:
+        async with REDIS_CLIENT.get_client_context() as client:
+            raw = await client.get(SEARCH_RESULT_KEY.format(digest=key))
+        if raw is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return _SEARCH_RESULT_ADAPTER.validate_json(raw)
+
+    async def set(self, key: str, items: List[SearchResultBlockItem]) -> None:
+        async with REDIS_CLIENT.get_client_context() as client:
+            await client.set(
+                SEARCH_RESULT_KEY.format(digest=key),
+                _SEARCH_RESULT_ADAPTER.dump_json(items).decode(),
+                ex=self.ttl_seconds,
+            )
+
+    def info(self) -> dict:
+        return {"ttl_seconds": self.ttl_seconds, **self.stats.to_dict()}
+
+
+SEARCH_RESULT_CACHE: TTLLRUCache[str, List[SearchResultBlockItem]] = TTLLRUCache(
+    "search_result",
+    max_size=DEFAULT_CORE_CONFIG.search_result_cache_max_size,
+    ttl_seconds=DEFAULT_CORE_CONFIG.search_result_cache_ttl_seconds,
+)
+SEARCH_RESULT_REDIS_CACHE = RedisSearchResultCache(
+    "search_result_redis",
+    ttl_seconds=DEFAULT_CORE_CONFIG.search_result_cache_ttl_seconds,
+)
+
+
+async def cached_search(
+    space_id: asUUID,
+    endpoint: str,
+    query: str,
+    params: dict,
+    search: Callable[[], Awaitable[List[SearchResultBlockItem]]],
+) -> List[SearchResultBlockItem]:
+    """
+    Return the result of `search` for this query against the current version of
+    the space, computing it only on a miss of the in-process and Redis caches.
+    Failed searches raise and are not cached.
+    """
+    if not DEFAULT_CORE_CONFIG.search_result_cache_enabled:
+        return await search()
+    try:
+        version = await get_space_version(space_id)
+    except Exception as e:
+        LOG.warning(f"Failed to read version of space {space_id}: {e}")
+        return await search()
+
+    key = search_cache_key(space_id, version, endpoint, query, params)
+    items = SEARCH_RESULT_CACHE.get(key)
+    if items is not None:
+        return items
+    if DEFAULT_CORE_CONFIG.search_result_cache_redis:
+        try:
+            items = await SEARCH_RESULT_REDIS_CACHE.get(key)
+        except Exception as e:
+            LOG.warning(f"Failed to read search result from redis: {e}")
+        if items is not None:
+            SEARCH_RESULT_CACHE.set(key, items)
+            return items
+
+    # The version is read before searching, a concurrent write bumps it afterwards
+    items = await search()
+    SEARCH_RESULT_CACHE.set(key, items)
+    if DEFAULT_CORE_CONFIG.search_result_cache_redis:
+        try:
+            await SEARCH_RESULT_REDIS_CACHE.set(key, items)
+        except Exception as e:
+            LOG.warning(f"Failed to store search result in redis: {e}")
+    return items
@@ -0,0 +1,263 @@
+import json
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...env import LOG, DEFAULT_CORE_CONFIG
+from ...infra.db import add_post_commit_hook
+from ...infra.redis import REDIS_CLIENT
+from ...schema.orm import Block
+from ...schema.orm.block import BLOCK_TYPE_FOLDER, BLOCK_TYPE_PAGE
+from ...schema.block.path_node import PathNode
+from ...schema.utils import asUUID
+from ...schema.result import Result
+from ...util.cache import TTLLRUCache
+from . import block_nav as BN
+from .block_nav import path_to_parts, _assemble_path_tree, _path_node_from_row
+
+# Bumped after every committed block write of a space, shared with the API server
+SPACE_VERSION_KEY = "space.version.{space_id}"
+SPACE_TREE_SNAPSHOT_KEY = "space.tree.{space_id}"
+CHANGED_SPACES = "acontext.changed_spaces"
+
+
+class SpaceTree:
+    """
+    Snapshot of the folder/page blocks of a space at one version.
+    Answers path lookups and listings from memory.
+    """
+
+    def __init__(self, space_id: asUUID, version: int, rows: List[dict]):
+        self.space_id = space_id
+        self.version = version
+        self.rows = rows
+        self.nodes: dict[asUUID, dict] = {row["id"]: row for row in rows}
+        self.children: dict[Optional[asUUID], List[dict]] = {}
+        for row in sorted(rows, key=lambda row: row["sort"]):
+            self.children.setdefault(row["parent_id"], []).append(row)
+
+    def _path_node(self, row: dict) -> PathNode:
+        children = self.children.get(row["id"], [])
+        return _path_node_from_row(
+            {
+                **row,
+                "sub_page_num": sum(
+                    1 for c in children if c["type"] == BLOCK_TYPE_PAGE
+                ),
+                "sub_folder_num": sum(
+                    1 for c in children if c["type"] == BLOCK_TYPE_FOLDER
+                ),
+            }
+        )
+
+    def find_block(self, abs_path: str) -> Result[PathNode | None]:
+        path_parts = path_to_parts(abs_path)
+        if not len(path_parts):  # root
+            return Result.resolve(None)
+        # Follow every sibling matching a segment, like block_nav.find_block_by_path
+        rows = [c for c in self.children.get(None, []) if c["title"] == path_parts[0]]
+        for part in path_parts[1:]:
+            rows = [
+                c
+                for row in rows
+                if row["type"] == BLOCK_TYPE_FOLDER
+                for c in self.children.get(row["id"], [])
+                if c["title"] == part
+            ]
+        if not rows:
+            return Result.reject(f"Path {abs_path} not found")
+        if len(rows) > 1:
+            return Result.reject(
+                f"Path {abs_path} is ambiguous, siblings share a title"
+            )
+        return Result.resolve(self._path_node(rows[0]))
+
+    def find_path_by_id(self, block_id: asUUID) -> Result[tuple[str, PathNode]]:
+        row = self.nodes.get(block_id)
+        if row is None:
+            return Result.reject(f"Unknown path block {block_id}")
+        titles = []
+        current = row
+        while current is not None:
+            titles.append(current["title"])
+            current = self.nodes.get(current["parent_id"])
+        path = "/" + "/".join(titles[::-1])
+        if row["type"] == BLOCK_TYPE_FOLDER:
+            path = path.rstrip("/") + "/"
+        return Result.resolve((path, self._path_node(row)))
+
+    def list_paths(
+        self, block_id: Optional[asUUID], path_prefix: str = "", depth: int = 0
+    ) -> Result[tuple[dict[str, PathNode], int, int]]:
+        if path_prefix and not path_prefix.endswith("/"):
+            path_prefix += "/"
+        if block_id is not None:
+            row = self.nodes.get(block_id)
+            if row is None:
+                return Result.reject(f"Block {block_id} not found")
+            if row["type"] != BLOCK_TYPE_FOLDER:
+                return Result.reject(
+                    f"Block {block_id}(type {row['type']}) is not a {BLOCK_TYPE_FOLDER}"
+                )
+        return Result.resolve(
+            _assemble_path_tree(self.children, block_id, path_prefix, depth)
+        )
+
+    def dumps(self) -> str:
+        return json.dumps(
+            {
+                "version": self.version,
+                "rows": [
+                    {
+                        **row,
+                        "id": str(row["id"]),
+                        "parent_id": (
+                            str(row["parent_id"]) if row["parent_id"] else None
+                        ),
+                    }
+                    for row in self.rows
+                ],
+            }
+        )
+
+    @classmethod
+    def loads(cls, space_id: asUUID, raw: str) -> "SpaceTree":
+        data = json.loads(raw)
+        rows = [
+            {
+                **row,
+                "id": asUUID(row["id"]),
+                "parent_id": asUUID(row["parent_id"]) if row["parent_id"] else None,
+            }
+            for row in data["rows"]
+        ]
+        return cls(space_id, data["version"], rows)
+
+
+SPACE_TREE_CACHE: TTLLRUCache[asUUID, SpaceTree] = TTLLRUCache(
+    "space_tree",
+    max_size=DEFAULT_CORE_CONFIG.space_tree_cache_max_size,
+    ttl_seconds=DEFAULT_CORE_CONFIG.space_tree_cache_ttl_seconds,
+)
+
+
+async def get_space_version(space_id: asUUID) -> int:
+    async with REDIS_CLIENT.get_client_context() as client:
+        version = await client.get(SPACE_VERSION_KEY.format(space_id=space_id))
+    return int(version) if version is not None else 0
+
+
+async def bump_space_version(space_id: asUUID) -> int:
+    async with REDIS_CLIENT.get_client_context() as client:
+        return await client.incr(SPACE_VERSION_KEY.format(space_id=space_id))
+
+
+def mark_space_changed(db_session: AsyncSession, space_id: asUUID) -> None:
+    """Bump the space version once the blocks written in this session are committed"""
+    db_session.info.setdefault(CHANGED_SPACES, set()).add(space_id)
+    add_post_commit_hook(
+        db_session,
+        (SPACE_VERSION_KEY, space_id),
+        lambda: bump_space_version(space_id),
+    )
+
+
+async def _load_space_tree(
+    db_session: AsyncSession, space_id: asUUID, version: int
+) -> SpaceTree:
+    query = select(
+        Block.id, Block.parent_id, Block.title, Block.type, Block.props, Block.sort
+    ).where(
+        Block.space_id == space_id,
+        Block.type.in_([BLOCK_TYPE_FOLDER, BLOCK_TYPE_PAGE]),
+    )
+    result = await db_session.execute(query)
+    return SpaceTree(space_id, version, [dict(row) for row in result.mappings().all()])
+
+
+async def get_space_tree(db_session: AsyncSession, space_id: asUUID) -> SpaceTree:
+    """
+    Return the tree of a space, from memory or Redis when its version is unchanged.
+    Sessions with uncommitted block writes to the space always read their own view
+    from the database, prefer find_block/find_path_by_id/list_paths for lookups.
+    """
+    if _space_changed(db_session, space_id):
+        return await _load_space_tree(db_session, space_id, -1)
+    try:
+        version = await get_space_version(space_id)
+    except Exception as e:
+        LOG.warning(f"Failed to read version of space {space_id}: {e}")
+        return await _load_space_tree(db_session, space_id, -1)
+
+    tree = SPACE_TREE_CACHE.get(space_id)
+    if tree is not None and tree.version == version:
+        return tree
+
+    snapshot_key = SPACE_TREE_SNAPSHOT_KEY.format(space_id=space_id)
+    try:
+        async with REDIS_CLIENT.get_client_context() as client:
+            raw = await client.get(snapshot_key)
+        if raw is not None:
+            tree = SpaceTree.loads(space_id, raw)
+            if tree.version == version:
+                SPACE_TREE_CACHE.set(space_id, tree)
+                return tree
+    except Exception as e:
+        LOG.warning(f"Failed to read tree snapshot of space {space_id}: {e}")
+
+    # The version is read before loading, a concurrent write bumps it afterwards
+    tree = await _load_space_tree(db_session, space_id, version)
+    SPACE_TREE_CACHE.set(space_id, tree)
+    try:
+        async with REDIS_CLIENT.get_client_context() as client:
+            await client.set(
+                snapshot_key,
+                tree.dumps(),
+                ex=DEFAULT_CORE_CONFIG.space_tree_cache_ttl_seconds,
+            )
+    except Exception as e:
+        LOG.warning(f"Failed to store tree snapshot of space {space_id}: {e}")
+    return tree
+
+
+def _space_changed(db_session: AsyncSession, space_id: asUUID) -> bool:
+    return space_id in db_session.info.get(CHANGED_SPACES, ())
+
+
+# Sessions with uncommitted block writes answer lookups with the targeted block_nav
+# queries, loading the whole tree again after every write would cost more
+
+
+async def find_block(
+    db_session: AsyncSession, space_id: asUUID, abs_path: str
+) -> Result[PathNode | None]:
+    if _space_changed(db_session, space_id):
+        return await BN.find_block_by_path(db_session, space_id, abs_path)
+    tree = await get_space_tree(db_session, space_id)
+    return tree.find_block(abs_path)
+
+
+async def find_path_by_id(
+    db_session: AsyncSession, space_id: asUUID, block_id: asUUID
+) -> Result[tuple[str, PathNode]]:
+    if not _space_changed(db_session, space_id):
+        tree = await get_space_tree(db_session, space_id)
+        r = tree.find_path_by_id(block_id)
+        if r.ok():
+            return r
+    # not a path block of the tree, let the database tell why
+    return await BN.get_path_info_by_id(db_session, space_id, block_id)
+
+
+async def list_paths(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    block_id: Optional[asUUID],
+    path_prefix: str = "",
+    depth: int = 0,
+) -> Result[tuple[dict[str, PathNode], int, int]]:
+    if _space_changed(db_session, space_id):
+        return await BN.list_paths_under_block(
+            db_session, space_id, block_id, path_prefix=path_prefix, depth=depth
+        )
+    tree = await get_space_tree(db_session, space_id)
+    return tree.list_paths(block_id, path_prefix=path_prefix, depth=depth)
@@ -2,10 +2,11 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from ...env import LOG
-from ...schema.orm import ToolReference, ToolSOP
+from ...schema.orm import Block, ToolReference, ToolSOP
 from ...schema.utils import asUUID
 from ...schema.result import Result
 from ...schema.tool.tool_reference import ToolReferenceData
+from .space_tree import mark_space_changed
 
 
 async def rename_tool(
@@ -24,6 +25,18 @@ async def rename_tool(
             continue
         tool_reference.name = new_name
         await db_session.flush()
+
+        # Rendered SOP blocks show the tool name, searches cached per space version
+        # must not serve the old one
+        space_query = (
+            select(Block.space_id)
+            .join(ToolSOP, ToolSOP.sop_block_id == Block.id)
+            .where(ToolSOP.tool_reference_id == tool_reference.id)
+            .distinct()
+        )
+        result = await db_session.execute(space_query)
+        for space_id in result.scalars().all():
+            mark_space_changed(db_session, space_id)
     return Result.resolve(None)
 
 
@@ -0,0 +1,209 @@
+import asyncio
+import traceback
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...env import LOG, DEFAULT_CORE_CONFIG
+from ...infra.db import DB_CLIENT
+from ...schema.orm import Block, BlockEmbedding
+from ...schema.utils import asUUID
+from ...util.cache import ByteLRUCache
+from .space_tree import CHANGED_SPACES, get_space_version
+
+try:
+    import hnswlib
+except ImportError:  # optional, every space is searched by brute force without it
+    hnswlib = None
+
+
+class SpaceVectorIndex:
+    """
+    In-memory index of the embeddings of one space at one space version.
+
+    Small spaces are searched with a single matmul over a normalized float32
+    matrix, spaces above `hnsw_min_rows` use an HNSW graph when hnswlib is installed.
+    """
+
+    def __init__(
+        self,
+        space_id: asUUID,
+        version: int,
+        block_ids: List[asUUID],
+        block_types: List[str],
+        embeddings: np.ndarray,
+        hnsw_min_rows: int,
+    ):
+        self.space_id = space_id
+        self.version = version
+        self.block_ids = block_ids
+        self.block_types = np.asarray(block_types, dtype=object)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(len(block_ids), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.maximum(norms, 1e-12)
+        self.hnsw = None
+        if hnswlib is not None and len(block_ids) >= hnsw_min_rows:
+            self.hnsw = hnswlib.Index(space="cosine", dim=self.matrix.shape[1])
+            self.hnsw.init_index(max_elements=len(block_ids), ef_construction=200, M=16)
+            self.hnsw.add_items(self.matrix, np.arange(len(block_ids)))
+            # set once, the cached index is searched from several threads at a time.
+            # hnswlib searches with max(ef, k), so larger reads still work
+            self.hnsw.set_ef(DEFAULT_CORE_CONFIG.block_vector_index_hnsw_ef_search)
+
+    @property
+    def nbytes(self) -> int:
+        size = self.matrix.nbytes + self.block_types.nbytes + 16 * len(self.block_ids)
+        if self.hnsw is not None:
+            # graph links, M=16 neighbours on the base layer
+            size += len(self.block_ids) * 16 * 2 * 4
+        return size
+
+    def _nearest_rows(
+        self, query: np.ndarray, type_mask: np.ndarray, k: int
+    ) -> List[Tuple[int, float]]:
+        if self.hnsw is not None:
+            try:
+                labels, distances = self.hnsw.knn_query(
+                    query, k=k, filter=lambda label: bool(type_mask[label])
+                )
+                return list(zip(labels[0].tolist(), distances[0].tolist()))
+            except RuntimeError:
+                # the filtered graph walk found fewer than k rows, e.g. in a small
+                # type group, scan them all instead
+                pass
+        distances = 1.0 - self.matrix @ query
+        distances[~type_mask] = np.inf
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+        return list(zip(top.tolist(), distances[top].tolist()))
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        block_types: Sequence[str],
+        limit: int,
+        threshold: float,
+    ) -> List[Tuple[asUUID, float]]:
+        """
+        Return up to `limit` unique blocks as (block_id, cosine distance), best first.
+        The distance of a block is the minimum over its embeddings.
+
+        `limit * block_search_overfetch` rows are read, and the read is doubled
+        only while blocks with several embeddings leave fewer than `limit` blocks.
+        """
+        if not self.block_ids or limit <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        type_mask = np.isin(self.block_types, list(block_types))
+        rows = int(type_mask.sum())
+        if rows == 0:
+            return []
+
+        k = min(limit * DEFAULT_CORE_CONFIG.block_search_overfetch, rows)
+        while True:
+            hits = self._nearest_rows(query, type_mask, k)
+            best: dict[asUUID, float] = {}
+            for i, d in hits:
+                if d > threshold or len(best) >= limit:
+                    break
+                best.setdefault(self.block_ids[i], d)
+            # done when full, out of rows, or the rows left are beyond the threshold
+            if len(best) >= limit or k >= rows or hits[-1][1] > threshold:
+                return list(best.items())
+            k = min(k * 2, rows)
+
+
+VECTOR_INDEX_CACHE: ByteLRUCache[asUUID, SpaceVectorIndex] = ByteLRUCache(
+    "block_vector_index",
+    max_bytes=DEFAULT_CORE_CONFIG.block_vector_index_max_bytes,
+)
+_LOADING_TASKS: dict[asUUID, asyncio.Task] = {}
+
+
+async def _load_space_index(
+    db_session: AsyncSession, space_id: asUUID, version: int
+) -> SpaceVectorIndex:
+    query = (
+        select(
+            BlockEmbedding.block_id, BlockEmbedding.block_type, BlockEmbedding.embedding
+        )
+        .join(Block, Block.id == BlockEmbedding.block_id)
+        .where(
+            BlockEmbedding.space_id == space_id,
+            Block.is_archived == False,  # noqa: E712
+        )
+    )
+    result = await db_session.execute(query)
+    rows = result.all()
+    embeddings = (
+        np.stack([np.asarray(row[2], dtype=np.float32) for row in rows])
+        if rows
+        else np.zeros((0, DEFAULT_CORE_CONFIG.block_embedding_dim), dtype=np.float32)
+    )
+    return await asyncio.to_thread(
+        SpaceVectorIndex,
+        space_id,
+        version,
+        [row[0] for row in rows],
+        [row[1] for row in rows],
+        embeddings,
+        DEFAULT_CORE_CONFIG.block_vector_index_hnsw_min_rows,
+    )
+
+
+async def _warm_space_index(space_id: asUUID, version: int) -> None:
+    try:
+        async with DB_CLIENT.get_session_context() as db_session:
+            index = await _load_space_index(db_session, space_id, version)
+        VECTOR_INDEX_CACHE.set(space_id, index, index.nbytes)
+        LOG.info(
+            f"Loaded vector index of space {space_id} at version {version}: "
+            f"{len(index.block_ids)} rows, {index.nbytes} bytes, hnsw={index.hnsw is not None}"
+        )
+    except Exception as e:
+        LOG.error(
+            f"Failed to load vector index of space {space_id}: {e}",
+            extra={"traceback": traceback.format_exc()},
+        )
+    finally:
+        _LOADING_TASKS.pop(space_id, None)
+
+
+async def search_space_index(
+    db_session: AsyncSession,
+    space_id: asUUID,
+    query_embedding: Sequence[float],
+    block_types: Sequence[str],
+    limit: int,
+    threshold: float,
+) -> Optional[List[Tuple[asUUID, float]]]:
+    """
+    Search the in-memory index of a space. Returns None on a miss, the caller
+    should fall back to pgvector; the index is then loaded in the background.
+    """
+    if not DEFAULT_CORE_CONFIG.block_vector_index_enabled:
+        return None
+    if space_id in db_session.info.get(CHANGED_SPACES, ()):
+        # the index can't see the uncommitted writes of this session
+        return None
+    try:
+        version = await get_space_version(space_id)
+    except Exception as e:
+        LOG.warning(f"Failed to read version of space {space_id}: {e}")
+        return None
+
+    index = VECTOR_INDEX_CACHE.get(space_id)
+    if index is not None and index.version == version:
+        return await asyncio.to_thread(
+            index.search, query_embedding, block_types, limit, threshold
+        )
+    if index is not None:
+        VECTOR_INDEX_CACHE.invalidate(space_id)
+    if space_id not in _LOADING_TASKS:
+        _LOADING_TASKS[space_id] = asyncio.create_task(
+            _warm_space_index(space_id, version)
+        )
+    return None
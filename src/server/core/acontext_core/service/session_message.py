@@ -1,5 +1,6 @@
 import asyncio
-from ..env import LOG, DEFAULT_CORE_CONFIG
+from typing import List, Optional
+from ..env import LOG, DEFAULT_CORE_CONFIG, bound_logging_vars
 from ..infra.db import DB_CLIENT
 from ..infra.async_mq import (
     register_consumer,
@@ -8,6 +9,8 @@ from ..infra.async_mq import (
     ConsumerConfigData,
     SpecialHandler,
 )
+from ..infra.delayed_publish import DELAYED_PUBLISHER
+from ..infra.s3 import FetchPriority
 from ..schema.mq.session import InsertNewMessage
 from ..schema.utils import asUUID
 from ..schema.result import Result
@@ -15,18 +18,25 @@ from .constants import EX, RK
 from .data import message as MD
 from .data import project as PD
 from .controller import message as MC
-from .utils import check_redis_lock_or_set, release_redis_lock
+from .utils import (
+    check_redis_lock_or_set,
+    release_redis_lock,
+    observe_session_notify,
+    claim_session_notify,
+)
 
 
 async def waiting_for_message_notify(wait_for_seconds: int, body: InsertNewMessage):
     LOG.info(
         f"Session message buffer is not full, wait {wait_for_seconds} seconds for next turn/idle notify"
     )
-    await asyncio.sleep(wait_for_seconds)
-    await MQ_CLIENT.publish(
+    # Keyed by session: a newer notify replaces the pending one of the same session
+    await DELAYED_PUBLISHER.publish_later(
         exchange_name=EX.session_message,
         routing_key=RK.session_message_buffer_process,
         body=body.model_dump_json(),
+        delay_seconds=wait_for_seconds,
+        dedup_key=f"{RK.session_message_buffer_process}.{body.session_id}",
     )
 
 
@@ -36,9 +46,74 @@ async def waiting_for_message_notify(wait_for_seconds: int, body: InsertNewMessa
         exchange_name=EX.session_message,
         routing_key=RK.session_message_insert,
         queue_name="session.message.insert.entry",
+        max_batch_size=DEFAULT_CORE_CONFIG.session_message_insert_max_batch_size,
+        max_batch_linger_ms=DEFAULT_CORE_CONFIG.session_message_insert_max_batch_linger_ms,
     ),
 )
-async def insert_new_message(body: InsertNewMessage, message: Message):
+async def insert_new_messages(
+    bodies: List[InsertNewMessage], messages: List[Message]
+):
+    # One DB check per session is enough: at most one of the delivered
+    # notifications can be the latest pending message of the session.
+    sessions: dict[asUUID, list[tuple[InsertNewMessage, Message]]] = {}
+    for body, message in zip(bodies, messages):
+        sessions.setdefault(body.session_id, []).append((body, message))
+    if len(sessions) < len(bodies):
+        LOG.debug(
+            f"Coalesced {len(bodies)} insert notifications into {len(sessions)} sessions"
+        )
+    await asyncio.gather(*[settle_session_notify(group) for group in sessions.values()])
+
+
+async def settle_session_notify(group: list[tuple[InsertNewMessage, Message]]):
+    # Ack/reject the session's notifications once done, so a timeout or a retry of
+    # the batch only reruns the sessions still in flight
+    body = group[-1][0]
+    with bound_logging_vars(project_id=body.project_id, session_id=body.session_id):
+        try:
+            await insert_coalesced_messages([b for b, _ in group])
+        except Exception as e:
+            LOG.error(
+                f"Failed to process insert notifications of session {body.session_id}: {e}"
+            )
+            for _, message in group:
+                await message.reject(requeue=False)
+            return
+    for _, message in group:
+        await message.ack()
+
+
+async def coalesce_session_notify(
+    key: str, bodies: List[InsertNewMessage]
+) -> Optional[set[asUUID]]:
+    # Notifications of the same session delivered to any consumer are folded into
+    # the last observed one, so superseded ones never reach the DB.
+    session_id = bodies[-1].session_id
+    await observe_session_notify(key, session_id, [b.message_id for b in bodies])
+    candidate_message_ids = await claim_session_notify(
+        key, session_id, bodies[-1].message_id
+    )
+    if candidate_message_ids is None:
+        LOG.debug(
+            f"Notifications {[str(b.message_id) for b in bodies]} of session {session_id} "
+            f"are superseded by a later one, ignore"
+        )
+    return candidate_message_ids
+
+
+async def insert_coalesced_messages(bodies: List[InsertNewMessage]):
+    candidate_message_ids = await coalesce_session_notify(
+        RK.session_message_insert, bodies
+    )
+    if candidate_message_ids is None:
+        return
+    await insert_new_message(bodies[-1], candidate_message_ids=candidate_message_ids)
+
+
+async def insert_new_message(
+    body: InsertNewMessage, candidate_message_ids: Optional[set[asUUID]] = None
+):
+    candidate_message_ids = candidate_message_ids or {body.message_id}
     LOG.debug(f"Insert new message {body.message_id}")
     async with DB_CLIENT.get_session_context() as read_session:
         r = await MD.get_message_ids(read_session, body.session_id)
@@ -49,11 +124,12 @@ async def insert_new_message(body: InsertNewMessage, message: Message):
             LOG.debug(f"No pending message found for session {body.session_id}, ignore")
             return
         latest_pending_message_id = message_ids[0]
-        if body.message_id != latest_pending_message_id:
+        if latest_pending_message_id not in candidate_message_ids:
             LOG.debug(
                 f"Message {body.message_id} is not the latest pending message, ignore"
             )
             return
+        body = body.model_copy(update={"message_id": latest_pending_message_id})
 
         r = await PD.get_project_config(read_session, body.project_id)
         project_config, eil = r.unpack()
@@ -68,10 +144,8 @@ async def insert_new_message(body: InsertNewMessage, message: Message):
             pending_message_length
             < project_config.project_session_message_buffer_max_turns
         ):
-            asyncio.create_task(
-                waiting_for_message_notify(
-                    project_config.project_session_message_buffer_ttl_seconds, body
-                )
+            await waiting_for_message_notify(
+                project_config.project_session_message_buffer_ttl_seconds, body
             )
             return
 
@@ -140,6 +214,11 @@ register_consumer(
     ),
 )
 async def buffer_new_message(body: InsertNewMessage, message: Message):
+    candidate_message_ids = await coalesce_session_notify(
+        RK.session_message_buffer_process, [body]
+    )
+    if candidate_message_ids is None:
+        return
     async with DB_CLIENT.get_session_context() as session:
         r = await MD.get_message_ids(session, body.session_id)
         message_ids, eil = r.unpack()
@@ -149,11 +228,12 @@ async def buffer_new_message(body: InsertNewMessage, message: Message):
             LOG.debug(f"No pending message found for session {body.session_id}, ignore")
             return
         latest_pending_message_id = message_ids[0]
-        if body.message_id != latest_pending_message_id:
+        if latest_pending_message_id not in candidate_message_ids:
             LOG.debug(
                 f"Message {body.message_id} is not the latest pending message, ignore"
             )
             return
+        body = body.model_copy(update={"message_id": latest_pending_message_id})
         r = await PD.get_project_config(session, body.project_id)
         project_config, eil = r.unpack()
         if eil:
@@ -205,8 +285,9 @@ async def flush_session_message_blocking(
             project_config, eil = r.unpack()
             if eil:
                 return r
+        # the caller of the flush API waits on these reads
         r = await MC.process_session_pending_message(
-            project_config, project_id, session_id
+            project_config, project_id, session_id, priority=FetchPriority.HIGH
         )
         return r
     finally:
@@ -1,3 +1,4 @@
+from typing import Optional
 from ..infra.redis import REDIS_CLIENT
 from ..env import DEFAULT_CORE_CONFIG
 from ..schema.utils import asUUID
@@ -21,3 +22,66 @@ async def release_redis_lock(project_id: asUUID, key: str):
     new_key = f"lock.{project_id}.{key}"
     async with REDIS_CLIENT.get_client_context() as client:
         await client.delete(new_key)
+
+
+# Claim the pending notifications of a session: superseded if a later one was published
+# or observed, otherwise take (and clear) every id observed since the last claim.
+_CLAIM_NOTIFY_SCRIPT = """
+local published = redis.call('GET', KEYS[3])
+if published and published ~= ARGV[1] then
+    return false
+end
+local latest = redis.call('GET', KEYS[1])
+if latest and latest ~= ARGV[1] then
+    return false
+end
+local ids = redis.call('SMEMBERS', KEYS[2])
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+return ids
+"""
+
+
+def _notify_keys(key: str, session_id: asUUID) -> tuple[str, str, str]:
+    # `.published` is written by the API right after it publishes a notification,
+    # so superseded ones are skipped even when they are consumed before the later one
+    return (
+        f"notify.{key}.{session_id}.latest",
+        f"notify.{key}.{session_id}.seen",
+        f"notify.{key}.{session_id}.published",
+    )
+
+
+async def observe_session_notify(
+    key: str, session_id: asUUID, message_ids: list[asUUID]
+):
+    """Record delivered notifications of a session, the last id becomes the latest"""
+    latest_key, seen_key, _ = _notify_keys(key, session_id)
+    ttl = DEFAULT_CORE_CONFIG.session_message_notify_coalesce_ttl_seconds
+    async with REDIS_CLIENT.get_client_context() as client:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.sadd(seen_key, *[str(m) for m in message_ids])
+            pipe.set(latest_key, str(message_ids[-1]), ex=ttl)
+            pipe.expire(seen_key, ttl)
+            await pipe.execute()
+
+
+async def claim_session_notify(
+    key: str, session_id: asUUID, message_id: asUUID
+) -> Optional[set[asUUID]]:
+    """
+    Return None if a later notification of the session was published or observed (it
+    will carry this one), otherwise the ids of all notifications coalesced into this one.
+    """
+    latest_key, seen_key, published_key = _notify_keys(key, session_id)
+    async with REDIS_CLIENT.get_client_context() as client:
+        ids = await client.eval(
+            _CLAIM_NOTIFY_SCRIPT,
+            3,
+            latest_key,
+            seen_key,
+            published_key,
+            str(message_id),
+        )
+    if ids is None:
+        return None
+    return {asUUID(m) for m in ids} | {message_id}
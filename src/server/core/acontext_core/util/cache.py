@@ -0,0 +1,286 @@
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, Optional, Protocol, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class TTLLRUCache(Generic[K, V]):
+    """
+    In-process LRU cache with a per-entry TTL.
+
+    Not thread-safe, meant to be shared by coroutines of a single event loop.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: float):
+        assert max_size > 0, "max_size must be positive"
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        CACHE_REGISTRY[name] = self
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, record=False) is not None
+
+    def get(self, key: K, record: bool = True) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            if record:
+                self.stats.misses += 1
+            return None
+        expire_at, value = entry
+        if expire_at < time.monotonic():
+            del self._data[key]
+            self.stats.expirations += 1
+            if record:
+                self.stats.misses += 1
+            return None
+        self._data.move_to_end(key)
+        if record:
+            self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        if self._data.pop(key, None) is None:
+            return False
+        self.stats.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._data)
+        self._data.clear()
+
+    def info(self) -> dict:
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            **self.stats.to_dict(),
+        }
+
+
+class ByteLRUCache(Generic[K, V]):
+    """
+    In-process LRU cache bounded by the total weight (in bytes) of its entries.
+
+    The weight of an entry is given by the caller, entries heavier than the
+    whole budget are not cached.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.total_bytes = 0
+        self._data: OrderedDict[K, tuple[int, V]] = OrderedDict()
+        CACHE_REGISTRY[name] = self
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return entry[1]
+
+    def set(self, key: K, value: V, size_bytes: int) -> None:
+        self.invalidate(key)
+        if size_bytes > self.max_bytes:
+            return
+        self._data[key] = (size_bytes, value)
+        self.total_bytes += size_bytes
+        while self.total_bytes > self.max_bytes:
+            _, (evicted_size, _) = self._data.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry[0]
+        self.stats.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._data)
+        self._data.clear()
+        self.total_bytes = 0
+
+    def info(self) -> dict:
+        return {
+            "size": len(self._data),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            **self.stats.to_dict(),
+        }
+
+
+_HEX_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+
+class DiskBlobCache:
+    """
+    Content-addressed blob cache on the local disk, bounded by total bytes.
+
+    Files are written atomically (temp file + rename), so concurrent readers never
+    see partial blobs. Disk IO runs in worker threads.
+    """
+
+    def __init__(self, name: str, root_dir: str, max_bytes: int):
+        self.name = name
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.total_bytes = 0
+        self._index: Optional[OrderedDict[str, int]] = None
+        # guards the index, which is touched from worker threads
+        self._lock = threading.Lock()
+        CACHE_REGISTRY[name] = self
+
+    def _path(self, key: str) -> str:
+        digest = key if _HEX_DIGEST.match(key) else hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.root_dir, digest[:2], digest)
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        # Rebuild the LRU order from mtimes of blobs left by previous runs
+        if self._index is not None:
+            return self._index
+        entries = []
+        os.makedirs(self.root_dir, exist_ok=True)
+        for shard in os.scandir(self.root_dir):
+            if not shard.is_dir():
+                continue
+            for f in os.scandir(shard.path):
+                if f.is_file() and _HEX_DIGEST.match(f.name):
+                    st = f.stat()
+                    entries.append((st.st_mtime, f.path, st.st_size))
+        entries.sort()
+        self._index = OrderedDict((path, size) for _, path, size in entries)
+        self.total_bytes = sum(self._index.values())
+        return self._index
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                index = self._load_index()
+                self.total_bytes -= index.pop(path, 0)
+            return None
+        with self._lock:
+            index = self._load_index()
+            self.total_bytes += len(data) - index.pop(path, 0)
+            index[path] = len(data)
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        evict_paths = []
+        with self._lock:
+            index = self._load_index()
+            self.total_bytes += len(data) - index.pop(path, 0)
+            index[path] = len(data)
+            while self.total_bytes > self.max_bytes and index:
+                evict_path, evict_size = index.popitem(last=False)
+                self.total_bytes -= evict_size
+                self.stats.evictions += 1
+                evict_paths.append(evict_path)
+        for evict_path in evict_paths:
+            try:
+                os.unlink(evict_path)
+            except FileNotFoundError:
+                pass
+
+    async def get(self, key: str) -> Optional[bytes]:
+        data = await asyncio.to_thread(self._read, key)
+        if data is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return data
+
+    async def set(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, key, data)
+
+    def info(self) -> dict:
+        return {
+            "root_dir": self.root_dir,
+            "size": len(self._index or {}),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            **self.stats.to_dict(),
+        }
+
+
+class _Cache(Protocol):
+    def info(self) -> dict: ...
+
+
+CACHE_REGISTRY: dict[str, _Cache] = {}
+
+
+def get_cache_stats() -> dict[str, dict]:
+    return {name: cache.info() for name, cache in CACHE_REGISTRY.items()}
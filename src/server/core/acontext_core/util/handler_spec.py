@@ -1,13 +1,26 @@
 import inspect
 from aio_pika import Message
 from pydantic import BaseModel
-from typing import Callable, get_type_hints
+from typing import Callable, get_type_hints, get_origin, get_args
 from ..schema.result import Result
 
 MUST_PARAM_ORDER_NAMES = ["body", "message"]
 MUST_PARAM_TYPES = {"message": Message}
 MUST_PARAM_SUB_TYPES = {"body": BaseModel}
 
+MUST_BATCH_PARAM_ORDER_NAMES = ["bodies", "messages"]
+MUST_BATCH_PARAM_ITEM_TYPES = {"messages": Message}
+MUST_BATCH_PARAM_ITEM_SUB_TYPES = {"bodies": BaseModel}
+
+
+def _list_item_type(hint) -> type | None:
+    if get_origin(hint) is not list:
+        return None
+    args = get_args(hint)
+    if len(args) != 1:
+        return None
+    return args[0]
+
 
 def check_handler_function_sanity(func: Callable) -> Result[None]:
     type_hints = get_type_hints(func)
@@ -36,3 +49,38 @@ def check_handler_function_sanity(func: Callable) -> Result[None]:
 def get_handler_body_type(func: Callable) -> BaseModel | None:
     type_hints = get_type_hints(func)
     return type_hints["body"]
+
+
+def check_batch_handler_function_sanity(func: Callable) -> Result[None]:
+    type_hints = get_type_hints(func)
+
+    sig = inspect.signature(func)
+    params = list(sig.parameters.values())
+    if len(params) < len(MUST_BATCH_PARAM_ORDER_NAMES):
+        return Result.reject(
+            f"Batch handler needs parameters {MUST_BATCH_PARAM_ORDER_NAMES}"
+        )
+
+    for i, n in enumerate(MUST_BATCH_PARAM_ORDER_NAMES):
+        if params[i].name != n:
+            return Result.reject(
+                f"{i}th Parameter order mismatch: {params[i].name} != {n}"
+            )
+    for k, v in MUST_BATCH_PARAM_ITEM_TYPES.items():
+        if _list_item_type(type_hints.get(k)) is not v:
+            return Result.reject(
+                f"Parameter type mismatch {k}:{type_hints.get(k)} != List[{v}]"
+            )
+
+    for k, v in MUST_BATCH_PARAM_ITEM_SUB_TYPES.items():
+        item_type = _list_item_type(type_hints.get(k))
+        if not isinstance(item_type, type) or not issubclass(item_type, v):
+            return Result.reject(
+                f"Parameter sub type mismatch {k}:{type_hints.get(k)} is not List of subclass of {v}"
+            )
+    return Result.resolve(None)
+
+
+def get_batch_handler_body_type(func: Callable) -> BaseModel | None:
+    type_hints = get_type_hints(func)
+    return _list_item_type(type_hints["bodies"])
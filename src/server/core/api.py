@@ -4,38 +4,54 @@ from pydantic import ValidationError
 from typing import Optional, List
 from fastapi import FastAPI, Query, Path, Body
 from fastapi.exceptions import HTTPException
-from acontext_core.di import setup, cleanup, MQ_CLIENT, LOG, DB_CLIENT
+from fastapi.responses import StreamingResponse
+from acontext_core.di import setup, cleanup, MQ_CLIENT, DELAYED_PUBLISHER, LOG, DB_CLIENT
+from acontext_core.service.block_embedding import sweep_pending_block_embeddings
 from acontext_core.telemetry.otel import setup_otel_tracing, instrument_fastapi, shutdown_otel_tracing
 from acontext_core.telemetry.config import TelemetryConfig
 from acontext_core.schema.api.request import (
     SearchMode,
+    GrepMode,
     ToolRenameRequest,
     InsertBlockRequest,
+    BatchSearchRequest,
 )
 from acontext_core.schema.api.response import (
     SearchResultBlockItem,
     SpaceSearchResult,
+    SpaceSearchEvent,
+    BatchSearchResult,
     InsertBlockResponse,
     Flag,
     LearningStatusResponse,
+    VectorIndexStatus,
+    VectorIndexHealthResponse,
 )
 from acontext_core.schema.tool.tool_reference import ToolReferenceData
 from acontext_core.schema.utils import asUUID
 from acontext_core.schema.block.sop_block import SOPData
+from acontext_core.schema.block.general import LocatedContentBlock
 from acontext_core.schema.orm.block import (
     BLOCK_TYPE_SOP,
     PATH_BLOCK,
+    CONTENT_BLOCK,
+)
+from acontext_core.schema.orm.block_embedding import (
+    VECTOR_INDEX_GROUPS,
+    fetch_vector_index_status,
 )
 from acontext_core.env import DEFAULT_CORE_CONFIG
+from acontext_core.util.cache import get_cache_stats
 from acontext_core.llm.agent import space_search as SS
 from acontext_core.service.data import block as BB
 from acontext_core.service.data import block_write as BW
 from acontext_core.service.data import block_search as BS
 from acontext_core.service.data import block_render as BR
+from acontext_core.service.data import search_cache as SC
 from acontext_core.service.data import tool as TT
 from acontext_core.service.data import session as SD
 from acontext_core.service.session_message import flush_session_message_blocking
-from acontext_core.schema.orm import Task
+from acontext_core.schema.orm import Task, BlockEmbedding
 from sqlalchemy import select, func, cast, Integer
 
 # Setup OpenTelemetry tracing before app creation
@@ -68,10 +84,13 @@ async def lifespan(app: FastAPI):
     
     # Run consumer in the background
     asyncio.create_task(MQ_CLIENT.start())
+    asyncio.create_task(DELAYED_PUBLISHER.start())
+    pending_embedding_sweeper = asyncio.create_task(sweep_pending_block_embeddings())
     
     yield
     
     # Shutdown
+    pending_embedding_sweeper.cancel()
     if tracer_provider:
         try:
             shutdown_otel_tracing()
@@ -100,7 +119,11 @@ if tracer_provider:
 
 
 async def semantic_grep_search_func(
-    threshold: Optional[float], space_id: asUUID, query: str, limit: int
+    threshold: Optional[float],
+    space_id: asUUID,
+    query: str,
+    limit: int,
+    mode: GrepMode = "fast",
 ) -> List[SearchResultBlockItem]:
     search_threshold = (
         threshold
@@ -108,10 +131,31 @@ async def semantic_grep_search_func(
         else DEFAULT_CORE_CONFIG.block_embedding_search_cosine_distance_threshold
     )
 
+    return await SC.cached_search(
+        space_id,
+        "semantic_grep",
+        query,
+        {"limit": limit, "threshold": search_threshold, "mode": mode},
+        lambda: _semantic_grep(space_id, query, limit, search_threshold, mode),
+    )
+
+
+async def _semantic_grep(
+    space_id: asUUID,
+    query: str,
+    limit: int,
+    search_threshold: float,
+    mode: GrepMode,
+) -> List[SearchResultBlockItem]:
     # Get database session
     async with DB_CLIENT.get_session_context() as db_session:
         # Perform search
-        result = await BS.search_content_blocks(
+        search_func = (
+            BS.search_content_blocks_hybrid
+            if mode == "hybrid"
+            else BS.search_content_blocks
+        )
+        result = await search_func(
             db_session,
             space_id,
             query,
@@ -128,12 +172,14 @@ async def semantic_grep_search_func(
         block_distances = result.data
         search_results = []
 
-        for block, distance in block_distances:
-            r = await BR.render_content_block(db_session, space_id, block)
-            if not r.ok():
-                LOG.error(f"Render failed: {r.error}")
-                raise HTTPException(status_code=500, detail=str(r.error))
-            rendered_block = r.data
+        r = await BR.render_content_blocks(
+            db_session, space_id, [block for block, _ in block_distances]
+        )
+        if not r.ok():
+            LOG.error(f"Render failed: {r.error}")
+            raise HTTPException(status_code=500, detail=str(r.error))
+
+        for (block, distance), rendered_block in zip(block_distances, r.data):
             if rendered_block.props is None:
                 continue
             item = SearchResultBlockItem(
@@ -179,6 +225,18 @@ async def semantic_glob(
         else DEFAULT_CORE_CONFIG.block_embedding_search_cosine_distance_threshold
     )
 
+    return await SC.cached_search(
+        space_id,
+        "semantic_glob",
+        query,
+        {"limit": limit, "threshold": search_threshold},
+        lambda: _semantic_glob(space_id, query, limit, search_threshold),
+    )
+
+
+async def _semantic_glob(
+    space_id: asUUID, query: str, limit: int, search_threshold: float
+) -> List[SearchResultBlockItem]:
     # Get database session
     async with DB_CLIENT.get_session_context() as db_session:
         # Perform search
@@ -227,6 +285,10 @@ async def semantic_grep(
         le=2.0,
         description="Cosine distance threshold (0=identical, 2=opposite). Uses config default if not specified",
     ),
+    mode: GrepMode = Query(
+        "fast",
+        description="'fast' for vector search, 'hybrid' to fuse it with full-text search",
+    ),
 ) -> List[SearchResultBlockItem]:
     """
     Search for pages and folders by title using semantic vector similarity.
@@ -235,8 +297,19 @@ async def semantic_grep(
     - **query**: Search query text
     - **limit**: Maximum number of results (1-100, default 10)
     - **threshold**: Optional distance threshold (uses config default if not provided)
+    - **mode**: 'fast' or 'hybrid' (vector + full-text, fused by reciprocal rank)
     """
-    return await semantic_grep_search_func(threshold, space_id, query, limit)
+    return await semantic_grep_search_func(threshold, space_id, query, limit, mode)
+
+
+def _cited_block(located_block: LocatedContentBlock) -> SearchResultBlockItem:
+    return SearchResultBlockItem(
+        block_id=located_block.render_block.block_id,
+        title=located_block.render_block.title,
+        type=located_block.render_block.type,
+        props=located_block.render_block.props,
+        distance=None,
+    )
 
 
 @app.get("/api/v1/project/{project_id}/space/{space_id}/experience_search")
@@ -260,10 +333,27 @@ async def search_space(
         le=100,
         description="Maximum number of iterations for agentic search",
     ),
+    max_latency_ms: Optional[int] = Query(
+        None,
+        ge=1,
+        le=600000,
+        description="Latency budget of agentic search in milliseconds, unlimited if not specified",
+    ),
+    max_tokens: Optional[int] = Query(
+        None,
+        ge=1,
+        description="LLM token budget of agentic search, unlimited if not specified",
+    ),
+    fast_path_threshold: Optional[float] = Query(
+        None,
+        ge=0.0,
+        le=2.0,
+        description="Run a hybrid search first and skip the agent if it finds blocks within this cosine distance",
+    ),
 ) -> SpaceSearchResult:
-    if mode == "fast":
+    if mode in ("fast", "hybrid"):
         cited_blocks = await semantic_grep_search_func(
-            semantic_threshold, space_id, query, limit
+            semantic_threshold, space_id, query, limit, mode
         )
         return SpaceSearchResult(cited_blocks=cited_blocks, final_answer=None)
     elif mode == "agentic":
@@ -273,27 +363,190 @@ async def search_space(
             query,
             limit,
             max_iterations=max_iterations,
+            max_latency_ms=max_latency_ms,
+            max_tokens=max_tokens,
+            fast_path_threshold=fast_path_threshold,
         )
         if not r.ok():
             raise HTTPException(status_code=500, detail=r.error)
-        cited_blocks = [
-            SearchResultBlockItem(
-                block_id=b.render_block.block_id,
-                title=b.render_block.title,
-                type=b.render_block.type,
-                props=b.render_block.props,
-                distance=None,
-            )
-            for b in r.data.located_content_blocks
-        ]
+        cited_blocks = [_cited_block(b) for b in r.data.located_content_blocks]
         result = SpaceSearchResult(
-            cited_blocks=cited_blocks, final_answer=r.data.final_answer
+            cited_blocks=cited_blocks,
+            final_answer=r.data.final_answer,
+            usage=r.data.usage,
         )
         return result
     else:
         raise HTTPException(status_code=400, detail=f"Invalid search mode: {mode}")
 
 
+@app.get("/api/v1/project/{project_id}/space/{space_id}/experience_search/stream")
+async def search_space_stream(
+    project_id: asUUID = Path(..., description="Project ID to search within"),
+    space_id: asUUID = Path(..., description="Space ID to search within"),
+    query: str = Query(..., description="Search query for page/folder titles"),
+    limit: int = Query(
+        10, ge=1, le=50, description="Maximum number of results to return"
+    ),
+    max_iterations: int = Query(
+        16,
+        ge=1,
+        le=100,
+        description="Maximum number of iterations for agentic search",
+    ),
+    max_latency_ms: Optional[int] = Query(
+        None,
+        ge=1,
+        le=600000,
+        description="Latency budget of agentic search in milliseconds, unlimited if not specified",
+    ),
+    max_tokens: Optional[int] = Query(
+        None,
+        ge=1,
+        description="LLM token budget of agentic search, unlimited if not specified",
+    ),
+    fast_path_threshold: Optional[float] = Query(
+        None,
+        ge=0.0,
+        le=2.0,
+        description="Run a hybrid search first and skip the agent if it finds blocks within this cosine distance",
+    ),
+) -> StreamingResponse:
+    """
+    Agentic experience search as server-sent events. Every attached block and
+    reported thought is sent as soon as the agent produces it, the stream ends
+    with a 'done' event carrying the whole result or an 'error' event.
+    """
+    events: asyncio.Queue[Optional[SpaceSearchEvent]] = asyncio.Queue()
+
+    async def on_event(kind: str, payload) -> None:
+        if kind == "block":
+            events.put_nowait(
+                SpaceSearchEvent(type="block", block=_cited_block(payload))
+            )
+        elif kind == "thinking":
+            events.put_nowait(SpaceSearchEvent(type="thinking", thinking=payload))
+
+    async def run_search() -> None:
+        try:
+            r = await SS.space_agent_search(
+                project_id,
+                space_id,
+                query,
+                limit,
+                max_iterations=max_iterations,
+                on_event=on_event,
+                max_latency_ms=max_latency_ms,
+                max_tokens=max_tokens,
+                fast_path_threshold=fast_path_threshold,
+            )
+            if r.ok():
+                result = SpaceSearchResult(
+                    cited_blocks=[
+                        _cited_block(b) for b in r.data.located_content_blocks
+                    ],
+                    final_answer=r.data.final_answer,
+                    usage=r.data.usage,
+                )
+                events.put_nowait(SpaceSearchEvent(type="done", result=result))
+            else:
+                events.put_nowait(SpaceSearchEvent(type="error", error=str(r.error)))
+        except Exception as e:
+            LOG.error(f"Streaming search failed: {e}")
+            events.put_nowait(SpaceSearchEvent(type="error", error=str(e)))
+        finally:
+            events.put_nowait(None)
+
+    async def stream():
+        task = asyncio.create_task(run_search())
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(events.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # keep proxies and client read timeouts from closing the stream
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    break
+                yield f"event: {event.type}\ndata: {event.model_dump_json()}\n\n"
+        finally:
+            # the client went away, stop spending LLM calls
+            task.cancel()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/v1/project/{project_id}/space/{space_id}/batch_search")
+async def batch_search(
+    project_id: asUUID = Path(..., description="Project ID to search within"),
+    space_id: asUUID = Path(..., description="Space ID to search within"),
+    request: BatchSearchRequest = Body(..., description="Queries to search"),
+) -> BatchSearchResult:
+    """
+    Run several semantic_grep/semantic_glob queries in one call. All queries are
+    embedded together and searched in a single SQL round trip.
+    """
+    search_threshold = (
+        request.threshold
+        if request.threshold is not None
+        else DEFAULT_CORE_CONFIG.block_embedding_search_cosine_distance_threshold
+    )
+    block_types = CONTENT_BLOCK if request.target == "content" else PATH_BLOCK
+    async with DB_CLIENT.get_session_context() as db_session:
+        r = await BS.search_blocks_batch(
+            db_session,
+            space_id,
+            request.queries,
+            list(block_types),
+            topk=request.limit,
+            threshold=search_threshold,
+            dedupe=request.dedupe,
+        )
+        if not r.ok():
+            LOG.error(f"Search failed: {r.error}")
+            raise HTTPException(status_code=500, detail=str(r.error))
+        per_query = r.data
+
+        props = {
+            block.id: block.props for hits in per_query for block, _ in hits
+        }
+        if request.target == "content":
+            # Render every cited block once, even when several queries cite it
+            blocks = list(
+                {block.id: block for hits in per_query for block, _ in hits}.values()
+            )
+            r = await BR.render_content_blocks(db_session, space_id, blocks)
+            if not r.ok():
+                LOG.error(f"Render failed: {r.error}")
+                raise HTTPException(status_code=500, detail=str(r.error))
+            props = {
+                block.id: rendered_block.props
+                for block, rendered_block in zip(blocks, r.data)
+            }
+
+    return BatchSearchResult(
+        results=[
+            [
+                SearchResultBlockItem(
+                    block_id=block.id,
+                    title=block.title,
+                    type=block.type,
+                    props=props[block.id],
+                    distance=distance,
+                )
+                for block, distance in hits
+                if props[block.id] is not None
+            ]
+            for hits in per_query
+        ]
+    )
+
+
 @app.post("/api/v1/project/{project_id}/space/{space_id}/insert_block")
 async def insert_new_block(
     project_id: asUUID = Path(..., description="Project ID to search within"),
@@ -426,3 +679,47 @@ async def get_learning_status(
             space_digested_count=digested_count,
             not_space_digested_count=not_digested_count,
         )
+
+
+@app.get("/api/v1/health/vector_index")
+async def vector_index_health(
+    recall_sample_size: int = Query(
+        0,
+        ge=0,
+        le=100,
+        description="Number of stored embeddings sampled to estimate recall, 0 to skip",
+    ),
+    recall_topk: int = Query(10, ge=1, le=50, description="Top-k used for recall"),
+) -> VectorIndexHealthResponse:
+    """
+    Build status, size and estimated recall of the managed vector indexes.
+    """
+    async with DB_CLIENT.get_session_context() as db_session:
+        statuses = await fetch_vector_index_status(BlockEmbedding, db_session)
+    indexes = []
+    for status in statuses:
+        index = VectorIndexStatus(**status)
+        if recall_sample_size and index.valid:
+            # Own session, the estimation disables index scans for the transaction
+            async with DB_CLIENT.get_session_context() as db_session:
+                r = await BS.estimate_search_recall(
+                    db_session,
+                    list(VECTOR_INDEX_GROUPS[index.group]),
+                    sample_size=recall_sample_size,
+                    topk=recall_topk,
+                )
+            if not r.ok():
+                raise HTTPException(status_code=500, detail=str(r.error))
+            index.recall = r.data
+        indexes.append(index)
+    return VectorIndexHealthResponse(
+        method=DEFAULT_CORE_CONFIG.block_embedding_vector_index, indexes=indexes
+    )
+
+
+@app.get("/api/v1/health/cache")
+async def cache_health() -> dict[str, dict]:
+    """
+    Size and hit-rate counters of the in-process caches of this replica.
+    """
+    return get_cache_stats()
@@ -0,0 +1,17 @@
+-- Migration: Add messages.parts_inline for small message parts
+-- Date: 2026-10-18
+-- Description: Parts JSON below the API's inline threshold is stored in the message row instead of S3.
+-- Messages with parts_inline set carry an empty parts_asset_meta.
+
+BEGIN;
+
+ALTER TABLE messages
+ADD COLUMN IF NOT EXISTS parts_inline JSONB;
+
+COMMIT;
+
+-- Verify the change
+-- SELECT column_name, data_type, is_nullable
+-- FROM information_schema.columns
+-- WHERE table_name = 'messages' AND column_name = 'parts_inline';
+-- Expected: data_type = 'jsonb', is_nullable = 'YES'
@@ -0,0 +1,17 @@
+-- Migration: Add blocks.embedding_pending for deferred block embeddings
+-- Date: 2026-10-18
+-- Description: With block_embedding_deferred enabled, new blocks are committed without an embedding
+-- and flagged until the space.block.embed consumer writes it.
+
+BEGIN;
+
+ALTER TABLE blocks
+ADD COLUMN IF NOT EXISTS embedding_pending BOOLEAN NOT NULL DEFAULT false;
+
+COMMIT;
+
+-- Verify the change
+-- SELECT column_name, data_type, is_nullable, column_default
+-- FROM information_schema.columns
+-- WHERE table_name = 'blocks' AND column_name = 'embedding_pending';
+-- Expected: data_type = 'boolean', is_nullable = 'NO', column_default = 'false'
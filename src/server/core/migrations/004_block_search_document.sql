@@ -0,0 +1,18 @@
+-- Migration: Add a full-text index over block titles and props
+-- Date: 2026-10-18
+-- Description: Serves the lexical half of hybrid search (semantic_grep/experience_search with mode=hybrid).
+-- The expression must stay identical to BLOCK_SEARCH_DOCUMENT in acontext_core/schema/orm/block.py.
+
+-- CONCURRENTLY can't run inside a transaction block, so there is no BEGIN/COMMIT here
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blocks_search_document
+ON blocks
+USING gin (
+    to_tsvector('simple'::regconfig, title || ' ' ||
+        coalesce(props ->> 'view_when', '') || ' ' ||
+        coalesce(props ->> 'preferences', ''))
+);
+
+-- Verify the change
+-- SELECT indexname, indexdef FROM pg_indexes
+-- WHERE tablename = 'blocks' AND indexname = 'idx_blocks_search_document';
+-- Expected: one row using gin
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import pytest
+from contextlib import asynccontextmanager
+from typing import List
+from aio_pika import Message
+from pydantic import BaseModel
+
+from acontext_core.infra.async_mq import (
+    MQ_CLIENT,
+    ConsumerConfig,
+    ConsumerConfigData,
+    MessageBatcher,
+)
+from acontext_core.util.handler_spec import check_batch_handler_function_sanity
+
+
+class DummyBody(BaseModel):
+    value: int
+
+
+async def single_handler(body: DummyBody, message: Message):
+    pass
+
+
+async def batch_handler(bodies: List[DummyBody], messages: List[Message]):
+    pass
+
+
+async def wrong_batch_handler(bodies: DummyBody, messages: List[Message]):
+    pass
+
+
+def _config_data(**kwargs) -> ConsumerConfigData:
+    return ConsumerConfigData(
+        exchange_name="test.ex", routing_key="test.rk", queue_name="test.q", **kwargs
+    )
+
+
+def test_batch_handler_sanity():
+    assert check_batch_handler_function_sanity(batch_handler).ok()
+    assert not check_batch_handler_function_sanity(single_handler).ok()
+    assert not check_batch_handler_function_sanity(wrong_batch_handler).ok()
+
+
+def test_consumer_config_batch_mode():
+    config = ConsumerConfig(
+        **_config_data(max_batch_size=8).__dict__, handler=batch_handler
+    )
+    assert config.batch_mode
+    assert config.body_pydantic_type is DummyBody
+
+    config = ConsumerConfig(**_config_data().__dict__, handler=single_handler)
+    assert not config.batch_mode
+    assert config.body_pydantic_type is DummyBody
+
+    with pytest.raises(ValueError):
+        ConsumerConfig(**_config_data(max_batch_size=8).__dict__, handler=single_handler)
+
+
+@pytest.mark.asyncio
+async def test_message_batcher_flush_on_size():
+    batches = []
+    batcher = MessageBatcher(3, 10_000, batches.append)
+    for i in range(7):
+        batcher.add(i)
+    assert batches == [[0, 1, 2], [3, 4, 5]]
+    assert len(batcher) == 1
+    batcher.flush()
+    assert batches[-1] == [6]
+    assert len(batcher) == 0
+
+
+@pytest.mark.asyncio
+async def test_message_batcher_flush_on_linger():
+    batches = []
+    batcher = MessageBatcher(100, 20, batches.append)
+    batcher.add("a")
+    batcher.add("b")
+    assert batches == []
+    await asyncio.sleep(0.05)
+    assert batches == [["a", "b"]]
+
+    batcher.add("c")
+    batcher.discard()
+    await asyncio.sleep(0.05)
+    assert batches == [["a", "b"]]
+
+
+class _FakeMessage:
+    def __init__(self, value: int):
+        self.body = json.dumps({"value": value}).encode("utf-8")
+        self.headers = {}
+        self.processed = False
+        self.acked = False
+
+    @asynccontextmanager
+    async def process(self, requeue=False, ignore_processed=False):
+        yield self
+        if not self.processed:
+            await self.ack()
+
+    async def ack(self):
+        self.processed = self.acked = True
+
+    async def reject(self, requeue=False):
+        self.processed = True
+
+
+@pytest.mark.asyncio
+async def test_batch_retry_only_reruns_unsettled_messages():
+    attempts = []
+
+    async def flaky_handler(bodies: List[DummyBody], messages: List[Message]):
+        attempts.append([b.value for b in bodies])
+        await messages[0].ack()
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+
+    config = ConsumerConfig(
+        **_config_data(max_batch_size=8, retry_delay=0).__dict__,
+        handler=flaky_handler,
+    )
+    messages = [_FakeMessage(i) for i in range(3)]
+    await MQ_CLIENT._process_batch(config, messages)
+
+    assert attempts == [[0, 1, 2], [1, 2]]
+    assert all(m.acked for m in messages)
@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from acontext_core.infra.redis import RedisClient
+from acontext_core.infra.delayed_publish import RedisDelayedPublisher
+
+
+def _publisher(client_instance: RedisClient) -> RedisDelayedPublisher:
+    mq_client = MagicMock()
+    mq_client.publish = AsyncMock()
+    return RedisDelayedPublisher(
+        client_instance,
+        mq_client,
+        namespace="test.mq.delayed",
+        poll_interval_seconds=0.05,
+    )
+
+
+async def _clean(publisher: RedisDelayedPublisher):
+    async with publisher.redis_client.get_client_context() as client:
+        await client.delete(publisher.schedule_key, publisher.payload_key)
+
+
+@pytest.mark.asyncio
+async def test_delayed_publish_fires_after_delay():
+    client_instance = RedisClient()
+    publisher = _publisher(client_instance)
+    await _clean(publisher)
+
+    await publisher.publish_later("ex", "rk", "body-1", delay_seconds=0.2)
+    assert await publisher.poll_once() == 0
+    assert await publisher.pending_count() == 1
+
+    await asyncio.sleep(0.25)
+    assert await publisher.poll_once() == 1
+    publisher.mq_client.publish.assert_awaited_once_with(
+        exchange_name="ex", routing_key="rk", body="body-1"
+    )
+    assert await publisher.pending_count() == 0
+
+    await _clean(publisher)
+    await client_instance.close()
+
+
+@pytest.mark.asyncio
+async def test_delayed_publish_coalesces_by_dedup_key():
+    client_instance = RedisClient()
+    publisher = _publisher(client_instance)
+    await _clean(publisher)
+
+    await publisher.publish_later("ex", "rk", "old", 0, dedup_key="session-1")
+    await publisher.publish_later("ex", "rk", "new", 0, dedup_key="session-1")
+    await publisher.publish_later("ex", "rk", "other", 0, dedup_key="session-2")
+    assert await publisher.pending_count() == 2
+
+    assert await publisher.poll_once() == 2
+    bodies = sorted(
+        c.kwargs["body"] for c in publisher.mq_client.publish.await_args_list
+    )
+    assert bodies == ["new", "other"]
+
+    await _clean(publisher)
+    await client_instance.close()
+
+
+@pytest.mark.asyncio
+async def test_delayed_publish_reschedule_keeps_dedup_key():
+    client_instance = RedisClient()
+    publisher = _publisher(client_instance)
+    await _clean(publisher)
+    publisher.mq_client.publish.side_effect = ConnectionError("mq down")
+
+    await publisher.publish_later("ex", "rk", "old", 0, dedup_key="session-1")
+    assert await publisher.poll_once() == 1
+    assert await publisher.pending_count() == 1
+
+    # a newer entry of the same key replaces the rescheduled one
+    await publisher.publish_later("ex", "rk", "new", 0, dedup_key="session-1")
+    assert await publisher.pending_count() == 1
+
+    publisher.mq_client.publish.side_effect = None
+    await asyncio.sleep(0.06)
+    assert await publisher.poll_once() == 1
+    publisher.mq_client.publish.assert_awaited_with(
+        exchange_name="ex", routing_key="rk", body="new"
+    )
+
+    await _clean(publisher)
+    await client_instance.close()
+
+
+@pytest.mark.asyncio
+async def test_delayed_publish_poller_loop():
+    client_instance = RedisClient()
+    publisher = _publisher(client_instance)
+    await _clean(publisher)
+
+    task = asyncio.create_task(publisher.start())
+    await publisher.publish_later("ex", "rk", "body", delay_seconds=0.1)
+    await asyncio.sleep(0.3)
+    await publisher.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert not publisher.running
+    publisher.mq_client.publish.assert_awaited_once()
+
+    await _clean(publisher)
+    await client_instance.close()
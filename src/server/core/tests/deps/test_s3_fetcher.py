@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+from acontext_core.infra.s3 import PrioritySemaphore, S3FetchScheduler, FetchPriority
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_order():
+    sem = PrioritySemaphore(1)
+    order = []
+
+    async def worker(name, priority):
+        async with sem.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    await sem.acquire()
+    tasks = [
+        asyncio.create_task(worker("low", FetchPriority.LOW)),
+        asyncio.create_task(worker("normal", FetchPriority.NORMAL)),
+        asyncio.create_task(worker("high", FetchPriority.HIGH)),
+    ]
+    await asyncio.sleep(0)
+    assert sem.waiting == 3
+    sem.release()
+    await asyncio.gather(*tasks)
+    assert order == ["high", "normal", "low"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_scheduler_dedup_and_limit():
+    running = 0
+    max_running = 0
+
+    async def download_object(key, bucket=None):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return key.encode()
+
+    client = MagicMock()
+    client.bucket = "test-bucket"
+    client.download_object = MagicMock(side_effect=download_object)
+    fetcher = S3FetchScheduler(client, max_concurrency=2)
+
+    keys = ["a", "a", "b", "c", "d", "a"]
+    results = await asyncio.gather(*[fetcher.download_object(k) for k in keys])
+
+    assert results == [k.encode() for k in keys]
+    assert client.download_object.call_count == 4
+    assert fetcher.deduplicated == 2
+    assert max_running == 2
+    assert fetcher.get_status()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_scheduler_promotes_joined_download():
+    order = []
+    gate = asyncio.Event()
+
+    async def download_object(key, bucket=None):
+        order.append(key)
+        if key == "busy":
+            await gate.wait()
+        return key.encode()
+
+    client = MagicMock()
+    client.bucket = "test-bucket"
+    client.download_object = MagicMock(side_effect=download_object)
+    fetcher = S3FetchScheduler(client, max_concurrency=1)
+
+    busy = asyncio.create_task(fetcher.download_object("busy"))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(fetcher.download_object("low", priority=FetchPriority.LOW)),
+        asyncio.create_task(fetcher.download_object("normal")),
+    ]
+    await asyncio.sleep(0)
+    # an interactive read joins the queued background download
+    joined = asyncio.create_task(
+        fetcher.download_object("low", priority=FetchPriority.HIGH)
+    )
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(busy, joined, *queued)
+
+    assert order == ["busy", "low", "normal"]
+    assert fetcher.deduplicated == 1
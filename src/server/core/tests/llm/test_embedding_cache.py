@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from acontext_core.env import DEFAULT_CORE_CONFIG
+from acontext_core.schema.embedding import EmbeddingReturn
+from acontext_core.llm import embeddings as E
+from acontext_core.llm.embeddings.cache import QUERY_EMBEDDING_CACHE
+
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    calls = []
+
+    async def fake_embedding(model, texts, phase="document"):
+        calls.append(list(texts))
+        return EmbeddingReturn(
+            embedding=np.array([[float(len(t)), 1.0, 2.0] for t in texts]),
+            prompt_tokens=len(texts),
+            total_tokens=len(texts),
+        )
+
+    monkeypatch.setitem(
+        E.FACTORIES, DEFAULT_CORE_CONFIG.block_embedding_provider, fake_embedding
+    )
+    QUERY_EMBEDDING_CACHE.clear()
+    yield calls
+    QUERY_EMBEDDING_CACHE.clear()
+
+
+@pytest.mark.asyncio
+async def test_query_embeddings_are_cached(fake_provider):
+    hits = QUERY_EMBEDDING_CACHE.stats.hits
+
+    r = await E.get_embedding(["hello"], phase="query")
+    assert r.ok()
+    r = await E.get_embedding(["hello", "world!"], phase="query")
+    assert r.ok()
+
+    # only the unseen text is sent to the provider, order is preserved
+    assert fake_provider == [["hello"], ["world!"]]
+    assert r.data.embedding[:, 0].tolist() == [5.0, 6.0]
+    assert QUERY_EMBEDDING_CACHE.stats.hits == hits + 1
+
+    r = await E.get_embedding(["world!"], phase="query")
+    assert r.data.total_tokens == 0
+    assert len(fake_provider) == 2
+
+
+@pytest.mark.asyncio
+async def test_document_embeddings_are_not_cached(fake_provider):
+    await E.get_embedding(["hello"], phase="document")
+    await E.get_embedding(["hello"], phase="document")
+    assert fake_provider == [["hello"], ["hello"]]
@@ -0,0 +1,66 @@
+import asyncio
+import numpy as np
+import pytest
+from acontext_core.schema.embedding import EmbeddingReturn
+from acontext_core.llm.embeddings.coalescer import EmbeddingCoalescer
+
+
+def _fake_embed(calls):
+    async def embed(model, texts, phase):
+        calls.append(list(texts))
+        return EmbeddingReturn(
+            embedding=np.array([[float(len(t))] for t in texts]),
+            prompt_tokens=10 * len(texts),
+            total_tokens=10 * len(texts),
+        )
+
+    return embed
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_request():
+    calls = []
+    coalescer = EmbeddingCoalescer(
+        _fake_embed(calls), max_batch_size=64, max_batch_tokens=10**6, linger_ms=5
+    )
+
+    results = await asyncio.gather(
+        coalescer.embed("m", ["a"], "document"),
+        coalescer.embed("m", ["bb", "ccc"], "document"),
+        coalescer.embed("m", ["dddd"], "query"),
+    )
+
+    assert sorted(calls) == [["a", "bb", "ccc"], ["dddd"]]
+    assert [r.embedding[:, 0].tolist() for r in results] == [
+        [1.0],
+        [2.0, 3.0],
+        [4.0],
+    ]
+    assert sum(r.total_tokens for r in results[:2]) == 30
+
+
+@pytest.mark.asyncio
+async def test_batch_limits_split_requests():
+    calls = []
+    coalescer = EmbeddingCoalescer(
+        _fake_embed(calls), max_batch_size=2, max_batch_tokens=10**6, linger_ms=50
+    )
+
+    await asyncio.gather(*[coalescer.embed("m", [t], "document") for t in "abcde"])
+    assert calls == [["a", "b"], ["c", "d"], ["e"]]
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    async def failing(model, texts, phase):
+        raise RuntimeError("provider down")
+
+    coalescer = EmbeddingCoalescer(
+        failing, max_batch_size=8, max_batch_tokens=10**6, linger_ms=1
+    )
+    results = await asyncio.gather(
+        coalescer.embed("m", ["a"], "document"),
+        coalescer.embed("m", ["b"], "document"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
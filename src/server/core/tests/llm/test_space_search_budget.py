@@ -0,0 +1,106 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+import pytest
+from pydantic import BaseModel
+from acontext_core.llm.agent import space_search as SS
+from acontext_core.schema.block.general import LocatedContentBlock
+from acontext_core.schema.llm import LLMFunction, LLMResponse, LLMToolCall
+from acontext_core.schema.result import Result
+
+
+class _Usage(BaseModel):
+    total_tokens: int
+
+
+class _Raw(BaseModel):
+    usage: _Usage
+
+
+@asynccontextmanager
+async def _no_session():
+    yield None
+
+
+def _thinking_llm(calls: list, tokens: int = 100, delay: float = 0):
+    async def complete(**kwargs):
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return Result.resolve(
+            LLMResponse(
+                role="assistant",
+                raw_response=_Raw(usage=_Usage(total_tokens=tokens)),
+                tool_calls=[
+                    LLMToolCall(
+                        id=f"call_{len(calls)}",
+                        type="function",
+                        function=LLMFunction(
+                            name="report_thinking", arguments={"thinking": "hmm"}
+                        ),
+                    )
+                ],
+            )
+        )
+
+    return complete
+
+
+def _patched(complete):
+    return (
+        patch.object(SS.DB_CLIENT, "get_session_context", _no_session),
+        patch.object(SS, "llm_complete", complete),
+        patch.object(SS, "response_to_sendable_message", lambda m: {}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_token_budget_stops_the_agent():
+    calls = []
+    p1, p2, p3 = _patched(_thinking_llm(calls, tokens=100))
+    with p1, p2, p3:
+        r = await SS.space_agent_search(
+            uuid.uuid4(), uuid.uuid4(), "q", max_iterations=16, max_tokens=250
+        )
+
+    usage = r.unpack()[0].usage
+    assert len(calls) == 3
+    assert usage.iterations == 3
+    assert usage.tokens == 300
+    assert usage.stop_reason == "token_budget"
+
+
+@pytest.mark.asyncio
+async def test_latency_budget_cancels_the_llm_call():
+    calls = []
+    p1, p2, p3 = _patched(_thinking_llm(calls, delay=1))
+    with p1, p2, p3:
+        r = await SS.space_agent_search(
+            uuid.uuid4(), uuid.uuid4(), "q", max_latency_ms=50
+        )
+
+    usage = r.unpack()[0].usage
+    assert usage.iterations == 0
+    assert usage.stop_reason == "latency_budget"
+    assert usage.elapsed_ms < 1000
+
+
+@pytest.mark.asyncio
+async def test_fast_path_skips_the_agent():
+    calls = []
+    located = LocatedContentBlock.model_construct(path="/auth", render_block=None)
+
+    async def fast_path_search(ctx, user_query, threshold):
+        return Result.resolve([located])
+
+    p1, p2, p3 = _patched(_thinking_llm(calls))
+    with p1, p2, p3, patch.object(SS, "fast_path_search", fast_path_search):
+        r = await SS.space_agent_search(
+            uuid.uuid4(), uuid.uuid4(), "q", fast_path_threshold=0.2
+        )
+
+    ctx = r.unpack()[0]
+    assert calls == []
+    assert ctx.located_content_blocks == [located]
+    assert ctx.usage.fast_path
+    assert ctx.usage.stop_reason == "fast_path"
@@ -0,0 +1,44 @@
+from unittest.mock import patch
+from acontext_core.env import DEFAULT_CORE_CONFIG
+from acontext_core.schema.orm import BlockEmbedding
+from acontext_core.schema.orm.block_embedding import (
+    vector_index_ddl,
+    vector_search_settings,
+)
+
+
+def test_hnsw_ddl_is_partial_per_group():
+    ddl = vector_index_ddl(BlockEmbedding, "path", "hnsw")
+    assert ddl.startswith(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_block_embeddings_path_hnsw"
+    )
+    assert "USING hnsw (embedding vector_cosine_ops)" in ddl
+    assert "WITH (m = 16, ef_construction = 64)" in ddl
+    assert ddl.endswith("WHERE block_type IN ('folder', 'page')")
+
+
+def test_ivfflat_ddl():
+    ddl = vector_index_ddl(BlockEmbedding, "content", "ivfflat")
+    assert "idx_block_embeddings_content_ivfflat" in ddl
+    assert "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)" in ddl
+    assert ddl.endswith("WHERE block_type IN ('sop', 'text')")
+
+
+def test_vector_search_settings_enable_iterative_scan():
+    config = DEFAULT_CORE_CONFIG
+    with patch.object(config, "block_embedding_vector_index", "hnsw"):
+        assert vector_search_settings() == [
+            "SET LOCAL hnsw.ef_search = 100",
+            "SET LOCAL hnsw.iterative_scan = relaxed_order",
+        ]
+    with patch.object(config, "block_embedding_vector_index", "ivfflat"), patch.object(
+        config, "block_embedding_iterative_scan", "strict_order"
+    ):
+        assert vector_search_settings() == [
+            "SET LOCAL ivfflat.probes = 10",
+            "SET LOCAL ivfflat.iterative_scan = relaxed_order",
+        ]
+    with patch.object(config, "block_embedding_vector_index", "hnsw"), patch.object(
+        config, "block_embedding_iterative_scan", "off"
+    ):
+        assert vector_search_settings() == ["SET LOCAL hnsw.ef_search = 100"]
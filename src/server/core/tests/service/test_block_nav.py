@@ -10,12 +10,18 @@ from acontext_core.schema.orm.block import (
     CONTENT_BLOCK,
 )
 from acontext_core.infra.db import DatabaseClient
-from acontext_core.service.data.block import create_new_path_block
+from acontext_core.service.data.block import (
+    create_new_path_block,
+    find_all_parent_ids,
+)
 from acontext_core.schema.block.path_node import repr_path_tree
 from acontext_core.service.data.block_nav import (
     list_paths_under_block,
     get_path_info_by_id,
     read_blocks_from_par_id,
+    read_blocks_page_from_par_id,
+    find_block_by_path,
+    recover_path_by_id,
 )
 
 
@@ -260,6 +266,72 @@ class TestBlockNav:
             # Clean up
             await session.delete(project)
 
+    @pytest.mark.asyncio
+    async def test_resolve_deep_path_both_directions(self):
+        """Test resolving a deep path by name and recovering it by id"""
+        db_client = DatabaseClient()
+        await db_client.create_tables()
+
+        async with db_client.get_session_context() as session:
+            project = Project(
+                secret_key_hmac="test_key_hmac", secret_key_hash_phc="test_key_hash"
+            )
+            session.add(project)
+            await session.flush()
+
+            space = Space(project_id=project.id)
+            session.add(space)
+            await session.flush()
+
+            # - D0/D1/D2/D3/Leaf, with a same-named decoy D0/D1/Leaf
+            folder_ids = []
+            par_id = None
+            for i in range(4):
+                r = await create_new_path_block(
+                    session,
+                    space.id,
+                    f"D{i}",
+                    type=BLOCK_TYPE_FOLDER,
+                    par_block_id=par_id,
+                )
+                assert r.ok()
+                par_id = r.data.id
+                folder_ids.append(par_id)
+            r = await create_new_path_block(
+                session, space.id, "Leaf", par_block_id=par_id
+            )
+            assert r.ok()
+            leaf_id = r.data.id
+            r = await create_new_path_block(
+                session, space.id, "Leaf", par_block_id=folder_ids[1]
+            )
+            assert r.ok()
+
+            r = await find_block_by_path(session, space.id, "/D0/D1/D2/D3/Leaf")
+            assert r.ok()
+            assert r.data.id == leaf_id
+            assert r.data.type == BLOCK_TYPE_PAGE
+
+            r = await find_block_by_path(session, space.id, "/D0/D1/")
+            assert r.ok()
+            assert r.data.id == folder_ids[1]
+            assert r.data.sub_page_num == 1
+            assert r.data.sub_folder_num == 1
+
+            r = await find_block_by_path(session, space.id, "/D0/D2/D3")
+            assert not r.ok()
+
+            r = await recover_path_by_id(session, space.id, leaf_id)
+            assert r.ok()
+            assert r.data == "/D0/D1/D2/D3/Leaf"
+
+            r = await find_all_parent_ids(session, space.id, leaf_id)
+            assert r.ok()
+            assert r.data == [leaf_id] + folder_ids[::-1] + [None]
+
+            # Clean up
+            await session.delete(project)
+
     @pytest.mark.asyncio
     async def test_read_blocks_from_par_id(self):
         """Test reading blocks from a parent block with type filtering"""
@@ -400,3 +472,63 @@ class TestBlockNav:
 
             # Clean up
             await session.delete(project)
+
+    @pytest.mark.asyncio
+    async def test_read_blocks_page_from_par_id(self):
+        """Test reading a range of blocks together with the total count"""
+        db_client = DatabaseClient()
+        await db_client.create_tables()
+
+        async with db_client.get_session_context() as session:
+            project = Project(
+                secret_key_hmac="test_key_hmac", secret_key_hash_phc="test_key_hash"
+            )
+            session.add(project)
+            await session.flush()
+
+            space = Space(project_id=project.id)
+            session.add(space)
+            await session.flush()
+
+            r = await create_new_path_block(session, space.id, "Long Page")
+            assert r.ok()
+            parent_id = r.data.id
+
+            text_blocks = [
+                Block(
+                    space_id=space.id,
+                    parent_id=parent_id,
+                    type=BLOCK_TYPE_TEXT,
+                    title=f"Text {i}",
+                    sort=i,
+                )
+                for i in range(50)
+            ]
+            session.add_all(text_blocks)
+            await session.flush()
+
+            r = await read_blocks_page_from_par_id(
+                session, space.id, parent_id, offset=10, limit=5
+            )
+            assert r.ok()
+            blocks, total = r.data
+            assert total == 50
+            assert [b.id for b in blocks] == [b.id for b in text_blocks[10:15]]
+
+            # Last partial page
+            r = await read_blocks_page_from_par_id(
+                session, space.id, parent_id, offset=48, limit=5
+            )
+            assert r.ok()
+            blocks, total = r.data
+            assert total == 50
+            assert [b.id for b in blocks] == [b.id for b in text_blocks[48:]]
+
+            # Past the end still reports the total
+            r = await read_blocks_page_from_par_id(
+                session, space.id, parent_id, offset=100, limit=5
+            )
+            assert r.ok()
+            assert r.data == ([], 50)
+
+            await session.delete(project)
@@ -0,0 +1,115 @@
+"""
+Round-trip benchmark for listing paths of a large space.
+
+Builds a space with ~10k folder/page blocks and checks that `list_paths_under_block`
+resolves the whole tree in a single statement, where the per-folder recursion used
+to issue two statements (folder type check + children) for every listed folder.
+"""
+
+import time
+import uuid
+import pytest
+from sqlalchemy import event, insert, delete
+from acontext_core.schema.orm import Block, Project, Space
+from acontext_core.schema.orm.block import BLOCK_TYPE_FOLDER, BLOCK_TYPE_PAGE
+from acontext_core.infra.db import DatabaseClient
+from acontext_core.service.data.block_nav import list_paths_under_block
+
+TOP_FOLDERS = 10
+SUB_FOLDERS = 10
+PAGES_PER_SUB_FOLDER = 99  # 10 + 100 + 9900 = 10010 blocks
+# generous bound, leaves room for a slow shared CI database
+MAX_LIST_SECONDS = 2.0
+
+
+def _block_rows(space_id: uuid.UUID) -> list[dict]:
+    rows = []
+    for i in range(TOP_FOLDERS):
+        top_id = uuid.uuid4()
+        rows.append(
+            dict(
+                id=top_id,
+                space_id=space_id,
+                type=BLOCK_TYPE_FOLDER,
+                parent_id=None,
+                title=f"folder_{i}",
+                props={},
+                sort=i,
+            )
+        )
+        for j in range(SUB_FOLDERS):
+            sub_id = uuid.uuid4()
+            rows.append(
+                dict(
+                    id=sub_id,
+                    space_id=space_id,
+                    type=BLOCK_TYPE_FOLDER,
+                    parent_id=top_id,
+                    title=f"sub_{j}",
+                    props={},
+                    sort=j,
+                )
+            )
+            for k in range(PAGES_PER_SUB_FOLDER):
+                rows.append(
+                    dict(
+                        id=uuid.uuid4(),
+                        space_id=space_id,
+                        type=BLOCK_TYPE_PAGE,
+                        parent_id=sub_id,
+                        title=f"page_{k}",
+                        props={},
+                        sort=k,
+                    )
+                )
+    return rows
+
+
+class TestBlockNavBenchmark:
+    @pytest.mark.asyncio
+    async def test_list_paths_round_trips_on_10k_blocks(self):
+        db_client = DatabaseClient()
+        await db_client.create_tables()
+
+        async with db_client.get_session_context() as session:
+            project = Project(
+                secret_key_hmac="bench_key_hmac", secret_key_hash_phc="bench_key_hash"
+            )
+            session.add(project)
+            await session.flush()
+            space = Space(project_id=project.id)
+            session.add(space)
+            await session.flush()
+
+            rows = _block_rows(space.id)
+            await session.execute(insert(Block), rows)
+            await session.flush()
+
+            statements = []
+
+            def count_statement(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            engine = db_client.engine.sync_engine
+            event.listen(engine, "before_cursor_execute", count_statement)
+            try:
+                start = time.perf_counter()
+                r = await list_paths_under_block(session, space.id, None, "", depth=2)
+                elapsed = time.perf_counter() - start
+            finally:
+                event.remove(engine, "before_cursor_execute", count_statement)
+
+            assert r.ok()
+            paths, sub_page_num, sub_folder_num = r.data
+            assert len(paths) == len(rows)
+            assert sub_folder_num == TOP_FOLDERS
+            assert sub_page_num == 0
+            assert paths["folder_0/sub_0/"].sub_page_num == PAGES_PER_SUB_FOLDER
+
+            # The recursive version took 1 + 2 * (folders) = 221 round trips
+            assert len(statements) == 1
+            assert elapsed < MAX_LIST_SECONDS
+
+            await session.execute(delete(Block).where(Block.space_id == space.id))
+            await session.delete(space)
+            await session.delete(project)
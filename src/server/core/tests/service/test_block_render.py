@@ -17,6 +17,7 @@ from acontext_core.service.data.block_render import (
     render_sop_block,
     render_text_block,
     render_content_block,
+    render_content_blocks,
 )
 
 
@@ -485,3 +486,77 @@ class TestRenderContentBlock:
             assert "not supported to render" in result.error.errmsg
 
             await session.delete(project)
+
+    @pytest.mark.asyncio
+    async def test_render_content_blocks_batch(self):
+        """Test rendering mixed blocks in one batch keeps input order"""
+        db_client = DatabaseClient()
+        await db_client.create_tables()
+
+        async with db_client.get_session_context() as session:
+            project = Project(
+                secret_key_hmac="test_key_hmac", secret_key_hash_phc="test_key_hash"
+            )
+            session.add(project)
+            await session.flush()
+
+            space = Space(project_id=project.id)
+            session.add(space)
+            await session.flush()
+
+            r = await create_new_path_block(session, space.id, "Parent Page")
+            assert r.ok()
+            parent_id = r.data.id
+
+            text_block = Block(
+                space_id=space.id,
+                parent_id=parent_id,
+                type=BLOCK_TYPE_TEXT,
+                title="Text",
+                sort=0,
+                props={"notes": "some notes"},
+            )
+            sop_blocks = [
+                Block(
+                    space_id=space.id,
+                    parent_id=parent_id,
+                    type=BLOCK_TYPE_SOP,
+                    title=f"SOP {i}",
+                    sort=i + 1,
+                    props={"preferences": f"pref {i}"},
+                )
+                for i in range(2)
+            ]
+            session.add_all([text_block, *sop_blocks])
+            await session.flush()
+
+            tool_ref = ToolReference(name="batch_tool", project_id=project.id)
+            session.add(tool_ref)
+            await session.flush()
+            session.add_all(
+                [
+                    ToolSOP(
+                        sop_block_id=sop_blocks[0].id,
+                        tool_reference_id=tool_ref.id,
+                        order=order,
+                        action=f"step {order}",
+                    )
+                    for order in (1, 0)
+                ]
+            )
+            await session.flush()
+
+            blocks = [sop_blocks[1], text_block, sop_blocks[0]]
+            result = await render_content_blocks(session, space.id, blocks)
+            assert result.ok()
+
+            rendered = result.data
+            assert [b.block_id for b in rendered] == [b.id for b in blocks]
+            assert rendered[0].props["tool_sops"] == []
+            assert rendered[1].props["notes"] == "some notes"
+            assert [s["action"] for s in rendered[2].props["tool_sops"]] == [
+                "step 0",
+                "step 1",
+            ]
+
+            await session.delete(project)
@@ -1,8 +1,15 @@
+import uuid
+from types import SimpleNamespace
 import pytest
 from acontext_core.schema.orm import Block, BlockEmbedding, Project, Space
 from acontext_core.schema.orm.block import BLOCK_TYPE_PAGE, BLOCK_TYPE_FOLDER
 from acontext_core.infra.db import DatabaseClient
-from acontext_core.service.data.block_search import search_path_blocks
+from acontext_core.service.data.block_search import (
+    search_path_blocks,
+    rrf_fuse,
+    group_batch_hits,
+    _needs_more_candidates,
+)
 
 
 class TestBlockSearch:
@@ -158,3 +165,38 @@ class TestBlockSearch:
             # Cleanup - delete the project (cascades to space, blocks, embeddings)
             await session.delete(project)
             await session.commit()
+
+
+def test_rrf_fuse():
+    """Test blocks ranked well by both searches come first"""
+    a, b, c, d = "a", "b", "c", "d"
+    assert rrf_fuse([[a, b, c], [c, d]], k=60) == [c, a, b, d]
+    # ties keep the order of the vector ranking
+    assert rrf_fuse([[a], [b]], k=60) == [a, b]
+    assert rrf_fuse([[], []], k=60) == []
+
+
+def test_group_batch_hits():
+    """Test batch rows are split per query, capped at topk and deduped by best query"""
+    a, b, c = (SimpleNamespace(id=uuid.uuid4()) for _ in range(3))
+    rows = [(a, 0, 0.1), (b, 0, 0.3), (c, 0, 0.4), (b, 1, 0.2), (a, 1, 0.5)]
+
+    assert group_batch_hits(rows, 3, topk=2) == [
+        [(a, 0.1), (b, 0.3)],
+        [(b, 0.2), (a, 0.5)],
+        [],
+    ]
+    assert group_batch_hits(rows, 2, topk=2, dedupe=True) == [
+        [(a, 0.1)],
+        [(b, 0.2)],
+    ]
+
+
+def test_needs_more_candidates():
+    # short top-k, full scan, last candidate within the threshold
+    assert _needs_more_candidates(3, 20, 0.5, 20, 5, 0.8)
+    assert not _needs_more_candidates(5, 20, 0.5, 20, 5, 0.8)
+    # the scan ran out of embedding rows
+    assert not _needs_more_candidates(3, 12, 0.5, 20, 5, 0.8)
+    # farther candidates can't be within the threshold
+    assert not _needs_more_candidates(3, 20, 0.9, 20, 5, 0.8)
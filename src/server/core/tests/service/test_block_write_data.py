@@ -1,6 +1,8 @@
 import pytest
 import uuid
-from sqlalchemy import select, func
+import numpy as np
+from unittest.mock import patch
+from sqlalchemy import select, func, insert, event
 from sqlalchemy.ext.asyncio import AsyncSession
 from acontext_core.schema.orm import (
     Block,
@@ -18,16 +20,31 @@ from acontext_core.schema.orm.block import (
     BLOCK_TYPE_PAGE,
     BLOCK_TYPE_SOP,
 )
-from acontext_core.infra.db import DatabaseClient
+from acontext_core.env import DEFAULT_CORE_CONFIG
+from acontext_core.infra.db import DatabaseClient, POST_COMMIT_HOOKS
 from acontext_core.service.data.block import (
     create_new_path_block,
+    fetch_pending_embedding_blocks,
+    write_pending_block_embeddings,
     _find_block_sort,
     move_path_block_to_new_parent,
     delete_block_recursively,
+    SORT_GAP,
 )
+from acontext_core.service.data.block_nav import get_block_by_index
 from acontext_core.service.data.block_write import write_sop_block_to_parent
 
 
+async def _children_ids(session, space_id, parent_id):
+    query = (
+        select(Block.id)
+        .where(Block.space_id == space_id, Block.parent_id == parent_id)
+        .order_by(Block.sort)
+    )
+    result = await session.execute(query)
+    return list(result.scalars().all())
+
+
 class TestPageBlock:
     @pytest.mark.asyncio
     async def test_create_new_page_success(self, mock_block_get_embedding):
@@ -62,11 +79,62 @@ class TestPageBlock:
                 assert page is not None
                 assert page.title == f"Test_Page_{i}"
                 assert page.type == BLOCK_TYPE_PAGE
-                assert page.sort == i
+                assert page.sort == (i + 1) * SORT_GAP
                 assert page.parent_id is None
 
             await session.delete(project)
 
+    @pytest.mark.asyncio
+    async def test_create_page_with_deferred_embedding(self, mock_block_get_embedding):
+        """Test a deferred page is committed pending and embedded in bulk later"""
+        db_client = DatabaseClient()
+        await db_client.create_tables()
+
+        async with db_client.get_session_context() as session:
+            project = Project(
+                secret_key_hmac="test_key_hmac", secret_key_hash_phc="test_key_hash"
+            )
+            session.add(project)
+            await session.flush()
+
+            space = Space(project_id=project.id)
+            session.add(space)
+            await session.flush()
+
+            with patch.object(DEFAULT_CORE_CONFIG, "block_embedding_deferred", True):
+                page_ids = []
+                for i in range(2):
+                    r = await create_new_path_block(session, space.id, f"Deferred_{i}")
+                    assert r.ok(), f"Failed to create new page: {r.error}"
+                    assert r.data.embedding_pending
+                    page_ids.append(r.data.id)
+            assert mock_block_get_embedding.await_count == 0
+            # one queued publish per block once committed
+            assert len(session.info[POST_COMMIT_HOOKS]) == 2
+
+            r = await fetch_pending_embedding_blocks(session, page_ids)
+            assert r.ok()
+            blocks = r.data
+            embeddings = np.random.rand(
+                len(blocks), DEFAULT_CORE_CONFIG.block_embedding_dim
+            ).astype(np.float32)
+            r = await write_pending_block_embeddings(session, blocks, embeddings)
+            assert r.ok()
+            assert set(r.data) == set(page_ids)
+
+            # a redelivered message doesn't embed twice
+            r = await write_pending_block_embeddings(session, blocks, embeddings)
+            assert r.ok()
+            assert r.data == []
+
+            query = select(func.count()).where(BlockEmbedding.block_id.in_(page_ids))
+            assert (await session.execute(query)).scalar() == 2
+            r = await fetch_pending_embedding_blocks(session, page_ids)
+            assert r.data == []
+
+            session.info.pop(POST_COMMIT_HOOKS, None)
+            await session.delete(project)
+
     @pytest.mark.asyncio
     async def test_create_new_page_with_props(self):
         """Test creating a new page block with custom props"""
@@ -133,7 +201,7 @@ class TestPageBlock:
             for i, child_id in enumerate(child_ids):
                 child = await session.get(Block, child_id)
                 assert child.parent_id == parent_id
-                assert child.sort == i
+                assert child.sort == (i + 1) * SORT_GAP
 
             await session.delete(project)
 
@@ -359,7 +427,7 @@ class TestSOPBlock:
             for i, sop_id in enumerate(sop_ids):
                 sop = await session.get(Block, sop_id)
                 assert sop is not None
-                assert sop.sort == i
+                assert sop.sort == (i + 1) * SORT_GAP
 
             await session.delete(project)
 
@@ -486,7 +554,7 @@ class TestSOPBlock:
             assert r.ok()
             parent_id = r.data.id
 
-            # Create 3 existing SOP blocks (sort: 0, 1, 2)
+            # Create 3 existing SOP blocks
             sop_ids = []
             for i in range(3):
                 sop_data = SOPData(
@@ -504,10 +572,10 @@ class TestSOPBlock:
             for i, sop_id in enumerate(sop_ids):
                 sop = await session.get(Block, sop_id)
                 assert sop is not None
-                assert sop.sort == i
+                assert sop.sort == (i + 1) * SORT_GAP
                 assert sop.title == f"SOP {i}"
 
-            # Insert new SOP at position 2 (after block with sort=1, which means after_block_index=2)
+            # Insert new SOP at position 2 (after the second block, which means after_block_index=2)
             new_sop_data = SOPData(
                 use_when="Inserted SOP",
                 preferences="Inserted preference",
@@ -520,24 +588,21 @@ class TestSOPBlock:
             new_sop_id = r.data
 
             # Verify the new SOP is at position 2
-            new_sop = await session.get(Block, new_sop_id)
-            assert new_sop is not None
-            assert new_sop.sort == 2
-            assert new_sop.title == "Inserted SOP"
-
-            # Verify existing blocks: 0 and 1 should remain unchanged
-            sop_0 = await session.get(Block, sop_ids[0])
-            assert sop_0.sort == 0
-            assert sop_0.title == "SOP 0"
-
-            sop_1 = await session.get(Block, sop_ids[1])
-            assert sop_1.sort == 1
-            assert sop_1.title == "SOP 1"
+            r = await get_block_by_index(session, space.id, parent_id, 2)
+            assert r.ok()
+            assert r.data.id == new_sop_id
+            assert r.data.title == "Inserted SOP"
 
-            # Verify block at position 2 was shifted to position 3
-            sop_2 = await session.get(Block, sop_ids[2])
-            assert sop_2.sort == 3
-            assert sop_2.title == "SOP 2"
+            # Verify existing blocks keep their sorts, SOP 2 is now at position 3
+            for i, sop_id in enumerate(sop_ids):
+                sop = await session.get(Block, sop_id)
+                assert sop.sort == (i + 1) * SORT_GAP
+            assert await _children_ids(session, space.id, parent_id) == [
+                sop_ids[0],
+                sop_ids[1],
+                new_sop_id,
+                sop_ids[2],
+            ]
 
             # Verify all 4 SOPs exist under parent
             query = select(func.count()).where(Block.parent_id == parent_id)
@@ -547,6 +612,92 @@ class TestSOPBlock:
 
             await session.delete(project)
 
+    @pytest.mark.asyncio
+    async def test_write_sop_after_block_index_rebalances(self):
+        """Test inserting into sorts without a gap rebalances the children once"""
+        db_client = DatabaseClient()
+        await db_client.create_tables()
+
+        async with db_client.get_session_context() as session:
+            project = Project(
+                secret_key_hmac="test_key_hmac", secret_key_hash_phc="test_key_hash"
+            )
+            session.add(project)
+            await session.flush()
+
+            space = Space(project_id=project.id)
+            session.add(space)
+            await session.flush()
+
+            r = await create_new_path_block(session, space.id, "Parent Page")
+            assert r.ok()
+            parent_id = r.data.id
+
+            # Dense sorts, as written by the API server
+            dense_blocks = [
+                Block(
+                    space_id=space.id,
+                    parent_id=parent_id,
+                    type=BLOCK_TYPE_SOP,
+                    title=f"Dense {i}",
+                    props={"preferences": ""},
+                    sort=i,
+                )
+                for i in range(3)
+            ]
+            session.add_all(dense_blocks)
+            await session.flush()
+
+            r = await write_sop_block_to_parent(
+                session,
+                space.id,
+                parent_id,
+                SOPData(use_when="Middle", preferences="p", tool_sops=[]),
+                after_block_index=1,
+            )
+            assert r.ok()
+            middle_id = r.data
+            children = await _children_ids(session, space.id, parent_id)
+            assert children == [
+                dense_blocks[0].id,
+                middle_id,
+                dense_blocks[1].id,
+                dense_blocks[2].id,
+            ]
+
+            # Keep inserting at the head until the gap runs out again
+            head_ids = []
+            for i in range(20):
+                r = await write_sop_block_to_parent(
+                    session,
+                    space.id,
+                    parent_id,
+                    SOPData(use_when=f"Head {i}", preferences="p", tool_sops=[]),
+                    after_block_index=0,
+                )
+                assert r.ok()
+                head_ids.append(r.data)
+
+            children = await _children_ids(session, space.id, parent_id)
+            assert children[:20] == head_ids[::-1]
+            assert children[20:] == [
+                dense_blocks[0].id,
+                middle_id,
+                dense_blocks[1].id,
+                dense_blocks[2].id,
+            ]
+
+            r = await write_sop_block_to_parent(
+                session,
+                space.id,
+                parent_id,
+                SOPData(use_when="Too far", preferences="p", tool_sops=[]),
+                after_block_index=len(children) + 1,
+            )
+            assert not r.ok()
+
+            await session.delete(project)
+
 
 class TestFindBlockSort:
     @pytest.mark.asyncio
@@ -566,22 +717,22 @@ class TestFindBlockSort:
             session.add(space)
             await session.flush()
 
-            # First call should return 0
+            # First call should return SORT_GAP
             r = await _find_block_sort(
                 session, space.id, None, block_type=BLOCK_TYPE_PAGE
             )
             assert r.ok()
-            assert r.unpack()[0] == 0
+            assert r.unpack()[0] == SORT_GAP
 
             # Create a page
             await create_new_path_block(session, space.id, "Page 1")
 
-            # Second call should return 1
+            # Second call should return 2 * SORT_GAP
             r = await _find_block_sort(
                 session, space.id, None, block_type=BLOCK_TYPE_PAGE
             )
             assert r.ok()
-            assert r.unpack()[0] == 1
+            assert r.unpack()[0] == 2 * SORT_GAP
 
             await session.delete(project)
 
@@ -608,10 +759,10 @@ class TestFindBlockSort:
             )
             parent_id = r.data.id
 
-            # First child should get sort 0
+            # First child should get sort SORT_GAP
             r = await _find_block_sort(session, space.id, parent_id, BLOCK_TYPE_PAGE)
             assert r.ok()
-            assert r.unpack()[0] == 0
+            assert r.unpack()[0] == SORT_GAP
 
             # Create a child
             await create_new_path_block(
@@ -622,10 +773,10 @@ class TestFindBlockSort:
                 type=BLOCK_TYPE_PAGE,
             )
 
-            # Second child should get sort 1
+            # Second child should get sort 2 * SORT_GAP
             r = await _find_block_sort(session, space.id, parent_id, BLOCK_TYPE_PAGE)
             assert r.ok()
-            assert r.unpack()[0] == 1
+            assert r.unpack()[0] == 2 * SORT_GAP
 
             await session.delete(project)
 
@@ -691,7 +842,7 @@ class TestFolderBlock:
                 assert folder is not None
                 assert folder.title == f"Test_Folder_{i}"
                 assert folder.type == BLOCK_TYPE_FOLDER
-                assert folder.sort == i
+                assert folder.sort == (i + 1) * SORT_GAP
                 assert folder.parent_id is None
 
             await session.delete(project)
@@ -738,7 +889,7 @@ class TestFolderBlock:
                 child = await session.get(Block, child_id)
                 assert child.parent_id == parent_id
                 assert child.type == BLOCK_TYPE_FOLDER
-                assert child.sort == i
+                assert child.sort == (i + 1) * SORT_GAP
 
             await session.delete(project)
 
@@ -1119,7 +1270,7 @@ class TestBlockParentChildRelationships:
             for i, text_id in enumerate(text_ids):
                 text_block = await session.get(Block, text_id)
                 assert text_block is not None
-                assert text_block.sort == i
+                assert text_block.sort == (i + 1) * SORT_GAP
                 assert text_block.parent_id == page_id
 
             await session.delete(project)
@@ -1175,11 +1326,11 @@ class TestBlockParentChildRelationships:
             # Verify both children exist with proper sort
             text_block = await session.get(Block, text_id)
             assert text_block.parent_id == page_id
-            assert text_block.sort == 0
+            assert text_block.sort == SORT_GAP
 
             sop_block = await session.get(Block, sop_id)
             assert sop_block.parent_id == page_id
-            assert sop_block.sort == 1
+            assert sop_block.sort == 2 * SORT_GAP
 
             await session.delete(project)
 
@@ -1697,13 +1848,13 @@ class TestMovePathBlock:
                 session, space.id, "Page 0", type=BLOCK_TYPE_PAGE
             )
             assert r.ok()
-            page_id = r.data.id  # sort=0
+            page_id = r.data.id
             # Create a target folder
             r = await create_new_path_block(
                 session, space.id, "TargetFolder", type=BLOCK_TYPE_FOLDER
             )
             assert r.ok()
-            target_folder_id = r.data.id  # sort=1
+            target_folder_id = r.data.id
 
             # Create multiple pages
             for i in range(3):
@@ -1726,13 +1877,13 @@ class TestMovePathBlock:
             # Verify all pages are now in TargetFolder
             assert page.title == "Page_0"
             assert page.parent_id == target_folder_id
-            assert page.sort == 3
+            assert page.sort == 4 * SORT_GAP
 
             await session.delete(project)
 
     @pytest.mark.asyncio
-    async def test_move_page_updates_original_parent_children_sort(self):
-        """Test that moving a page updates the sort order of remaining children in the original parent"""
+    async def test_move_page_keeps_original_parent_children_sort(self):
+        """Test that moving a page keeps the order of remaining children in the original parent"""
         db_client = DatabaseClient()
         await db_client.create_tables()
 
@@ -1754,7 +1905,7 @@ class TestMovePathBlock:
             assert r.ok()
             source_folder_id = r.data.id
 
-            # Create 4 pages in SourceFolder (sort: 0, 1, 2, 3)
+            # Create 4 pages in SourceFolder
             page_ids = []
             for i in range(4):
                 r = await create_new_path_block(
@@ -1770,7 +1921,7 @@ class TestMovePathBlock:
             # Verify initial sort order
             for i, page_id in enumerate(page_ids):
                 page = await session.get(Block, page_id)
-                assert page.sort == i, f"Page{i} should have sort={i}"
+                assert page.sort == (i + 1) * SORT_GAP
                 assert page.parent_id == source_folder_id
 
             # Create target folder
@@ -1780,34 +1931,27 @@ class TestMovePathBlock:
             assert r.ok()
             target_folder_id = r.data.id
 
-            # Move Page1 (sort=1) to TargetFolder
+            # Move Page1 to TargetFolder
             r = await move_path_block_to_new_parent(
                 session, space.id, page_ids[1], target_folder_id
             )
             assert r.ok()
 
-            # Verify moved page is now in TargetFolder with sort=0
+            # Verify moved page is now the first child of TargetFolder
             moved_page = await session.get(Block, page_ids[1])
             assert moved_page.parent_id == target_folder_id
             assert (
-                moved_page.sort == 0
+                moved_page.sort == SORT_GAP
             ), "Moved page should be first child in target folder"
 
-            # Verify remaining children in SourceFolder have updated sort values
-            # Page0 (originally sort=0) should remain at sort=0
-            page0 = await session.get(Block, page_ids[0])
-            assert page0.parent_id == source_folder_id
-            assert page0.sort == 0, "Page0 should remain at sort=0"
-
-            # Page2 (originally sort=2) should now be at sort=1
-            page2 = await session.get(Block, page_ids[2])
-            assert page2.parent_id == source_folder_id
-            assert page2.sort == 1, "Page2 should be decremented to sort=1"
-
-            # Page3 (originally sort=3) should now be at sort=2
-            page3 = await session.get(Block, page_ids[3])
-            assert page3.parent_id == source_folder_id
-            assert page3.sort == 2, "Page3 should be decremented to sort=2"
+            # Verify remaining children in SourceFolder keep their sorts and order
+            for i in (0, 2, 3):
+                page = await session.get(Block, page_ids[i])
+                assert page.parent_id == source_folder_id
+                assert page.sort == (i + 1) * SORT_GAP, f"Page{i} should keep its sort"
+            r = await get_block_by_index(session, space.id, source_folder_id, 1)
+            assert r.ok()
+            assert r.data.id == page_ids[2], "Page2 should now be at position 1"
 
             # Verify there are exactly 3 children left in SourceFolder
             query = select(func.count()).where(Block.parent_id == source_folder_id)
@@ -1867,11 +2011,12 @@ class TestDeleteBlock:
             # Verify other pages still exist
             page0 = await session.get(Block, page0_id)
             assert page0 is not None
-            assert page0.sort == 0
+            assert page0.sort == SORT_GAP
 
             page2 = await session.get(Block, page2_id)
             assert page2 is not None
-            assert page2.sort == 1  # Should be decremented from 2 to 1
+            assert page2.sort == 3 * SORT_GAP  # Siblings are not renumbered
+            assert await _children_ids(session, space.id, None) == [page0_id, page2_id]
 
             await session.delete(project)
 
@@ -2080,6 +2225,83 @@ class TestDeleteBlock:
 
             await session.delete(project)
 
+    @pytest.mark.asyncio
+    async def test_delete_large_subtree_in_one_statement(self):
+        """Test a subtree is removed by a single statement, cascading embeddings"""
+        db_client = DatabaseClient()
+        await db_client.create_tables()
+
+        async with db_client.get_session_context() as session:
+            project = Project(
+                secret_key_hmac="test_key_hmac", secret_key_hash_phc="test_key_hash"
+            )
+            session.add(project)
+            await session.flush()
+
+            space = Space(project_id=project.id)
+            session.add(space)
+            await session.flush()
+
+            r = await create_new_path_block(
+                session, space.id, "Root", type=BLOCK_TYPE_FOLDER
+            )
+            assert r.ok()
+            root_id = r.data.id
+            r = await create_new_path_block(session, space.id, "Sibling")
+            assert r.ok()
+            sibling_id = r.data.id
+
+            rows = []
+            for i in range(20):
+                folder_id = uuid.uuid4()
+                rows.append(
+                    dict(
+                        id=folder_id,
+                        space_id=space.id,
+                        type=BLOCK_TYPE_FOLDER,
+                        parent_id=root_id,
+                        title=f"folder_{i}",
+                        props={},
+                        sort=i,
+                    )
+                )
+                for j in range(50):
+                    rows.append(
+                        dict(
+                            id=uuid.uuid4(),
+                            space_id=space.id,
+                            type=BLOCK_TYPE_PAGE,
+                            parent_id=folder_id,
+                            title=f"page_{j}",
+                            props={},
+                            sort=j,
+                        )
+                    )
+            await session.execute(insert(Block), rows)
+            await session.flush()
+
+            statements = []
+
+            def count_statement(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            engine = db_client.engine.sync_engine
+            event.listen(engine, "before_cursor_execute", count_statement)
+            try:
+                r = await delete_block_recursively(session, space.id, root_id)
+            finally:
+                event.remove(engine, "before_cursor_execute", count_statement)
+            assert r.ok()
+            assert len(statements) == 1
+
+            query = select(func.count()).where(Block.space_id == space.id)
+            assert (await session.execute(query)).scalar() == 1
+            query = select(func.count()).where(BlockEmbedding.block_id == root_id)
+            assert (await session.execute(query)).scalar() == 0
+            assert await session.get(Block, sibling_id) is not None
+
+            await session.delete(project)
+
     @pytest.mark.asyncio
     async def test_delete_block_not_found(self):
         """Test deleting a non-existent block"""
@@ -2145,7 +2367,7 @@ class TestDeleteBlock:
 
     @pytest.mark.asyncio
     async def test_delete_block_sort_order_adjustment(self):
-        """Test that sort order is correctly adjusted after deletion"""
+        """Test that the order of siblings is kept after deletion"""
         db_client = DatabaseClient()
         await db_client.create_tables()
 
@@ -2179,26 +2401,19 @@ class TestDeleteBlock:
             # Verify initial sort order
             for i, page_id in enumerate(page_ids):
                 page = await session.get(Block, page_id)
-                assert page.sort == i
+                assert page.sort == (i + 1) * SORT_GAP
 
-            # Delete Page_2 (sort=2)
+            # Delete Page_2
             r = await delete_block_recursively(session, space.id, page_ids[2])
             assert r.ok()
 
-            # Verify sort order is adjusted
-            page0 = await session.get(Block, page_ids[0])
-            assert page0.sort == 0
-
-            page1 = await session.get(Block, page_ids[1])
-            assert page1.sort == 1
-
-            # page_ids[2] is deleted
-
-            page3 = await session.get(Block, page_ids[3])
-            assert page3.sort == 2  # Decremented from 3
-
-            page4 = await session.get(Block, page_ids[4])
-            assert page4.sort == 3  # Decremented from 4
+            # Verify the remaining pages are shifted by position only
+            remaining = [page_ids[0], page_ids[1], page_ids[3], page_ids[4]]
+            assert await _children_ids(session, space.id, folder_id) == remaining
+            for i, page_id in enumerate(remaining):
+                r = await get_block_by_index(session, space.id, folder_id, i)
+                assert r.ok()
+                assert r.data.id == page_id
 
             await session.delete(project)
 
@@ -2232,13 +2447,10 @@ class TestDeleteBlock:
                 assert r.ok()
 
             # Verify only pages 0 and 2 remain
-            page0 = await session.get(Block, page_ids[0])
-            assert page0 is not None
-            assert page0.sort == 0
-
-            page2 = await session.get(Block, page_ids[2])
-            assert page2 is not None
-            assert page2.sort == 1
+            assert await _children_ids(session, space.id, None) == [
+                page_ids[0],
+                page_ids[2],
+            ]
 
             # Verify deleted pages
             for idx in [1, 3, 4]:
@@ -0,0 +1,54 @@
+import uuid
+import pytest
+from unittest.mock import patch
+from acontext_core.schema.api.response import SearchResultBlockItem
+from acontext_core.service.data import search_cache as SC
+
+
+def test_search_cache_key():
+    space_id = uuid.uuid4()
+    params = {"limit": 10, "threshold": 0.8}
+    key = SC.search_cache_key(space_id, 1, "semantic_grep", "jwt  token ", params)
+
+    assert key == SC.search_cache_key(
+        space_id, 1, "semantic_grep", " jwt token", dict(reversed(params.items()))
+    )
+    assert key != SC.search_cache_key(space_id, 2, "semantic_grep", "jwt token", params)
+    assert key != SC.search_cache_key(space_id, 1, "semantic_glob", "jwt token", params)
+    assert key != SC.search_cache_key(
+        space_id, 1, "semantic_grep", "jwt token", {**params, "limit": 5}
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_search_follows_space_version():
+    space_id = uuid.uuid4()
+    item = SearchResultBlockItem(
+        block_id=uuid.uuid4(), title="auth", type="text", props={}, distance=0.1
+    )
+    calls = []
+
+    async def search():
+        calls.append(1)
+        return [item]
+
+    version = {"value": 1}
+
+    async def get_space_version(_):
+        return version["value"]
+
+    with patch.object(SC, "get_space_version", get_space_version), patch.object(
+        SC.DEFAULT_CORE_CONFIG, "search_result_cache_redis", False
+    ):
+        assert await SC.cached_search(space_id, "semantic_grep", "q", {}, search) == [
+            item
+        ]
+        assert await SC.cached_search(space_id, "semantic_grep", "q", {}, search) == [
+            item
+        ]
+        assert len(calls) == 1
+
+        # a block write bumps the version
+        version["value"] = 2
+        await SC.cached_search(space_id, "semantic_grep", "q", {}, search)
+        assert len(calls) == 2
@@ -0,0 +1,49 @@
+import uuid
+import pytest
+
+from acontext_core.infra.redis import REDIS_CLIENT
+from acontext_core.service.utils import (
+    _notify_keys,
+    observe_session_notify,
+    claim_session_notify,
+)
+
+
+@pytest.mark.asyncio
+async def test_superseded_notify_is_folded_into_latest():
+    session_id = uuid.uuid4()
+    m1, m2, m3 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    # Two consumers observe their notifications before either claims
+    await observe_session_notify("test.notify", session_id, [m1])
+    await observe_session_notify("test.notify", session_id, [m2, m3])
+
+    assert await claim_session_notify("test.notify", session_id, m1) is None
+    assert await claim_session_notify("test.notify", session_id, m3) == {m1, m2, m3}
+
+
+@pytest.mark.asyncio
+async def test_claim_without_pending_notify():
+    session_id = uuid.uuid4()
+    m1 = uuid.uuid4()
+
+    await observe_session_notify("test.notify", session_id, [m1])
+    assert await claim_session_notify("test.notify", session_id, m1) == {m1}
+    # Already claimed: a late duplicate is processed on its own
+    assert await claim_session_notify("test.notify", session_id, m1) == {m1}
+
+
+@pytest.mark.asyncio
+async def test_notify_superseded_at_publish():
+    session_id = uuid.uuid4()
+    m1, m2 = uuid.uuid4(), uuid.uuid4()
+    _, _, published_key = _notify_keys("test.notify", session_id)
+    # The API records m2 when publishing it, before m1 is consumed
+    async with REDIS_CLIENT.get_client_context() as client:
+        await client.set(published_key, str(m2))
+
+    await observe_session_notify("test.notify", session_id, [m1])
+    assert await claim_session_notify("test.notify", session_id, m1) is None
+
+    await observe_session_notify("test.notify", session_id, [m2])
+    assert await claim_session_notify("test.notify", session_id, m2) == {m1, m2}
@@ -0,0 +1,126 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+from acontext_core.schema.orm.block import BLOCK_TYPE_FOLDER, BLOCK_TYPE_PAGE
+from acontext_core.schema.result import Result
+from acontext_core.service.data import space_tree as ST
+from acontext_core.service.data.space_tree import SpaceTree
+
+
+def _row(title, type, parent_id=None, sort=0):
+    return {
+        "id": uuid.uuid4(),
+        "parent_id": parent_id,
+        "title": title,
+        "type": type,
+        "props": {},
+        "sort": sort,
+    }
+
+
+def _build_tree():
+    docs = _row("docs", BLOCK_TYPE_FOLDER, sort=0)
+    readme = _row("readme", BLOCK_TYPE_PAGE, sort=1)
+    api = _row("api", BLOCK_TYPE_FOLDER, docs["id"], sort=0)
+    intro = _row("intro", BLOCK_TYPE_PAGE, docs["id"], sort=1)
+    auth = _row("auth", BLOCK_TYPE_PAGE, api["id"], sort=0)
+    rows = [docs, readme, api, intro, auth]
+    return SpaceTree(uuid.uuid4(), 3, rows), {row["title"]: row for row in rows}
+
+
+def test_find_block():
+    tree, rows = _build_tree()
+
+    assert tree.find_block("/").data is None
+    r = tree.find_block("/docs/api/auth")
+    assert r.ok()
+    assert r.data.id == rows["auth"]["id"]
+
+    r = tree.find_block("/docs/")
+    assert r.ok()
+    assert r.data.sub_page_num == 1
+    assert r.data.sub_folder_num == 1
+
+    assert not tree.find_block("/docs/missing").ok()
+    # pages can't have path children
+    assert not tree.find_block("/readme/docs").ok()
+
+
+def test_find_block_rejects_ambiguous_titles():
+    tree, rows = _build_tree()
+    twin = _row("api", BLOCK_TYPE_FOLDER, rows["docs"]["id"], sort=2)
+    twin_page = _row("auth", BLOCK_TYPE_PAGE, twin["id"], sort=0)
+    other = _row("other", BLOCK_TYPE_PAGE, twin["id"], sort=1)
+    tree = SpaceTree(tree.space_id, 4, tree.rows + [twin, twin_page, other])
+
+    assert not tree.find_block("/docs/api/").ok()
+    assert not tree.find_block("/docs/api/auth").ok()
+    # only one of the twins leads there
+    r = tree.find_block("/docs/api/other")
+    assert r.ok()
+    assert r.data.id == other["id"]
+
+
+def test_find_path_by_id():
+    tree, rows = _build_tree()
+
+    r = tree.find_path_by_id(rows["auth"]["id"])
+    assert r.ok()
+    assert r.data[0] == "/docs/api/auth"
+
+    r = tree.find_path_by_id(rows["api"]["id"])
+    assert r.ok()
+    assert r.data[0] == "/docs/api/"
+    assert r.data[1].sub_page_num == 1
+
+    assert not tree.find_path_by_id(uuid.uuid4()).ok()
+
+
+def test_list_paths():
+    tree, rows = _build_tree()
+
+    r = tree.list_paths(None, "/", depth=0)
+    assert r.ok()
+    paths, sub_page_num, sub_folder_num = r.data
+    assert set(paths) == {"/docs/", "/readme"}
+    assert (sub_page_num, sub_folder_num) == (1, 1)
+
+    r = tree.list_paths(rows["docs"]["id"], "/docs", depth=1)
+    assert r.ok()
+    assert set(r.data[0]) == {"/docs/api/", "/docs/intro", "/docs/api/auth"}
+
+    assert not tree.list_paths(rows["readme"]["id"], "/readme", depth=1).ok()
+
+
+def test_snapshot_round_trip():
+    tree, rows = _build_tree()
+
+    loaded = SpaceTree.loads(tree.space_id, tree.dumps())
+    assert loaded.version == tree.version
+    assert (
+        loaded.find_block("/docs/api/auth").data
+        == tree.find_block("/docs/api/auth").data
+    )
+
+
+@pytest.mark.asyncio
+async def test_changed_session_queries_paths_directly():
+    space_id = uuid.uuid4()
+    session = SimpleNamespace(info={ST.CHANGED_SPACES: {space_id}})
+    queried = []
+
+    async def find_block_by_path(db_session, sid, abs_path):
+        queried.append(abs_path)
+        return Result.resolve(None)
+
+    async def get_space_tree(db_session, sid):
+        raise AssertionError("changed sessions shouldn't load the tree")
+
+    with patch.object(ST.BN, "find_block_by_path", find_block_by_path), patch.object(
+        ST, "get_space_tree", get_space_tree
+    ):
+        r = await ST.find_block(session, space_id, "/docs/")
+
+    assert r.ok()
+    assert queried == ["/docs/"]
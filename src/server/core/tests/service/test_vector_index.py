@@ -0,0 +1,96 @@
+import uuid
+import numpy as np
+from acontext_core.service.data.vector_index import SpaceVectorIndex
+
+
+def _build_index(rows: int = 200, dim: int = 32, hnsw_min_rows: int = 10**9):
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(rows, dim)).astype(np.float32)
+    block_ids = [uuid.uuid4() for _ in range(rows)]
+    block_types = ["page" if i % 2 else "folder" for i in range(rows)]
+    index = SpaceVectorIndex(
+        uuid.uuid4(), 1, block_ids, block_types, embeddings, hnsw_min_rows
+    )
+    return index, embeddings, block_ids, block_types
+
+
+def test_brute_force_matches_exact_cosine():
+    index, embeddings, block_ids, block_types = _build_index()
+    query = embeddings[3] + 0.1
+
+    hits = index.search(query, ["page"], limit=5, threshold=2.0)
+
+    normed = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    distances = 1.0 - normed @ (query / np.linalg.norm(query))
+    expected = [i for i in np.argsort(distances) if block_types[i] == "page"][:5]
+    assert [block_id for block_id, _ in hits] == [block_ids[i] for i in expected]
+    assert hits[0][0] == block_ids[3]
+    assert abs(hits[0][1] - distances[3]) < 1e-5
+
+
+def test_threshold_and_types_filter():
+    index, embeddings, block_ids, _ = _build_index()
+
+    hits = index.search(embeddings[4], ["folder"], limit=10, threshold=1e-4)
+    assert [block_id for block_id, _ in hits] == [block_ids[4]]
+
+    assert index.search(embeddings[4], ["sop"], limit=10, threshold=2.0) == []
+
+
+def test_empty_index():
+    index = SpaceVectorIndex(
+        uuid.uuid4(), 0, [], [], np.zeros((0, 8), dtype=np.float32), 10
+    )
+    assert index.search(np.ones(8), ["page"], limit=5, threshold=2.0) == []
+
+
+def test_blocks_with_several_embeddings_are_returned_once():
+    rng = np.random.default_rng(1)
+    embeddings = rng.normal(size=(6, 16)).astype(np.float32)
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    # a has three embeddings close to the query, they must not crowd out b and c
+    block_ids = [a, a, a, b, c, c]
+    embeddings[1] = embeddings[0] + 0.01
+    embeddings[2] = embeddings[0] + 0.02
+    index = SpaceVectorIndex(
+        uuid.uuid4(), 1, block_ids, ["page"] * 6, embeddings, 10**9
+    )
+
+    hits = index.search(embeddings[0], ["page"], limit=3, threshold=2.0)
+
+    assert sorted(block_id for block_id, _ in hits) == sorted([a, b, c])
+    assert hits[0][0] == a
+    assert abs(hits[0][1]) < 1e-5
+
+
+def test_search_reads_past_blocks_with_many_embeddings():
+    rng = np.random.default_rng(2)
+    embeddings = rng.normal(size=(40, 16)).astype(np.float32)
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    # a owns the 30 rows nearest to the query, more than one over-fetched read
+    block_ids = [a] * 30 + [b] * 5 + [c] * 5
+    embeddings[:30] = embeddings[0] + rng.normal(scale=0.01, size=(30, 16))
+    index = SpaceVectorIndex(
+        uuid.uuid4(), 1, block_ids, ["page"] * 40, embeddings, 10**9
+    )
+
+    hits = index.search(embeddings[0], ["page"], limit=3, threshold=2.0)
+
+    assert [block_id for block_id, _ in hits][0] == a
+    assert sorted(block_id for block_id, _ in hits) == sorted([a, b, c])
+
+
+class _ShortHNSW:
+    def knn_query(self, query, k, filter=None):
+        raise RuntimeError(
+            "Cannot return the results in a contiguous 2D array. "
+            "Probably ef or M is too small"
+        )
+
+
+def test_hnsw_short_walk_falls_back_to_a_scan():
+    index, embeddings, block_ids, _ = _build_index()
+    expected = index.search(embeddings[3], ["page"], limit=5, threshold=2.0)
+
+    index.hnsw = _ShortHNSW()
+    assert index.search(embeddings[3], ["page"], limit=5, threshold=2.0) == expected
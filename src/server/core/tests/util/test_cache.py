@@ -0,0 +1,74 @@
+import hashlib
+import time
+import pytest
+from acontext_core.util.cache import (
+    TTLLRUCache,
+    ByteLRUCache,
+    DiskBlobCache,
+    get_cache_stats,
+)
+
+
+def test_lru_eviction_and_stats():
+    cache = TTLLRUCache("test_lru", max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+    assert cache.stats.evictions == 1
+    assert get_cache_stats()["test_lru"]["size"] == 2
+
+
+def test_ttl_expiration_and_invalidation():
+    cache = TTLLRUCache("test_ttl", max_size=8, ttl_seconds=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+    cache.ttl_seconds = 60
+    cache.set("a", 1)
+    assert cache.invalidate("a")
+    assert not cache.invalidate("a")
+    assert "a" not in cache
+
+
+def test_byte_lru_budget():
+    cache = ByteLRUCache("test_bytes", max_bytes=10)
+    cache.set("a", [1], 4)
+    cache.set("b", [2], 4)
+    cache.set("c", [3], 4)  # evicts "a"
+    assert cache.get("a") is None
+    assert cache.get("b") == [2]
+    assert cache.total_bytes == 8
+
+    cache.set("huge", [4], 11)  # larger than the whole budget, skipped
+    assert cache.get("huge") is None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_blob_cache(tmp_path):
+    cache = DiskBlobCache("test_disk", root_dir=str(tmp_path), max_bytes=10)
+    key_a = hashlib.sha256(b"aaaa").hexdigest()
+    key_b = hashlib.sha256(b"bbbbbb").hexdigest()
+    key_c = hashlib.sha256(b"cccc").hexdigest()
+
+    assert await cache.get(key_a) is None
+    await cache.set(key_a, b"aaaa")
+    await cache.set(key_b, b"bbbbbb")
+    assert await cache.get(key_a) == b"aaaa"
+    await cache.set(key_c, b"cccc")  # evicts "b", "a" was read more recently
+    assert await cache.get(key_b) is None
+    assert cache.total_bytes == 8
+
+    # A new instance picks up blobs left on disk
+    reopened = DiskBlobCache("test_disk_reopen", root_dir=str(tmp_path), max_bytes=10)
+    assert await reopened.get(key_c) == b"cccc"
+    assert reopened.total_bytes == 8